@@ -4,4 +4,6 @@ Currently implemented ciphers and the specification paper used as reference duri
 - FEAL-NX:              https://info.isl.ntt.co.jp/crypt/archive/dl/feal/call-3e.pdf
 - (WIP) Salsa20:        https://cr.yp.to/snuffle/salsafamily-20071225.pdf
 - (WIP) ChaCha20:       https://cr.yp.to/chacha/chacha-20080120.pdf
+- XSalsa20:             https://cr.yp.to/snuffle/xsalsa-20081128.pdf
+- ChaCha20-Poly1305:    https://tools.ietf.org/html/rfc7539
 """
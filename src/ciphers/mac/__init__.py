@@ -0,0 +1 @@
+"""Module for message authentication code implementations."""
@@ -0,0 +1,83 @@
+"""Poly1305 one-time authenticator.
+
+Specification:
+    https://cr.yp.to/mac/poly1305-20050329.pdf
+    https://tools.ietf.org/html/rfc7539#section-2.5 (used as reference for this implementation)
+
+Test vectors:
+    https://tools.ietf.org/html/rfc7539#appendix-A.3
+
+The message is split into 16-byte blocks which are evaluated as polynomial in r modulo the prime 2^130 - 5.
+Python ints serve as 130-bit accumulator; the reduction modulo p is done once per group of blocks.
+"""
+from typing import List
+
+__POLY1305_PRIME__ = 2 ** 130 - 5
+__POLY1305_CLAMP__ = 0x0ffffffc0ffffffc0ffffffc0fffffff
+__POLY1305_BLOCK_SIZE__ = 16
+
+
+class Poly1305:
+    """Incremental Poly1305 authenticator with an interface similar to hashlib.
+
+    With lanes > 1, lanes blocks are accumulated at once with precomputed powers of r:
+        a = ((a + m_1) * r^lanes + m_2 * r^(lanes - 1) + ... + m_lanes * r) mod p
+    which is equal to lanes Horner steps but needs only one reduction modulo p.
+    The key must only be used for one message.
+    """
+
+    def __init__(self, key: bytes, lanes: int = 1):
+        """Split the 32-byte one-time key into r and s.
+
+        Raises error if key is not 32 bytes or lanes is smaller than 1.
+        """
+        if len(key) != 32:
+            raise ValueError("key must be 32 bytes.")
+        if lanes < 1:
+            raise ValueError("lanes must be at least 1.")
+        self._r = int.from_bytes(key[:16], 'little') & __POLY1305_CLAMP__
+        self._s = int.from_bytes(key[16:], 'little')
+        # r^lanes, r^(lanes - 1), ..., r
+        powers: List[int] = [self._r]
+        for _ in range(lanes - 1):
+            powers.append(powers[-1] * self._r % __POLY1305_PRIME__)
+        self._powers = powers[::-1]
+        self._accumulator = 0
+        self._buffer = b''
+
+    def update(self, data: bytes) -> None:
+        """Authenticate the next bytes of the message."""
+        data = self._buffer + data
+        full = len(data) - len(data) % __POLY1305_BLOCK_SIZE__
+        self._buffer = data[full:]
+        blocks = [int.from_bytes(data[i:i + __POLY1305_BLOCK_SIZE__], 'little') | 1 << 128
+                  for i in range(0, full, __POLY1305_BLOCK_SIZE__)]
+        self._accumulate(blocks)
+
+    def _accumulate(self, blocks: List[int]) -> None:
+        """Add the blocks to the polynomial evaluation."""
+        a, r, p, lanes = self._accumulator, self._r, __POLY1305_PRIME__, len(self._powers)
+        grouped = len(blocks) - len(blocks) % lanes
+        for i in range(0, grouped, lanes):
+            a = (a + blocks[i]) * self._powers[0]
+            for m, power in zip(blocks[i + 1:i + lanes], self._powers[1:]):
+                a += m * power
+            a %= p
+        for m in blocks[grouped:]:
+            a = (a + m) * r % p
+        self._accumulator = a
+
+    def digest(self) -> bytes:
+        """Return the 16-byte tag of the message authenticated so far."""
+        a = self._accumulator
+        if self._buffer:
+            # the last partial block is padded with a one byte instead of setting bit 128
+            a = (a + int.from_bytes(self._buffer + b'\x01', 'little')) * self._r % __POLY1305_PRIME__
+        return ((a + self._s) % 2 ** 128).to_bytes(16, 'little')
+
+
+def poly1305(key: bytes, message: bytes, lanes: int = 1) -> bytes:
+    """Return the 16-byte Poly1305 tag of the message with the 32-byte one-time key."""
+    mac = Poly1305(key, lanes)
+    mac.update(message)
+    return mac.digest()
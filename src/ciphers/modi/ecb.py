@@ -10,6 +10,7 @@ from typing import Any
 
 from bitstring import Bits
 
+from util.bitseq import bitseq_join
 from util.wrap import padder_wrapper
 from util.types import CipherFunction
 
@@ -32,7 +33,7 @@ def ecb(cipher_fn: CipherFunction, blocksize: int) -> CipherFunction:
         # crypt each block independently
         out_blocks = [cipher_fn(key, b, *args, **kwargs) for b in in_blocks]
         # concatenate blocks
-        return sum(out_blocks)
+        return bitseq_join(out_blocks)
 
     return _ecb
 
@@ -17,19 +17,134 @@ Description of ChaCha from the specification paper used as a reference for this
     resistance to cryptanalysis, while preserving—and often improving—time per round. ChaCha12 and ChaCha20 are
     analogous modifications of the 12-round and 20-round ciphers Salsa20/12 and Salsa20/20."
     - Daniel J. Bernstein, https://cr.yp.to/chacha/chacha-20080120.pdf
+
+Usage:
+    chacha encrypt [options] KEY PLAINTEXT
+    chacha decrypt [options] KEY CIPHERTEXT
+    chacha encrypt [options] KEY --in=FILE [--out=FILE]
+    chacha decrypt [options] KEY --in=FILE [--out=FILE]
+
+    -v=[djb,ietf]           Version of ChaCha: djb with 64-bit nonce and 64-bit counter or ietf with 96-bit nonce
+                            and 32-bit counter. [default: djb]
+    -r=[8,12,20]            Number of rounds. [default: 20]
+    -x=[utf8,none]          Specifies the encoding of the cipher-/plaintext. [default: none]
+    -j, --jobs=N            Number of worker processes generating the keystream. [default: 1]
+    --in=FILE               Read raw bytes from the file in chunks instead of the text argument. '-' reads stdin.
+    --out=FILE              Write raw bytes (IV first when encrypting) to the file. '-' writes stdout. [default: -]
+
+    KEY                     The key which should be used for en-/decryption.
+    PLAINTEXT               The text to encrypt. Must be a number. Can be a code literal such as 0b1011, 0o71, 0xF32C.
+    CIPHERTEXT              The text to decrypt. Must be a number. Can be a code literal such as 0b1011, 0o71, 0xF32C.
 """
-import random
+import struct
+import sys
+from functools import lru_cache
 from math import ceil
-from time import time
-from typing import Any, Callable, Tuple
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, MutableSequence, Optional, Sequence, Tuple, Union
 
+import numpy as np  # type: ignore
 from bitstring import Bits
+from docopt import docopt  # type: ignore
+
+# make sure that following imports can be resolved when executing this script from cmdline
+sys.path.insert(0, str(Path(__file__).parent / '../..'))
 
-from util.bitseq import bitseq_split, bitseq_add, bitseq, bitseq32, littleendian
-from util.rot import rot_left_bits
+from util.wrap import fhex_output_wrapper, text_input_to_bitseq_wrapper, key_input_to_bitseq_wrapper, key_input_padder
+from util.encode import encode_wrapper, decode_wrapper
+from util.bitseq import bitseq
+from util.open_binary import open_binary
+from util.parallel import KeystreamPool, parallel_keystream
+from util import rng
+from util.rot import rot_left32
+from util.types import CipherFunction
 
 __CHACHA_ROUNDS__ = 20
 __CHACHA_INITIAL_COUNTER__ = 0
+# bytes read per chunk when en-/decrypting streams; a multiple of the 64-byte block size
+__CHACHA_CHUNK_SIZE__ = 2 ** 20
+# blocks computed at once by the vectorized keystream
+__CHACHA_BLOCKS_PER_CHUNK__ = 4096
+# constant words "expand 32-byte k"
+_CONSTANT = struct.unpack('<4I', b'expand 32-byte k')
+
+
+def quarterround_words(x: MutableSequence[int], a: int, b: int, c: int, d: int) -> None:
+    """Calculate the ChaCha quarterround of the words at the given indices of the state in place.
+
+    The state may be a list or an array('I') of 32-bit words.
+    """
+    x[a] = (x[a] + x[b]) & 0xFFFFFFFF
+    x[d] = rot_left32(x[d] ^ x[a], 16)
+    x[c] = (x[c] + x[d]) & 0xFFFFFFFF
+    x[b] = rot_left32(x[b] ^ x[c], 12)
+    x[a] = (x[a] + x[b]) & 0xFFFFFFFF
+    x[d] = rot_left32(x[d] ^ x[a], 8)
+    x[c] = (x[c] + x[d]) & 0xFFFFFFFF
+    x[b] = rot_left32(x[b] ^ x[c], 7)
+
+
+def doubleround_words(x: MutableSequence[int]) -> None:
+    """Calculate a column round followed by a diagonal round of the 16-word state in place."""
+    # column round
+    quarterround_words(x, 0, 4, 8, 12)
+    quarterround_words(x, 1, 5, 9, 13)
+    quarterround_words(x, 2, 6, 10, 14)
+    quarterround_words(x, 3, 7, 11, 15)
+    # diagonal round
+    quarterround_words(x, 0, 5, 10, 15)
+    quarterround_words(x, 1, 6, 11, 12)
+    quarterround_words(x, 2, 7, 8, 13)
+    quarterround_words(x, 3, 4, 9, 14)
+
+
+def chacha_hash_words(x: Sequence[int], rounds: int = __CHACHA_ROUNDS__) -> List[int]:
+    """Calculate the chacha hash of the 16 32-bit words.
+
+    Word variant of chacha_hash: the output words have to be serialized in little-endian to get the 64-byte hash.
+    Raises error if input is not 16 words.
+    """
+    if len(x) != 16:
+        raise ValueError("Input must be 16 words.")
+    z = list(x)
+    for _ in range(int(rounds / 2)):
+        doubleround_words(z)
+    return [(xi + zi) & 0xFFFFFFFF for xi, zi in zip(x, z)]
+
+
+_COLUMNROUND = ((0, 4, 8, 12), (1, 5, 9, 13), (2, 6, 10, 14), (3, 7, 11, 15))
+_DIAGONALROUND = ((0, 5, 10, 15), (1, 6, 11, 12), (2, 7, 8, 13), (3, 4, 9, 14))
+
+
+def _rot_left32_many(x: np.ndarray, i: int) -> np.ndarray:
+    """Bit rotation to the left of an array of 32-bit words."""
+    return (x << np.uint32(i)) | (x >> np.uint32(32 - i))
+
+
+def chacha_hash_many(x: np.ndarray, rounds: int = __CHACHA_ROUNDS__) -> np.ndarray:
+    """Calculate the chacha hash of many 16-word states at once.
+
+    x is a (16, K) uint32 array holding one state per column. The column and diagonal rounds run over all K
+    columns simultaneously.
+    Returns a (16, K) uint32 array.
+    Raises error if x does not have 16 rows.
+    """
+    x = np.asarray(x, dtype=np.uint32)
+    if x.ndim != 2 or x.shape[0] != 16:
+        raise ValueError("Input must be a (16, K) array.")
+    z = x.copy()
+    for _ in range(int(rounds / 2)):
+        for a, b, c, d in _COLUMNROUND + _DIAGONALROUND:
+            z[a] += z[b]
+            z[d] = _rot_left32_many(z[d] ^ z[a], 16)
+            z[c] += z[d]
+            z[b] = _rot_left32_many(z[b] ^ z[c], 12)
+            z[a] += z[b]
+            z[d] = _rot_left32_many(z[d] ^ z[a], 8)
+            z[c] += z[d]
+            z[b] = _rot_left32_many(z[b] ^ z[c], 7)
+    z += x
+    return z
 
 
 def quarterround(y: Bits) -> Bits:
@@ -40,19 +155,9 @@ def quarterround(y: Bits) -> Bits:
     """
     if len(y) != 128:
         raise ValueError("Input must be 64-bit")
-
-    def _quarterround_step(x1, x2, x3, shift):
-        x1 = bitseq_add(x1, x2)
-        x3 ^= x1
-        x3 = rot_left_bits(x3, shift)
-        return x1, x2, x3
-
-    a, b, c, d = bitseq_split(32, y)
-    a, b, d = _quarterround_step(a, b, d, 16)
-    c, d, b = _quarterround_step(c, d, b, 12)
-    a, b, d = _quarterround_step(a, b, d, 8)
-    c, d, b = _quarterround_step(c, d, b, 7)
-    return a + b + c + d
+    z = list(y.unpack('4*uint:32'))
+    quarterround_words(z, 0, 1, 2, 3)
+    return Bits(bytes=struct.pack('>4I', *z))
 
 
 def quarterround_state(state: Bits, i, j, k, l) -> Bits:
@@ -63,31 +168,16 @@ def quarterround_state(state: Bits, i, j, k, l) -> Bits:
     """
     if len(state) != 512:
         raise ValueError("state must be 512-bit.")
-    entry = bitseq_split(32, state)
-    q = quarterround(sum([entry[i], entry[j], entry[k], entry[l]]))
-    entry[i], entry[j], entry[k], entry[l] = bitseq_split(32, q)
-    return sum(entry)
+    x = list(state.unpack('16*uint:32'))
+    quarterround_words(x, i, j, k, l)
+    return Bits(bytes=struct.pack('>16I', *x))
 
 
-def chacha_hash(state_: Bits) -> Bits:
+def chacha_hash(state_: Bits, rounds: int = __CHACHA_ROUNDS__) -> Bits:
     """Calculate the chacha hash value."""
-    # copy old state
-    state = Bits(state_)
-    for i in range(int(__CHACHA_ROUNDS__ / 2)):
-        # column round
-        state = quarterround_state(state, 0, 4, 8, 12)
-        state = quarterround_state(state, 1, 5, 9, 13)
-        state = quarterround_state(state, 2, 6, 10, 14)
-        state = quarterround_state(state, 3, 7, 11, 15)
-        # diagonal round
-        state = quarterround_state(state, 0, 5, 10, 15)
-        state = quarterround_state(state, 1, 6, 11, 12)
-        state = quarterround_state(state, 2, 7, 8, 13)
-        state = quarterround_state(state, 3, 4, 9, 14)
-    original_state_bitseq32 = bitseq_split(32, state_)
-    new_state_bitseq32 = bitseq_split(32, state)
-    state = sum([bitseq_add(xi, zi) for xi, zi in zip(original_state_bitseq32, new_state_bitseq32)])
-    return sum(bitseq_split(32, state, formatter=littleendian))
+    z = chacha_hash_words(state_.unpack('16*uint:32'), rounds)
+    # serialize each word in little-endian
+    return Bits(bytes=struct.pack('<16I', *z))
 
 
 def validate_version(fn: Callable):
@@ -102,6 +192,7 @@ def validate_version(fn: Callable):
 
 
 @validate_version
+@lru_cache(maxsize=None)
 def get_nonce_and_counter_length(version: str) -> Tuple[int, int]:
     """Return the nonce and counter length depending on given ChaCha version."""
     if version == 'djb':
@@ -113,12 +204,45 @@ def get_nonce_and_counter_length(version: str) -> Tuple[int, int]:
     return __CHACHA_NONCE_LENGTH__, __CHACHA_COUNTER_LENGTH__
 
 
+@lru_cache(maxsize=256)
+def _key_setup(k: bytes) -> Tuple[int, ...]:
+    """Return the 16 words of the ChaCha state for the key with counter and nonce words set to zero."""
+    return (*_CONSTANT, *struct.unpack('<8I', k), 0, 0, 0, 0)
+
+
+def state_template(version: str, k: Bits, iv: Bits) -> List[int]:
+    """Return the 16-word ChaCha state for the key and the IV with the block counter set to zero.
+
+    The state is built once per key and IV; per block only the counter words have to be set.
+    Raises error if key is not 256-bit or IV does not have the nonce length of the version.
+    """
+    nonce_length, counter_length = get_nonce_and_counter_length(version)
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    if len(iv) != nonce_length:
+        raise ValueError("IV must be {}-bit".format(nonce_length))
+    x = list(_key_setup(k.bytes))
+    x[12 + counter_length // 32:] = iv.unpack('{}*uintle:32'.format(nonce_length // 32))
+    return x
+
+
+def _set_counter(x: List[int], counter: int, counter_length: int) -> None:
+    """Set the counter words of the state; the low word comes first."""
+    x[12] = counter & 0xFFFFFFFF
+    if counter_length == 64:
+        x[13] = counter >> 32
+
+
 @validate_version
+@lru_cache(maxsize=None)
 def expansion(version: str) -> Callable[[Bits, Bits], Bits]:
-    """Wrapper for ChaCha expansion function to implement the DJB and IETF version of ChaCha."""
+    """Wrapper for ChaCha expansion function to implement the DJB and IETF version of ChaCha.
+
+    The expansion function is built once per version.
+    """
     __CHACHA_20_NONCE_LENGTH__, __CHACHA_20_COUNTER_LENGTH__ = get_nonce_and_counter_length(version)
 
-    def _expansion(k: Bits, n: Bits) -> Bits:
+    def _expansion(k: Bits, n: Bits, rounds: int = __CHACHA_ROUNDS__) -> Bits:
         """Expand the key and the nonce into a 64-byte sequence.
 
         The hash function can be seen as working on following matrix where each entry is 32-bit (a 4-byte word).
@@ -138,30 +262,148 @@ def expansion(version: str) -> Callable[[Bits, Bits], Bits]:
             raise ValueError("n must be {}-bit.".format(
                 __CHACHA_20_NONCE_LENGTH__ + __CHACHA_20_COUNTER_LENGTH__
             ))
-        if len(k) != 256:
-            raise ValueError("key must be 256-bit.")
-        constant = bitseq32(0x65787061, 0x6e642033, 0x322d6279, 0x7465206b)
-        counter, nonce = n[:__CHACHA_20_COUNTER_LENGTH__], n[__CHACHA_20_COUNTER_LENGTH__:]
-        le = littleendian
-        counter = le(counter)
-        state = bitseq32(
-            *bitseq_split(32, constant, formatter=le),
-            *bitseq_split(32, k, formatter=le),
-            *bitseq_split(32, counter, formatter=le), *bitseq_split(32, nonce, formatter=le)
-        )
-        return chacha_hash(state)
+        x = state_template(version, k, n[__CHACHA_20_COUNTER_LENGTH__:])
+        _set_counter(x, n[:__CHACHA_20_COUNTER_LENGTH__].uint, __CHACHA_20_COUNTER_LENGTH__)
+        return Bits(bytes=struct.pack('<16I', *chacha_hash_words(x, rounds)))
 
     return _expansion
 
 
+def chacha_blocks(k: Bits, nonce: Bits, counter_start: int, count: int, rounds: int = __CHACHA_ROUNDS__,
+                  version: str = 'djb') -> bytes:
+    """Return count consecutive keystream blocks starting at the block counter as contiguous bytes.
+
+    All blocks are computed at once as a (16, count) uint32 array.
+    Raises error if key is not 256-bit, nonce does not have the nonce length of the version or a block counter
+    exceeds the counter length of the version.
+    """
+    _, counter_length = get_nonce_and_counter_length(version)
+    if counter_start < 0 or count < 0 or counter_start + count > 2 ** counter_length:
+        raise ValueError("counter must be {}-bit.".format(counter_length))
+    x = np.empty((16, count), dtype=np.uint32)
+    x[:] = np.array(state_template(version, k, nonce), dtype=np.uint32)[:, np.newaxis]
+    counters = np.arange(count, dtype=np.uint64) + np.uint64(counter_start)
+    x[12] = counters.astype(np.uint32)
+    if counter_length == 64:
+        x[13] = (counters >> np.uint64(32)).astype(np.uint32)
+    # serialize block by block, each one as little-endian words
+    return chacha_hash_many(x, rounds).T.astype('<u4').tobytes()
+
+
 def initial_counter() -> int:
     """Return the initial counter value."""
     return __CHACHA_INITIAL_COUNTER__
 
 
+def _chacha_keystream(version: str, k: Bits, iv: Bits, rounds: int, first: int, count: int) -> bytes:
+    """Return the keystream blocks first, ..., first + count - 1 of the ChaCha version as bytes."""
+    return b''.join(chacha_blocks(k, iv, counter, min(__CHACHA_BLOCKS_PER_CHUNK__, first + count - counter), rounds,
+                                  version)
+                    for counter in range(first, first + count, __CHACHA_BLOCKS_PER_CHUNK__))
+
+
+class ChaChaStream:
+    """Lazy, seekable ChaCha keystream for a key and a nonce.
+
+    Byte positions are relative to the first block counter given on construction. Seeking only sets the position,
+    so en-/decrypting a byte range of a large message costs only the blocks touched. The keystream ends when the
+    counter of the version (64-bit for djb, 32-bit for ietf) is exhausted.
+    """
+
+    def __init__(self, key: Bits, nonce: Bits, version: str = 'djb', rounds: int = __CHACHA_ROUNDS__,
+                 counter: int = 0):
+        """Prepare the state for the key and the nonce.
+
+        Any positive even round count is accepted such that reduced-round variants can be studied.
+        Raises error if key is not 256-bit, nonce does not have the nonce length of the version, the round count is
+        not positive and even or the counter does not fit into the counter length of the version.
+        """
+        _, self._counter_length = get_nonce_and_counter_length(version)
+        if rounds <= 0 or rounds % 2 != 0:
+            raise ValueError("round number must be positive and even.")
+        if not 0 <= counter < 2 ** self._counter_length:
+            raise ValueError("counter must be {}-bit.".format(self._counter_length))
+        self._state = state_template(version, key, nonce)
+        self.key, self.nonce, self.version, self.rounds, self.counter = key, nonce, version, rounds, counter
+        self._position = 0
+
+    @property
+    def length(self) -> int:
+        """Return the number of keystream bytes until the counter is exhausted."""
+        return 64 * (2 ** self._counter_length - self.counter)
+
+    def block(self, counter: int) -> bytes:
+        """Return the 64-byte keystream block for the absolute block counter.
+
+        Raises error if counter exceeds the counter length of the version.
+        """
+        if not 0 <= counter < 2 ** self._counter_length:
+            raise ValueError("counter must be {}-bit.".format(self._counter_length))
+        x = self._state.copy()
+        _set_counter(x, counter, self._counter_length)
+        return struct.pack('<16I', *chacha_hash_words(x, self.rounds))
+
+    def seek(self, offset: int) -> None:
+        """Set the keystream position to the byte offset.
+
+        Raises error if offset is negative or beyond the end of the keystream.
+        """
+        if not 0 <= offset <= self.length:
+            raise ValueError("offset must be between 0 and {}.".format(self.length))
+        self._position = offset
+
+    def tell(self) -> int:
+        """Return the current keystream byte position."""
+        return self._position
+
+    def __iter__(self) -> 'ChaChaStream':
+        """Return the stream as iterator over the keystream blocks."""
+        return self
+
+    def __next__(self) -> bytes:
+        """Return the keystream up to the end of the current block and advance past it."""
+        if self._position >= self.length:
+            raise StopIteration
+        counter, skip = divmod(self._position, 64)
+        self._position += 64 - skip
+        return self.block(self.counter + counter)[skip:]
+
+    def read(self, size: int, workers: int = 1, pool: Optional[KeystreamPool] = None) -> bytes:
+        """Return the next size bytes of the keystream and advance the position.
+
+        The keystream of large reads can be generated on several processes by setting workers, which starts the
+        processes for this read only, or by passing a pool whose processes are reused across reads.
+        Raises error if size is negative or the counter would be exhausted.
+        """
+        if size < 0:
+            raise ValueError("size must not be negative.")
+        if self._position + size > self.length:
+            raise ValueError("keystream exhausted: {}-bit counter overflow.".format(self._counter_length))
+        counter, skip = divmod(self._position, 64)
+        first, count = self.counter + counter, ceil((skip + size) / 64)
+        args = (self.version, self.key, self.nonce, self.rounds)
+        if pool is not None:
+            stream = pool.keystream(_chacha_keystream, args, first, count, 64)
+        elif workers > 1:
+            stream = parallel_keystream(_chacha_keystream, args, first, count, 64, workers)
+        else:
+            stream = _chacha_keystream(*args, first, count)
+        self._position += size
+        return stream[skip:skip + size]
+
+    def xcrypt(self, data: bytes, workers: int = 1, pool: Optional[KeystreamPool] = None) -> bytes:
+        """En- or decrypt the bytes at the current position by XOR'ing them with the keystream. See read."""
+        stream = self.read(len(data), workers, pool)
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(stream, 'little')).to_bytes(len(data), 'little')
+
+
 @validate_version
+@lru_cache(maxsize=None)
 def xcrypt(version: str) -> Callable[[Bits, Bits], Bits]:
-    """Wrapper for ChaCha xcrypt function to implement the DJB and IETF version of ChaCha."""
+    """Wrapper for ChaCha xcrypt function to implement the DJB and IETF version of ChaCha.
+
+    The xcrypt function is built once per version.
+    """
     __CHACHA_NONCE_LENGTH__, __CHACHA_COUNTER_LENGTH__ = get_nonce_and_counter_length(version)
 
     def _xcrypt(k: Bits, text: Bits, *args: Any, **kwargs: Any) -> Bits:
@@ -170,11 +412,15 @@ def xcrypt(version: str) -> Callable[[Bits, Bits], Bits]:
         En- and decryption use the same algorithm because the inverse of XOR is XOR thus this function is called 'xcrypt'.
 
         En-/Decryption is done by XOR'ing the plain-/ciphertext with the stream generated by the expansion function.
-        The nonce for the expansion function is dependent on current time thus ensuring that the same nonce
-        will never be used again with the same key.
+        The nonce for the expansion function is drawn from the cryptographically secure generator of util.rng thus
+        ensuring that the same nonce will practically never be used again with the same key.
 
         The nonce for the expansion function should never be reused with the same key!
         Else, this happens: https://crypto.stackexchange.com/a/108/80458
+
+        The number of rounds can be given as keyword argument 'rounds' and defaults to 20.
+        The keystream of large messages can be generated on several processes by giving the keyword argument
+        'workers'.
         """
         if 'iv' not in kwargs:
             raise TypeError("xcrypt needs initialization vector as keyword argument")
@@ -182,20 +428,13 @@ def xcrypt(version: str) -> Callable[[Bits, Bits], Bits]:
         if len(iv) != __CHACHA_NONCE_LENGTH__:
             raise ValueError("IV must be {}-bit".format(__CHACHA_NONCE_LENGTH__))
 
-        def create_nonce(cnt: int) -> Bits:
-            # counter comes first
-            return bitseq(cnt, bit=__CHACHA_COUNTER_LENGTH__) + iv
-
-        stream_blocks_needed = ceil(len(text) / 512)
-        start = initial_counter()
-        end = stream_blocks_needed + start
-        stream = sum([expansion(version)(k, create_nonce(counter)) for counter in range(start, end, 1)])
-        return text ^ stream[:len(text)]
+        stream = ChaChaStream(k, iv, version, kwargs.get('rounds', __CHACHA_ROUNDS__), initial_counter())
+        return text ^ Bits(bytes=stream.read(ceil(len(text) / 8), kwargs.get('workers', 1)), length=len(text))
 
     return _xcrypt
 
 
-def encrypt(k: Bits, text: Bits, version: str = 'djb') -> Bits:
+def encrypt(k: Bits, text: Bits, version: str = 'djb', rounds: int = __CHACHA_ROUNDS__, workers: int = 1) -> Bits:
     """Encrypt the message with the given key with ChaCha.
 
     If version is set to 'djb', use the original implementation of Daniel J. Bernstein with
@@ -203,16 +442,151 @@ def encrypt(k: Bits, text: Bits, version: str = 'djb') -> Bits:
     If version is set to 'ietf', use the IETF implementation of ChaCha which
       uses a 96-bit nonce and a 32-bit counter. See https://tools.ietf.org/html/rfc7539 - this was done because of the
       recommendation in section 3.2 of RFC5116: https://tools.ietf.org/html/rfc5116#section-3.2
-    Make initialization vector dependent of current time to make sure a message is never
-    encrypted again with the same key and IV.
+    Draw the initialization vector from the cryptographically secure generator of util.rng to make sure a
+    message is practically never encrypted again with the same key and IV.
     Raises error if key is not 256-bit.
     """
     if len(k) != 256:
         raise ValueError("key must be 256-bit.")
     if version not in ['djb', 'ietf']:
         raise ValueError("version must be djb or ietf.")
-    __CHACHA_NONCE_LENGTH__, __CHACHA_COUNTER_LENGTH__ = get_nonce_and_counter_length(version)
-    random.seed(time())
-    iv = bitseq(random.randrange(2 ** __CHACHA_NONCE_LENGTH__), bit=__CHACHA_NONCE_LENGTH__)
-    c = xcrypt(version)(k, text, iv=iv)
+    iv = _random_iv(version)
+    c = xcrypt(version)(k, text, iv=iv, rounds=rounds, workers=workers)
     return iv + c
+
+
+def decrypt(k: Bits, text: Bits, version: str = 'djb', rounds: int = __CHACHA_ROUNDS__, workers: int = 1) -> Bits:
+    """Decrypt the message with the given key with ChaCha, extracting the IV from the ciphertext.
+
+    Raises error if key is not 256-bit or text is not larger than the IV of the version.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    __CHACHA_NONCE_LENGTH__, __CHACHA_COUNTER_LENGTH__ = get_nonce_and_counter_length(version)
+    if len(text) <= __CHACHA_NONCE_LENGTH__:
+        # the IV is prepended to the ciphertext
+        raise ValueError("text must be larger than {}-bit.".format(__CHACHA_NONCE_LENGTH__))
+    iv, c = text[:__CHACHA_NONCE_LENGTH__], text[__CHACHA_NONCE_LENGTH__:]
+    return xcrypt(version)(k, c, iv=iv, rounds=rounds, workers=workers)
+
+
+def _random_iv(version: str) -> Bits:
+    """Return a random initialization vector for the ChaCha version."""
+    __CHACHA_NONCE_LENGTH__, __CHACHA_COUNTER_LENGTH__ = get_nonce_and_counter_length(version)
+    return bitseq(rng.randbits(__CHACHA_NONCE_LENGTH__), bit=__CHACHA_NONCE_LENGTH__)
+
+
+def _stream_xcrypt(version: str, k: Bits, iv: Bits, src: BinaryIO, dst: BinaryIO, rounds: int, workers: int,
+                   chunk_size: int) -> None:
+    """XOR the bytes read from src in chunks with the keystream and write them to dst.
+
+    The worker processes are started once and reused for all chunks.
+    """
+    stream = ChaChaStream(k, iv, version, rounds, initial_counter())
+    with KeystreamPool(workers) as pool:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(stream.xcrypt(chunk, pool=pool))
+
+
+def stream_encrypt(k: Bits, src: BinaryIO, dst: BinaryIO, version: str = 'djb', rounds: int = __CHACHA_ROUNDS__,
+                   workers: int = 1, chunk_size: int = __CHACHA_CHUNK_SIZE__) -> None:
+    """Encrypt the raw bytes of src chunk by chunk with ChaCha and write the IV and the ciphertext to dst.
+
+    Memory usage only depends on the chunk size, not on the message size.
+    Raises error if key is not 256-bit.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    iv = _random_iv(version)
+    dst.write(iv.bytes)
+    _stream_xcrypt(version, k, iv, src, dst, rounds, workers, chunk_size)
+
+
+def stream_decrypt(k: Bits, src: BinaryIO, dst: BinaryIO, version: str = 'djb', rounds: int = __CHACHA_ROUNDS__,
+                   workers: int = 1, chunk_size: int = __CHACHA_CHUNK_SIZE__) -> None:
+    """Decrypt the raw bytes of src chunk by chunk with ChaCha, reading the IV first, and write the plaintext to dst.
+
+    Raises error if key is not 256-bit or src is shorter than the IV of the version.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    __CHACHA_NONCE_LENGTH__, __CHACHA_COUNTER_LENGTH__ = get_nonce_and_counter_length(version)
+    iv = src.read(__CHACHA_NONCE_LENGTH__ // 8)
+    if len(iv) != __CHACHA_NONCE_LENGTH__ // 8:
+        raise ValueError("input must contain the {}-bit IV.".format(__CHACHA_NONCE_LENGTH__))
+    _stream_xcrypt(version, k, Bits(bytes=iv), src, dst, rounds, workers, chunk_size)
+
+
+def _chacha_options_wrap(args: Dict[str, Union[str, int]]) -> CipherFunction:
+    """Wrap encrypt and decrypt cipher function with options wrapper to implement option-specific behaviour.
+
+    Returns wrapped encrypt when encrypting; wrapped decrypt when decrypting.
+    Returns wrapped stream_encrypt or stream_decrypt when reading from a file.
+    """
+    # pad key
+    chacha_key_input_padder = key_input_padder(256)
+    if args['--in']:
+        # streams are read and written as raw bytes; only the key is wrapped
+        _stream = stream_encrypt if args['encrypt'] else stream_decrypt
+        return key_input_to_bitseq_wrapper(chacha_key_input_padder(_stream))
+    _encrypt, _decrypt = chacha_key_input_padder(encrypt), chacha_key_input_padder(decrypt)
+
+    # the key must always be casted into a bitstring
+    _encrypt, _decrypt = key_input_to_bitseq_wrapper(_encrypt), key_input_to_bitseq_wrapper(_decrypt)
+    if args['encrypt']:
+        # the text must be encoded (utf8) or casted into a bitstring before encryption
+        text_wrapper = encode_wrapper if args['-x'] == 'utf8' else text_input_to_bitseq_wrapper
+        # output full hex string
+        return fhex_output_wrapper(text_wrapper(_encrypt))
+    elif args['decrypt']:
+        # the text must always be cast into a bitstring
+        _decrypt = text_input_to_bitseq_wrapper(_decrypt)
+        # the decryption output must be decoded (utf8) or is output as full hex string
+        return decode_wrapper(_decrypt) if args['-x'] == 'utf8' else fhex_output_wrapper(_decrypt)
+    else:
+        raise ValueError("args must be a dict with key 'encrypt' or 'decrypt' set.")
+
+
+def validate(args):
+    """Validate the arguments passed on the command line."""
+    if args['-v'] not in ['djb', 'ietf']:
+        raise ValueError("version must be djb or ietf.")
+    if int(args['-r']) not in [8, 12, 20]:
+        raise ValueError("round number must be 8, 12 or 20.")
+    if args['-x'] not in ['utf8', 'none']:
+        raise ValueError("encoding must be utf8 or none")
+    if not args['--jobs'].isdigit() or int(args['--jobs']) < 1:
+        raise ValueError("number of jobs must be a positive integer.")
+
+
+def chacha() -> Optional[str]:
+    """Execute ChaCha cipher with arguments given on command line.
+
+    Gets arguments from docopt which parses sys.argv.
+    See http://docopt.org/ if you are not familiar with docopt argument parsing.
+    """
+    args = docopt(__doc__)
+    validate(args)
+
+    k = args['KEY']
+    version, rounds, workers = args['-v'], int(args['-r']), int(args['--jobs'])
+    cfn = _chacha_options_wrap(args)
+    if args['--in']:
+        with open_binary(args['--in'], 'rb') as src, open_binary(args['--out'], 'wb') as dst:
+            cfn(k, src, dst, version=version, rounds=rounds, workers=workers)
+        return None
+    text = args['PLAINTEXT'] or args['CIPHERTEXT']
+    return cfn(k, text, version=version, rounds=rounds, workers=workers)
+
+
+if __name__ == "__main__":
+    try:
+        output = chacha()
+        if output is not None:
+            print(output)
+    except ValueError as e:
+        print(e)
+        exit(1)
@@ -0,0 +1,139 @@
+"""ChaCha20-Poly1305 authenticated encryption with associated data (AEAD).
+
+Specification:
+    https://tools.ietf.org/html/rfc7539#section-2.8
+
+Test vectors:
+    https://tools.ietf.org/html/rfc7539#section-2.8.2
+
+The IETF version of ChaCha20 (96-bit nonce, 32-bit counter) encrypts the plaintext starting with block counter 1.
+Block 0 is used to derive the one-time Poly1305 key which authenticates the associated data and the ciphertext.
+Encryption and authentication are done in a single pass over the data.
+"""
+import hmac
+import struct
+from typing import BinaryIO, Tuple
+
+from bitstring import Bits
+
+from ciphers.mac.poly1305 import Poly1305
+from ciphers.stream.chacha import ChaChaStream
+
+__CHACHA20_POLY1305_TAG_SIZE__ = 16
+# bytes read per chunk when en-/decrypting streams; a multiple of the 64-byte block size
+__CHACHA20_POLY1305_CHUNK_SIZE__ = 2 ** 20
+
+
+def _validate(k: Bits, nonce: Bits) -> None:
+    """Raise error if key is not 256-bit or nonce is not 96-bit."""
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    if len(nonce) != 96:
+        raise ValueError("nonce must be 96-bit.")
+
+
+def _stream(k: Bits, nonce: Bits) -> ChaChaStream:
+    """Return the ChaCha20 keystream of the ciphertext; the ciphertext starts with block counter 1."""
+    return ChaChaStream(k, nonce, 'ietf', counter=1)
+
+
+def poly1305_key_gen(k: Bits, nonce: Bits) -> bytes:
+    """Derive the 32-byte one-time Poly1305 key from the first 32 bytes of ChaCha20 block 0."""
+    _validate(k, nonce)
+    return ChaChaStream(k, nonce, 'ietf').block(0)[:32]
+
+
+def _pad16(mac: Poly1305, length: int) -> None:
+    """Authenticate zero bytes to pad the length to a multiple of 16."""
+    mac.update(bytes(-length % 16))
+
+
+def _finish(mac: Poly1305, aad_length: int, text_length: int) -> bytes:
+    """Authenticate the padding and the lengths and return the tag."""
+    _pad16(mac, text_length)
+    mac.update(struct.pack('<QQ', aad_length, text_length))
+    return mac.digest()
+
+
+def _mac(k: Bits, nonce: Bits, aad: bytes, lanes: int) -> Poly1305:
+    """Return the Poly1305 authenticator which already authenticated the padded associated data."""
+    mac = Poly1305(poly1305_key_gen(k, nonce), lanes)
+    mac.update(aad)
+    _pad16(mac, len(aad))
+    return mac
+
+
+def chacha20_poly1305_encrypt(k: Bits, nonce: Bits, plaintext: Bits, aad: Bits = Bits(),
+                              lanes: int = 1) -> Tuple[Bits, Bits]:
+    """Encrypt and authenticate the plaintext and authenticate the associated data.
+
+    Returns the ciphertext and the 128-bit tag.
+    Raises error if key is not 256-bit, nonce is not 96-bit or plaintext or associated data are not whole bytes.
+    """
+    _validate(k, nonce)
+    if len(plaintext) % 8 != 0 or len(aad) % 8 != 0:
+        raise ValueError("plaintext and associated data must be whole bytes.")
+    mac = _mac(k, nonce, aad.bytes, lanes)
+    c = _stream(k, nonce).xcrypt(plaintext.bytes)
+    mac.update(c)
+    return Bits(bytes=c), Bits(bytes=_finish(mac, len(aad) // 8, len(c)))
+
+
+def chacha20_poly1305_decrypt(k: Bits, nonce: Bits, ciphertext: Bits, tag: Bits, aad: Bits = Bits(),
+                              lanes: int = 1) -> Bits:
+    """Verify the tag of the ciphertext and the associated data and decrypt the ciphertext.
+
+    Raises error if the tag is not valid, key is not 256-bit, nonce is not 96-bit or tag is not 128-bit.
+    """
+    _validate(k, nonce)
+    if len(tag) != 128:
+        raise ValueError("tag must be 128-bit.")
+    if len(ciphertext) % 8 != 0 or len(aad) % 8 != 0:
+        raise ValueError("ciphertext and associated data must be whole bytes.")
+    mac = _mac(k, nonce, aad.bytes, lanes)
+    mac.update(ciphertext.bytes)
+    if not hmac.compare_digest(_finish(mac, len(aad) // 8, len(ciphertext) // 8), tag.bytes):
+        raise ValueError("tag is not valid.")
+    return Bits(bytes=_stream(k, nonce).xcrypt(ciphertext.bytes))
+
+
+def stream_encrypt(k: Bits, nonce: Bits, src: BinaryIO, dst: BinaryIO, aad: bytes = b'', lanes: int = 1,
+                   chunk_size: int = __CHACHA20_POLY1305_CHUNK_SIZE__) -> None:
+    """Encrypt and authenticate the raw bytes of src in one pass and write the ciphertext followed by the tag to dst.
+
+    Raises error if key is not 256-bit or nonce is not 96-bit.
+    """
+    mac, stream = _mac(k, nonce, aad, lanes), _stream(k, nonce)
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        c = stream.xcrypt(chunk)
+        mac.update(c)
+        dst.write(c)
+    dst.write(_finish(mac, len(aad), stream.tell()))
+
+
+def stream_decrypt(k: Bits, nonce: Bits, src: BinaryIO, dst: BinaryIO, aad: bytes = b'', lanes: int = 1,
+                   chunk_size: int = __CHACHA20_POLY1305_CHUNK_SIZE__) -> None:
+    """Decrypt the raw bytes of src in one pass, verifying the tag at the end of src, and write the plaintext to dst.
+
+    The plaintext is written before the tag can be verified; if an error is raised, the written plaintext is not
+    authentic and must be discarded.
+    Raises error if the tag is not valid, key is not 256-bit or nonce is not 96-bit.
+    """
+    mac, stream = _mac(k, nonce, aad, lanes), _stream(k, nonce)
+    # the last 16 bytes read so far could be the tag
+    pending = b''
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        data = pending + chunk
+        c, pending = data[:-__CHACHA20_POLY1305_TAG_SIZE__], data[-__CHACHA20_POLY1305_TAG_SIZE__:]
+        mac.update(c)
+        dst.write(stream.xcrypt(c))
+    if len(pending) != __CHACHA20_POLY1305_TAG_SIZE__:
+        raise ValueError("input must contain the 128-bit tag.")
+    if not hmac.compare_digest(_finish(mac, len(aad), stream.tell()), pending):
+        raise ValueError("tag is not valid.")
@@ -13,24 +13,29 @@ Test vectors:
 Usage:
     salsa20 encrypt [options] KEY PLAINTEXT
     salsa20 decrypt [options] KEY CIPHERTEXT
+    salsa20 encrypt [options] KEY --in=FILE [--out=FILE]
+    salsa20 decrypt [options] KEY --in=FILE [--out=FILE]
 
     -r=[8,12,20]            Number of rounds. [default: 20]
     -x=[utf8,none]          Specifies the encoding of the cipher-/plaintext. [default: none]
+    -j, --jobs=N            Number of worker processes generating the keystream. [default: 1]
+    --in=FILE               Read raw bytes from the file in chunks instead of the text argument. '-' reads stdin.
+    --out=FILE              Write raw bytes (IV first when encrypting) to the file. '-' writes stdout. [default: -]
 
     KEY                     The key which should be used for en-/decryption.
     PLAINTEXT               The text to encrypt. Must be a number. Can be a code literal such as 0b1011, 0o71, 0xF32C.
     CIPHERTEXT              The text to decrypt. Must be a number. Can be a code literal such as 0b1011, 0o71, 0xF32C.
 """
 
-import random
+import struct
 import sys
-from functools import reduce
+from functools import lru_cache
 from math import ceil
 from pathlib import Path
-from time import time
-from typing import Any, Optional, Union, Dict
+from typing import Any, BinaryIO, Optional, Union, Dict, List, MutableSequence, Sequence, Tuple
 
-from bitstring import Bits, pack
+import numpy as np  # type: ignore
+from bitstring import Bits
 from docopt import docopt  # type: ignore
 
 # make sure that following imports can be resolved when executing this script from cmdline
@@ -38,11 +43,109 @@ sys.path.insert(0, str(Path(__file__).parent / '../..'))
 
 from util.wrap import fhex_output_wrapper, text_input_to_bitseq_wrapper, key_input_to_bitseq_wrapper, key_input_padder
 from util.encode import encode_wrapper, decode_wrapper
-from util.rot import rot_left_bits
-from util.bitseq import bitseq8, bitseq32, littleendian, bitseq64, bitseq_split, bitseq_add
+from util.bitseq import bitseq64
+from util.open_binary import open_binary
+from util.parallel import KeystreamPool, parallel_keystream
+from util import rng
+from util.rot import rot_left32
 from util.types import CipherFunction
 
 __SALSA_20_ROUNDS__: int = 20
+# bytes read per chunk when en-/decrypting streams; a multiple of the 64-byte block size
+__SALSA_20_CHUNK_SIZE__: int = 2 ** 20
+
+# constant words sigma and tau of the expansion for 256-bit and 128-bit keys
+_SIGMA = struct.unpack('<4I', b'expand 32-byte k')
+_TAU = struct.unpack('<4I', b'expand 16-byte k')
+
+
+def quarterround_words(x: MutableSequence[int], a: int, b: int, c: int, d: int) -> None:
+    """Calculate the quarterround of the words at the given indices of the state in place.
+
+    The state may be a list or an array('I') of 32-bit words.
+    """
+    x[b] ^= rot_left32((x[a] + x[d]) & 0xFFFFFFFF, 7)
+    x[c] ^= rot_left32((x[b] + x[a]) & 0xFFFFFFFF, 9)
+    x[d] ^= rot_left32((x[c] + x[b]) & 0xFFFFFFFF, 13)
+    x[a] ^= rot_left32((x[d] + x[c]) & 0xFFFFFFFF, 18)
+
+
+def columnround_words(x: MutableSequence[int]) -> None:
+    """Calculate the columnround of the 16-word state in place."""
+    quarterround_words(x, 0, 4, 8, 12)
+    quarterround_words(x, 5, 9, 13, 1)
+    quarterround_words(x, 10, 14, 2, 6)
+    quarterround_words(x, 15, 3, 7, 11)
+
+
+def rowround_words(x: MutableSequence[int]) -> None:
+    """Calculate the rowround of the 16-word state in place."""
+    quarterround_words(x, 0, 1, 2, 3)
+    quarterround_words(x, 5, 6, 7, 4)
+    quarterround_words(x, 10, 11, 8, 9)
+    quarterround_words(x, 15, 12, 13, 14)
+
+
+def doubleround_words(x: MutableSequence[int]) -> None:
+    """Calculate the doubleround of the 16-word state in place."""
+    columnround_words(x)
+    rowround_words(x)
+
+
+def salsa20_hash_words(x: Sequence[int], rounds: int = __SALSA_20_ROUNDS__) -> List[int]:
+    """Calculate the salsa20 hash of the 16 32-bit words.
+
+    Word variant of salsa20_hash: the input words are the little-endian words of the 64-byte sequence and the
+    output words have to be serialized in little-endian to get the 64-byte hash.
+    """
+    if len(x) != 16:
+        raise ValueError("Input must be 16 words.")
+    z = list(x)
+    for _ in range(int(rounds / 2)):
+        doubleround_words(z)
+    return [(xi + zi) & 0xFFFFFFFF for xi, zi in zip(x, z)]
+
+
+_COLUMNROUND = ((0, 4, 8, 12), (5, 9, 13, 1), (10, 14, 2, 6), (15, 3, 7, 11))
+_ROWROUND = ((0, 1, 2, 3), (5, 6, 7, 4), (10, 11, 8, 9), (15, 12, 13, 14))
+
+
+def _rot_left32_many(x: np.ndarray, i: int) -> np.ndarray:
+    """Bit rotation to the left of an array of 32-bit words."""
+    return (x << np.uint32(i)) | (x >> np.uint32(32 - i))
+
+
+def salsa20_hash_many(x: np.ndarray, rounds: int = __SALSA_20_ROUNDS__) -> np.ndarray:
+    """Calculate the salsa20 hash of many 16-word inputs at once.
+
+    x is a (16, K) uint32 array holding one input per column in the word layout of salsa20_hash_words.
+    The doubleround operations run over all K columns simultaneously.
+    Returns a (16, K) uint32 array.
+    Raises error if x does not have 16 rows.
+    """
+    x = np.asarray(x, dtype=np.uint32)
+    if x.ndim != 2 or x.shape[0] != 16:
+        raise ValueError("Input must be a (16, K) array.")
+    z = x.copy()
+    t = np.empty(x.shape[1], dtype=np.uint32)
+    for _ in range(int(rounds / 2)):
+        for a, b, c, d in _COLUMNROUND + _ROWROUND:
+            z[b] ^= _rot_left32_many(np.add(z[a], z[d], out=t), 7)
+            z[c] ^= _rot_left32_many(np.add(z[b], z[a], out=t), 9)
+            z[d] ^= _rot_left32_many(np.add(z[c], z[b], out=t), 13)
+            z[a] ^= _rot_left32_many(np.add(z[d], z[c], out=t), 18)
+    z += x
+    return z
+
+
+def _words(b: Bits) -> List[int]:
+    """Return the big-endian 32-bit words of the bitstring."""
+    return list(b.unpack('{}*uint:32'.format(len(b) // 32)))
+
+
+def _from_words(z: Sequence[int]) -> Bits:
+    """Return the bitstring of the big-endian 32-bit words."""
+    return Bits(bytes=struct.pack('>{}I'.format(len(z)), *z))
 
 
 def quarterround(y: Bits) -> Bits:
@@ -53,54 +156,35 @@ def quarterround(y: Bits) -> Bits:
     """
     if len(y) != 128:
         raise ValueError("Input must be 128-bit.")
-    y0, y1, y2, y3 = bitseq_split(32, y)
-    z1 = y1 ^ rot_left_bits(bitseq_add(y0, y3), 7)
-    z2 = y2 ^ rot_left_bits(bitseq_add(z1, y0), 9)
-    z3 = y3 ^ rot_left_bits(bitseq_add(z2, z1), 13)
-    z0 = y0 ^ rot_left_bits(bitseq_add(z3, z2), 18)
-    return z0 + z1 + z2 + z3
+    z = _words(y)
+    quarterround_words(z, 0, 1, 2, 3)
+    return _from_words(z)
 
 
-def rowround(y_: Bits) -> Bits:
+def rowround(y: Bits) -> Bits:
     """Calculate the rowround value of the input as specified in the paper.
 
     Returns a 512-bit value.
     Raises error if input is not 512-bit.
     """
-    if len(y_) != 512:
+    if len(y) != 512:
         raise ValueError("Input must be 512-bit.")
-    y = bitseq_split(32, y_)
-    z = [None] * 16
-    q = quarterround(bitseq32(y[0], y[1], y[2], y[3]))
-    z[0], z[1], z[2], z[3] = bitseq_split(32, q)
-    q = quarterround(bitseq32(y[5], y[6], y[7], y[4]))
-    z[5], z[6], z[7], z[4] = bitseq_split(32, q)
-    q = quarterround(bitseq32(y[10], y[11], y[8], y[9]))
-    z[10], z[11], z[8], z[9] = bitseq_split(32, q)
-    q = quarterround(bitseq32(y[15], y[12], y[13], y[14]))
-    z[15], z[12], z[13], z[14] = bitseq_split(32, q)
-    return bitseq32(*z)
-
-
-def columnround(x_: Bits) -> Bits:
+    z = _words(y)
+    rowround_words(z)
+    return _from_words(z)
+
+
+def columnround(x: Bits) -> Bits:
     """Calculate the columnround value of the input as specified in the paper.
 
     Returns a 512-bit value.
     Raises error if input is not 512-bit.
     """
-    if len(x_) != 512:
+    if len(x) != 512:
         raise ValueError("Input must be 512-bit.")
-    x = bitseq_split(32, x_)
-    y = [None] * 16
-    q = quarterround(bitseq32(x[0], x[4], x[8], x[12]))
-    y[0], y[4], y[8], y[12] = bitseq_split(32, q)
-    q = quarterround(bitseq32(x[5], x[9], x[13], x[1]))
-    y[5], y[9], y[13], y[1] = bitseq_split(32, q)
-    q = quarterround(bitseq32(x[10], x[14], x[2], x[6]))
-    y[10], y[14], y[2], y[6] = bitseq_split(32, q)
-    q = quarterround(bitseq32(x[15], x[3], x[7], x[11]))
-    y[15], y[3], y[7], y[11] = bitseq_split(32, q)
-    return bitseq32(*y)
+    y = _words(x)
+    columnround_words(y)
+    return _from_words(y)
 
 
 def doubleround(x: Bits) -> Bits:
@@ -113,24 +197,46 @@ def doubleround(x: Bits) -> Bits:
     return rowround(columnround(x))
 
 
-def salsa20_hash(x_: Bits) -> Bits:
+def salsa20_hash(x: Bits, rounds: int = __SALSA_20_ROUNDS__) -> Bits:
     """Calculate the salsa20 hash of the value.
 
     Returns a 64-byte sequence.
     Raises error if input is not 512-bit.
     """
-    if len(x_) != 512:
+    if len(x) != 512:
         raise ValueError("Input must be 512-bit.")
-
     # view each 4-byte sequence as a word in little-endian form.
-    x = sum(bitseq_split(32, x_, formatter=littleendian))
-    z = reduce(lambda a, _: doubleround(a), range(int(__SALSA_20_ROUNDS__ / 2)), x)
-    x_bitseq32 = bitseq_split(32, x)
-    z_bitseq32 = bitseq_split(32, z)
-    return sum([littleendian(bitseq_add(xi, zi)) for xi, zi in zip(x_bitseq32, z_bitseq32)])
+    z = salsa20_hash_words(x.unpack('16*uintle:32'), rounds)
+    return Bits(bytes=struct.pack('<16I', *z))
+
+
+@lru_cache(maxsize=256)
+def _key_setup(k: bytes) -> Tuple[int, ...]:
+    """Return the 16 little-endian words of the expansion matrix for the key with all input words set to zero."""
+    if len(k) == 32:
+        c, k0, k1 = _SIGMA, struct.unpack('<4I', k[:16]), struct.unpack('<4I', k[16:])
+    else:
+        c, k0 = _TAU, struct.unpack('<4I', k)
+        k1 = k0
+    return (c[0], *k0, c[1], 0, 0, 0, 0, c[2], *k1, c[3])
+
+
+def state_template(k: Bits, iv: Bits) -> List[int]:
+    """Return the 16-word expansion matrix for the key and the IV with the block counter set to zero.
+
+    The matrix is built once per key and IV; per block only the counter words 8 and 9 have to be set.
+    Raises error if key is not 128 or 256-bit or IV is not 64-bit.
+    """
+    if len(k) not in (128, 256):
+        raise ValueError("key must be 128 or 256-bit.")
+    if len(iv) != 64:
+        raise ValueError("IV must be 64-bit.")
+    x = list(_key_setup(k.bytes))
+    x[6:8] = iv.unpack('2*uintle:32')
+    return x
 
 
-def expansion(k: Bits, n: Bits) -> Bits:
+def expansion(k: Bits, n: Bits, rounds: int = __SALSA_20_ROUNDS__) -> Bits:
     """Expand the key and the nonce into a 64-byte sequence.
 
     The hash function can be seen as working on following matrix where each entry is 32-bit (a 4-byte word).
@@ -148,19 +254,133 @@ def expansion(k: Bits, n: Bits) -> Bits:
     """
     if len(n) != 128:
         raise ValueError("n must be 128-bit.")
-    if len(k) != 128:
-        if len(k) != 256:
-            raise ValueError("k must be 128 or 256-bit.")
-        k0, k1 = bitseq_split(128, k)
-        sigma = [bitseq8(101, 120, 112, 97), bitseq8(110, 100, 32, 51),
-                 bitseq8(50, 45, 98, 121), bitseq8(116, 101, 32, 107)]
-        return salsa20_hash(sigma[0] + k0 + sigma[1] + n + sigma[2] + k1 + sigma[3])
-    elif len(k) == 128:
-        tau = [bitseq8(101, 120, 112, 97), bitseq8(110, 100, 32, 49),
-               bitseq8(54, 45, 98, 121), bitseq8(116, 101, 32, 107)]
-        return salsa20_hash(tau[0] + k + tau[1] + n + tau[2] + k + tau[3])
-    else:
+    if len(k) not in (128, 256):
         raise ValueError("k must be 128 or 256-bit.")
+    x = list(_key_setup(k.bytes))
+    x[6:10] = n.unpack('4*uintle:32')
+    return Bits(bytes=struct.pack('<16I', *salsa20_hash_words(x, rounds)))
+
+
+def _blocks_many(state: Sequence[int], rounds: int, counter: int, count: int) -> np.ndarray:
+    """Return the keystream blocks of the expansion state for count consecutive counters as (16, count) array."""
+    counters = np.arange(count, dtype=np.uint64) + np.uint64(counter)
+    x = np.empty((16, count), dtype=np.uint32)
+    x[:] = np.array(state, dtype=np.uint32)[:, np.newaxis]
+    x[8], x[9] = counters.astype(np.uint32), (counters >> np.uint64(32)).astype(np.uint32)
+    return salsa20_hash_many(x, rounds)
+
+
+def _salsa20_keystream(state: Sequence[int], rounds: int, first: int, count: int) -> bytes:
+    """Return the keystream blocks first, ..., first + count - 1 of the expansion state as bytes."""
+    # serialize block by block, each one as little-endian words
+    return _blocks_many(state, rounds, first, count).T.astype('<u4').tobytes()
+
+
+class Salsa20Stream:
+    """Lazy, seekable Salsa20 keystream for a key and an initialization vector.
+
+    The keystream is generated block by block from the current byte position. Seeking sets the 64-bit block
+    counter directly so a byte range of a large message can be en-/decrypted without the preceding blocks.
+    """
+
+    _blocks_per_chunk = 4096
+
+    def __init__(self, key: Bits, iv: Bits, rounds: int = __SALSA_20_ROUNDS__):
+        """Prepare the expansion state for the key and the IV.
+
+        Any positive even round count is accepted such that reduced-round variants can be studied.
+        Raises error if key is not 128 or 256-bit, IV is not 64-bit or the round count is not positive and even.
+        """
+        if rounds <= 0 or rounds % 2 != 0:
+            raise ValueError("round number must be positive and even.")
+        self._state = state_template(key, iv)
+        self.rounds = rounds
+        self._position = 0
+
+    def block(self, counter: int) -> bytes:
+        """Return the 64-byte keystream block for the block counter.
+
+        Raises error if counter is not 64-bit.
+        """
+        if not 0 <= counter < 2 ** 64:
+            raise ValueError("counter must be 64-bit.")
+        x = self._state.copy()
+        x[8], x[9] = counter & 0xFFFFFFFF, counter >> 32
+        return struct.pack('<16I', *salsa20_hash_words(x, self.rounds))
+
+    def blocks(self, counter: int, count: int) -> np.ndarray:
+        """Return count consecutive keystream blocks starting at the block counter as a (16, count) uint32 array.
+
+        Column i holds the little-endian words of the keystream block counter + i.
+        Raises error if a counter is not 64-bit.
+        """
+        if counter < 0 or count < 0 or counter + count > 2 ** 64:
+            raise ValueError("counter must be 64-bit.")
+        return _blocks_many(self._state, self.rounds, counter, count)
+
+    def seek(self, offset: int) -> None:
+        """Set the keystream position to the byte offset.
+
+        Raises error if offset is negative or beyond the 2^70-byte keystream.
+        """
+        if not 0 <= offset <= 64 * 2 ** 64:
+            raise ValueError("offset must be between 0 and 2^70.")
+        self._position = offset
+
+    def tell(self) -> int:
+        """Return the current keystream byte position."""
+        return self._position
+
+    def __iter__(self) -> 'Salsa20Stream':
+        """Return the stream as iterator over the keystream blocks."""
+        return self
+
+    def __next__(self) -> bytes:
+        """Return the keystream up to the end of the current block and advance past it."""
+        counter, skip = divmod(self._position, 64)
+        if counter >= 2 ** 64:
+            raise StopIteration
+        self._position += 64 - skip
+        return self.block(counter)[skip:]
+
+    def read(self, size: int, workers: int = 1, pool: Optional[KeystreamPool] = None) -> bytes:
+        """Return the next size bytes of the keystream and advance the position.
+
+        The keystream of large reads can be generated on several processes by setting workers, which starts the
+        processes for this read only, or by passing a pool whose processes are reused across reads.
+        Raises error if size is negative or the keystream is exhausted.
+        """
+        if size < 0:
+            raise ValueError("size must not be negative.")
+        if self._position + size > 64 * 2 ** 64:
+            raise ValueError("keystream exhausted.")
+        if size <= 64:
+            chunks, needed = [], size
+            while needed > 0:
+                chunk = next(self)
+                chunks.append(chunk[:needed])
+                needed -= len(chunk)
+            # step back to the unused remainder of the last block
+            self._position += needed
+            return b''.join(chunks)
+        counter, skip = divmod(self._position, 64)
+        end = counter + ceil((skip + size) / 64)
+        if pool is not None:
+            stream = pool.keystream(_salsa20_keystream, (self._state, self.rounds), counter, end - counter, 64)
+        elif workers > 1:
+            stream = parallel_keystream(_salsa20_keystream, (self._state, self.rounds), counter, end - counter, 64,
+                                        workers)
+        else:
+            chunk = self._blocks_per_chunk
+            stream = b''.join(_salsa20_keystream(self._state, self.rounds, first, min(chunk, end - first))
+                              for first in range(counter, end, chunk))
+        self._position += size
+        return stream[skip:skip + size]
+
+    def xcrypt(self, data: bytes, workers: int = 1, pool: Optional[KeystreamPool] = None) -> bytes:
+        """En- or decrypt the bytes at the current position by XOR'ing them with the keystream. See read."""
+        stream = self.read(len(data), workers, pool)
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(stream, 'little')).to_bytes(len(data), 'little')
 
 
 def xcrypt(k: Bits, text: Bits, *args: Any, **kwargs: Any) -> Bits:
@@ -169,11 +389,14 @@ def xcrypt(k: Bits, text: Bits, *args: Any, **kwargs: Any) -> Bits:
     En- and decryption use the same algorithm because the inverse of XOR is XOR thus this function is called 'xcrypt'.
 
     En-/Decryption is done by XOR'ing the plain-/ciphertext with the stream generated by the expansion function.
-    The nonce for the expansion function is dependent on current time thus ensuring that the same nonce
-    will never be used again with the same key.
+    The nonce for the expansion function is drawn from the cryptographically secure generator of util.rng thus
+    ensuring that the same nonce will practically never be used again with the same key.
 
     The nonce for the expansion function should never be reused with the same key!
     Else, this happens: https://crypto.stackexchange.com/a/108/80458
+
+    The number of rounds can be given as keyword argument 'rounds' and defaults to 20.
+    The keystream of large messages can be generated on several processes by giving the keyword argument 'workers'.
     """
     if 'iv' not in kwargs:
         raise TypeError("xcrypt needs initialization vector as keyword argument")
@@ -182,32 +405,27 @@ def xcrypt(k: Bits, text: Bits, *args: Any, **kwargs: Any) -> Bits:
     if len(iv) != 64:
         raise ValueError("IV must be 64-bit.")
 
-    def create_nonce(cnt: int) -> Bits:
-        # last 64 bits of the nonce are the counter in littleendian
-        return iv + pack('<1Q', cnt)
+    stream = Salsa20Stream(k, iv, kwargs.get('rounds', __SALSA_20_ROUNDS__)).read(ceil(len(text) / 8),
+                                                                                  kwargs.get('workers', 1))
+    return text ^ Bits(bytes=stream, length=len(text))
 
-    stream_blocks_needed = ceil(len(text) / 512)
-    stream = sum([expansion(k, create_nonce(counter)) for counter in range(stream_blocks_needed)])
-    return text ^ stream[:len(text)]
 
-
-def encrypt(k: Bits, text: Bits) -> Bits:
+def encrypt(k: Bits, text: Bits, rounds: int = __SALSA_20_ROUNDS__, workers: int = 1) -> Bits:
     """Encrypt the message with the given key with Salsa20.
 
-    Make initialization vector dependent of current time to make sure a message is never
-    encrypted again with the same key and IV.
+    Draw the initialization vector from the cryptographically secure generator of util.rng to make sure a
+    message is practically never encrypted again with the same key and IV.
     Raises error if key is not 256-bit.
     """
     if len(k) != 256:
         raise ValueError("key must be 256-bit.")
 
-    random.seed(time())
-    iv = bitseq64(random.randrange(2 ** 64))
-    c = xcrypt(k, text, iv=iv)
+    iv = _random_iv()
+    c = xcrypt(k, text, iv=iv, rounds=rounds, workers=workers)
     return iv + c
 
 
-def decrypt(k: Bits, text: Bits) -> Bits:
+def decrypt(k: Bits, text: Bits, rounds: int = __SALSA_20_ROUNDS__, workers: int = 1) -> Bits:
     """Decrypt the message with the given key with Salsa20, extracting the IV from the ciphertext.
 
     Raises error if key is not 256-bit or text is not 64-bit.
@@ -219,16 +437,67 @@ def decrypt(k: Bits, text: Bits) -> Bits:
         # text can not be smaller than or equal to 64 bits because the IV itself is already 64-bits long.
         raise ValueError("text must be larger than 64-bit.")
     iv, c = text[:64], text[64:]
-    return xcrypt(k, c, iv=iv)
+    return xcrypt(k, c, iv=iv, rounds=rounds, workers=workers)
+
+
+def _random_iv() -> Bits:
+    """Return a random initialization vector."""
+    return bitseq64(rng.randbits(64))
+
+
+def _stream_xcrypt(stream: Salsa20Stream, src: BinaryIO, dst: BinaryIO, workers: int, chunk_size: int) -> None:
+    """XOR the bytes read from src in chunks with the keystream and write them to dst.
+
+    The worker processes are started once and reused for all chunks.
+    """
+    with KeystreamPool(workers) as pool:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(stream.xcrypt(chunk, pool=pool))
+
+
+def stream_encrypt(k: Bits, src: BinaryIO, dst: BinaryIO, rounds: int = __SALSA_20_ROUNDS__, workers: int = 1,
+                   chunk_size: int = __SALSA_20_CHUNK_SIZE__) -> None:
+    """Encrypt the raw bytes of src chunk by chunk with Salsa20 and write the IV and the ciphertext to dst.
+
+    Memory usage only depends on the chunk size, not on the message size.
+    Raises error if key is not 256-bit.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    iv = _random_iv()
+    dst.write(iv.bytes)
+    _stream_xcrypt(Salsa20Stream(k, iv, rounds), src, dst, workers, chunk_size)
+
+
+def stream_decrypt(k: Bits, src: BinaryIO, dst: BinaryIO, rounds: int = __SALSA_20_ROUNDS__, workers: int = 1,
+                   chunk_size: int = __SALSA_20_CHUNK_SIZE__) -> None:
+    """Decrypt the raw bytes of src chunk by chunk with Salsa20, reading the IV first, and write the plaintext to dst.
+
+    Raises error if key is not 256-bit or src is shorter than the 64-bit IV.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    iv = src.read(8)
+    if len(iv) != 8:
+        raise ValueError("input must contain the 64-bit IV.")
+    _stream_xcrypt(Salsa20Stream(k, Bits(bytes=iv), rounds), src, dst, workers, chunk_size)
 
 
 def _salsa20_options_wrap(args: Dict[str, Union[str, int]]) -> CipherFunction:
     """Wrap encrypt and decrypt cipher function with options wrapper to implement option-specific behaviour.
 
-    Returns wrapped encrypt when encrypting; wrapped decrypt when decrypting."""
+    Returns wrapped encrypt when encrypting; wrapped decrypt when decrypting.
+    Returns wrapped stream_encrypt or stream_decrypt when reading from a file."""
 
     # pad key
     salsa20_key_input_padder = key_input_padder(256)
+    if args['--in']:
+        # streams are read and written as raw bytes; only the key is wrapped
+        _stream = stream_encrypt if args['encrypt'] else stream_decrypt
+        return key_input_to_bitseq_wrapper(salsa20_key_input_padder(_stream))
     _encrypt, _decrypt = salsa20_key_input_padder(encrypt), salsa20_key_input_padder(decrypt)
 
     # the key must always be casted into a bitstring
@@ -265,6 +534,8 @@ def validate(args):
         raise ValueError("round number must be 8, 12 or 20.")
     if args['-x'] not in ['utf8', 'none']:
         raise ValueError("encoding must be utf8 or none")
+    if not args['--jobs'].isdigit() or int(args['--jobs']) < 1:
+        raise ValueError("number of jobs must be a positive integer.")
 
 
 def salsa20() -> Optional[str]:
@@ -276,17 +547,22 @@ def salsa20() -> Optional[str]:
     args = docopt(__doc__)
     validate(args)
 
-    text = args['PLAINTEXT'] or args['CIPHERTEXT']
     k = args['KEY']
-    global __SALSA_20_ROUNDS__
-    __SALSA_20_ROUNDS__ = int(args['-r'])
+    rounds, workers = int(args['-r']), int(args['--jobs'])
     cfn = _salsa20_options_wrap(args)
-    return cfn(k, text)
+    if args['--in']:
+        with open_binary(args['--in'], 'rb') as src, open_binary(args['--out'], 'wb') as dst:
+            cfn(k, src, dst, rounds=rounds, workers=workers)
+        return None
+    text = args['PLAINTEXT'] or args['CIPHERTEXT']
+    return cfn(k, text, rounds=rounds, workers=workers)
 
 
 if __name__ == "__main__":
     try:
-        print(salsa20())
+        output = salsa20()
+        if output is not None:
+            print(output)
     except ValueError as e:
         print(e)
         exit(1)
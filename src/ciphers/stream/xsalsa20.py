@@ -0,0 +1,95 @@
+"""XSalsa20 implementation: Salsa20 with an extended 192-bit nonce.
+
+Specification:
+    https://cr.yp.to/snuffle/xsalsa-20081128.pdf
+
+HSalsa20 derives a 256-bit subkey from the key and the first 128 bits of the nonce. The subkey and the last 64 bits
+of the nonce are then used as key and initialization vector of Salsa20. The nonce is long enough to be chosen at
+random for every message.
+"""
+import struct
+from typing import Any
+
+from bitstring import Bits
+
+from ciphers.stream.salsa20 import Salsa20Stream, doubleround_words, state_template, xcrypt as salsa20_xcrypt, \
+    __SALSA_20_ROUNDS__
+from util.bitseq import bitseq
+from util import rng
+
+__XSALSA_20_NONCE_LENGTH__ = 192
+
+
+def hsalsa20(k: Bits, n: Bits, rounds: int = __SALSA_20_ROUNDS__) -> Bits:
+    """Derive a 256-bit subkey from the key and the 128-bit input.
+
+    HSalsa20 runs the rounds of the salsa20 hash on the expansion matrix of the key and the input but omits the final
+    addition; the subkey are the diagonal words followed by the input words of the result.
+
+    Returns a 256-bit value.
+    Raises error if key is not 256-bit or input is not 128-bit.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    if len(n) != 128:
+        raise ValueError("n must be 128-bit.")
+    x = state_template(k, n[:64])
+    x[8:10] = n[64:].unpack('2*uintle:32')
+    for _ in range(int(rounds / 2)):
+        doubleround_words(x)
+    return Bits(bytes=struct.pack('<8I', x[0], x[5], x[10], x[15], *x[6:10]))
+
+
+class XSalsa20Stream(Salsa20Stream):
+    """Lazy, seekable XSalsa20 keystream for a key and a 192-bit nonce.
+
+    Same interface as Salsa20Stream; the keystream is the Salsa20 keystream of the HSalsa20 subkey.
+    """
+
+    def __init__(self, key: Bits, nonce: Bits, rounds: int = __SALSA_20_ROUNDS__):
+        """Derive the subkey and prepare the expansion state.
+
+        Raises error if key is not 256-bit or nonce is not 192-bit.
+        """
+        if len(nonce) != __XSALSA_20_NONCE_LENGTH__:
+            raise ValueError("nonce must be 192-bit.")
+        super().__init__(hsalsa20(key, nonce[:128], rounds), nonce[128:], rounds)
+
+
+def xcrypt(k: Bits, text: Bits, *args: Any, **kwargs: Any) -> Bits:
+    """En- or decrypt the message with the given key with XSalsa20.
+
+    The 192-bit nonce must be given as keyword argument 'iv'; 'rounds' and 'workers' are passed on to Salsa20.
+    """
+    if 'iv' not in kwargs:
+        raise TypeError("xcrypt needs initialization vector as keyword argument")
+    nonce = kwargs.pop('iv')
+    if len(nonce) != __XSALSA_20_NONCE_LENGTH__:
+        raise ValueError("nonce must be 192-bit.")
+    subkey = hsalsa20(k, nonce[:128], kwargs.get('rounds', __SALSA_20_ROUNDS__))
+    return salsa20_xcrypt(subkey, text, iv=nonce[128:], **kwargs)
+
+
+def encrypt(k: Bits, text: Bits, rounds: int = __SALSA_20_ROUNDS__, workers: int = 1) -> Bits:
+    """Encrypt the message with the given key with XSalsa20.
+
+    The nonce is drawn from the cryptographically secure generator of util.rng, thus no nonce state needs to be kept.
+    Raises error if key is not 256-bit.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    nonce = bitseq(rng.randbits(__XSALSA_20_NONCE_LENGTH__), bit=__XSALSA_20_NONCE_LENGTH__)
+    return nonce + xcrypt(k, text, iv=nonce, rounds=rounds, workers=workers)
+
+
+def decrypt(k: Bits, text: Bits, rounds: int = __SALSA_20_ROUNDS__, workers: int = 1) -> Bits:
+    """Decrypt the message with the given key with XSalsa20, extracting the nonce from the ciphertext.
+
+    Raises error if key is not 256-bit or text is not larger than 192-bit.
+    """
+    if len(k) != 256:
+        raise ValueError("key must be 256-bit.")
+    if len(text) <= __XSALSA_20_NONCE_LENGTH__:
+        raise ValueError("text must be larger than 192-bit.")
+    nonce, c = text[:__XSALSA_20_NONCE_LENGTH__], text[__XSALSA_20_NONCE_LENGTH__:]
+    return xcrypt(k, c, iv=nonce, rounds=rounds, workers=workers)
@@ -0,0 +1,9 @@
+"""Module for cryptanalysis of the implemented ciphers.
+
+Currently implemented attacks:
+- linear:           Linear cryptanalysis (known-plaintext) of reduced-round FEAL-NX.
+- differential:     Differential cryptanalysis (chosen-plaintext) of reduced-round FEAL-NX.
+
+Tools:
+- tables:           DDT, LAT and BCT of S-Boxes.
+"""
@@ -0,0 +1 @@
+"""Module for differential cryptanalysis attacks."""
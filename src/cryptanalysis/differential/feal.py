@@ -0,0 +1,165 @@
+"""Differential cryptanalysis of reduced-round FEAL-NX.
+
+Implements a chosen-plaintext attack in the style of Biham-Shamir and Murphy which recovers the effective key of the
+last round (see cryptanalysis.feal) with a characteristic over the first N-1 rounds.
+
+The attack is based on the following differential of the f-function which holds with probability one:
+
+    f(a, b) ^ f(a ^ 0x80800000, b) = 0x02000000
+
+since the difference of a0 and a1 cancels in the inner bytes and flipping the most significant bit of an input byte
+of S0 flips bit 1 of its output.
+
+Because of the pre-processing, the plaintext difference (0x80800000, 0x80800000) leads to the difference
+(0x80800000, 0x0) after pre-processing. With this input difference, the difference (ΔL3, ΔR3) = (0x02000000, ?)
+after three rounds is reached for every pair. Given the ciphertexts, the output difference of the last f-function is
+then known:
+
+    Δf(R3, K3) = ΔR4 ^ ΔL3 = ΔCL ^ 0x02000000      with      R3 = L4 = CL ^ CR ^ b
+
+The inner output bytes f1 and f2 only depend on the 16 inner bits k1 k2 of the effective key thus they are
+guessed first. With k1 k2 known, f0 only depends on k0 and f3 only on k3 which are guessed independently.
+"""
+from typing import NamedTuple, Optional, Tuple, List
+
+import numpy as np  # type: ignore
+
+# noinspection PyProtectedMember
+from ciphers.block.feal import encrypt_many, _np_tables
+
+Characteristic = NamedTuple('Characteristic', [
+    ('plaintext_difference', int),
+    # difference of the left half before the last round
+    ('left_difference', int),
+    # difference of the right half before the last round; None if not fixed by the characteristic
+    ('right_difference', Optional[int]),
+])
+Candidate = NamedTuple('Candidate', [('key', int), ('count', int)])
+
+FEAL_4_CHARACTERISTIC = Characteristic(
+    plaintext_difference=0x8080000080800000, left_difference=0x02000000, right_difference=None
+)
+
+
+def chosen_plaintexts(key: int, count: int, characteristic: Characteristic = FEAL_4_CHARACTERISTIC, n: int = 4,
+                      seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the ciphertexts of count random plaintext pairs with the input difference of the characteristic.
+
+    Returns two arrays c0 and c1 where c1[i] is the ciphertext of the plaintext of c0[i] XOR the plaintext difference.
+    """
+    p = np.frombuffer(np.random.default_rng(seed).bytes(8 * count), dtype=np.uint64).copy()
+    return encrypt_many(key, p, n), encrypt_many(key, p ^ np.uint64(characteristic.plaintext_difference), n)
+
+
+def right_pairs(c0: np.ndarray, c1: np.ndarray, characteristic: Characteristic) -> np.ndarray:
+    """Return a boolean mask of the pairs whose ciphertext difference is consistent with the characteristic.
+
+    The difference of the right half before the last round is the difference of the left half of the last round
+    which is ΔL4 = ΔCL ^ ΔCR.
+    """
+    if characteristic.right_difference is None:
+        return np.ones(len(c0), dtype=bool)
+    d = c0 ^ c1
+    return ((d >> np.uint64(32)) ^ d) & np.uint64(0xFFFFFFFF) == np.uint64(characteristic.right_difference)
+
+
+def _inner_index(z: np.ndarray) -> np.ndarray:
+    """Return the index (z0 ^ z1) << 8 | (z2 ^ z3) into the fused f-function table."""
+    w = z ^ (z >> np.uint32(8))
+    return ((w >> np.uint32(8)) & np.uint32(0xFF00)) | (w & np.uint32(0xFF))
+
+
+def _inner_key_guesses(z0: np.ndarray, z1: np.ndarray, target: np.ndarray, early: int,
+                       slack: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the surviving guesses of the inner key bytes k1 k2 and their counts.
+
+    The pairs are checked in batches of `early` pairs. After each batch, only the guesses whose count is at most
+    `slack` below the highest count are kept and checked against the remaining pairs.
+    """
+    f_table = _np_tables()[2]
+    v0, v1 = _inner_index(z0), _inner_index(z1)
+    target = target & np.uint32(0x00FFFF00)
+    guesses = np.arange(2 ** 16, dtype=np.uint32)
+    counts = np.zeros(2 ** 16, dtype=np.int64)
+    for start in range(0, len(z0), early):
+        end = start + early
+        d = f_table[v0[start:end, None] ^ guesses] ^ f_table[v1[start:end, None] ^ guesses]
+        counts += np.count_nonzero(d == target[start:end, None], axis=0)
+        best = counts >= counts.max() - slack
+        guesses, counts = guesses[best], counts[best]
+    return guesses, counts
+
+
+def _outer_key_counts(z0: np.ndarray, z1: np.ndarray, target: np.ndarray, inner: int,
+                      chunk: int = 4096) -> np.ndarray:
+    """Return the number of pairs consistent with each of the 2^16 guesses of k0 k3 for the given inner bytes k1 k2.
+
+    With k1 k2 known, f0 = S0(z0 ^ k0, f1) only depends on k0 and f3 = S1(z3 ^ k3, f2) only on k3. Thus the counts
+    of all guesses are the product of the (256 x pairs) consistency matrices of k0 and k3.
+    Returns a (256 x 256) matrix indexed by k0 and k3.
+    """
+    s0, s1, f_table = _np_tables()
+    k = np.arange(256, dtype=np.uint32)[:, None]
+    byte = np.uint32(0xFF)
+    counts = np.zeros((256, 256), dtype=np.float64)
+    for start in range(0, len(z0), chunk):
+        a, b, t = z0[start:start + chunk], z1[start:start + chunk], target[start:start + chunk]
+        ta, tb = f_table[_inner_index(a) ^ np.uint32(inner)], f_table[_inner_index(b) ^ np.uint32(inner)]
+        inner_ok = (ta ^ tb) == t & np.uint32(0x00FFFF00)
+        d0 = s0[((a >> np.uint32(24)) ^ k) + (ta >> np.uint32(16))] ^ \
+            s0[((b >> np.uint32(24)) ^ k) + (tb >> np.uint32(16))]
+        d3 = s1[((a & byte) ^ k) + ((ta >> np.uint32(8)) & byte)] ^ \
+            s1[((b & byte) ^ k) + ((tb >> np.uint32(8)) & byte)]
+        ok0 = ((d0 == t >> np.uint32(24)) & inner_ok).astype(np.float32)
+        ok3 = (d3 == t & byte).astype(np.float32)
+        counts += ok0 @ ok3.T
+    return counts.astype(np.int64)
+
+
+def attack(c0: np.ndarray, c1: np.ndarray, characteristic: Characteristic = FEAL_4_CHARACTERISTIC,
+           early: int = 16, max_candidates: int = 64, slack: int = 0) -> List[Candidate]:
+    """Recover the effective last round key of FEAL-NX from ciphertext pairs of chosen plaintext pairs.
+
+    The plaintexts of c0 and c1 must have the plaintext difference of the characteristic which must hold for the
+    first N-1 rounds.
+    Guesses of the inner key bytes which fall more than slack below the best count are discarded early. The right key
+    survives if at most slack of the pairs are wrong pairs, thus slack = 0 is only safe for characteristics which hold
+    with probability one such as FEAL_4_CHARACTERISTIC.
+    Returns the candidates for the effective last round key which are consistent with the most right pairs together
+    with this number, ordered by key and truncated to max_candidates. Because of equivalent keys, more than one
+    candidate can be consistent with all pairs; with few pairs, many candidates are and the right key may be cut off.
+    Returns an empty list if no guess is consistent with any pair.
+    Raises error if slack is negative or max_candidates is not positive.
+    """
+    if slack < 0:
+        raise ValueError("slack must not be negative")
+    if max_candidates < 1:
+        raise ValueError("max_candidates must be positive")
+    c0, c1 = np.asarray(c0, dtype=np.uint64), np.asarray(c1, dtype=np.uint64)
+    if c0.shape != c1.shape or len(c0) == 0:
+        raise ValueError("ciphertext arrays must be non-empty and of same length")
+    right = right_pairs(c0, c1, characteristic)
+    c0, c1 = c0[right], c1[right]
+    if len(c0) == 0:
+        raise ValueError("no right pairs found")
+    half = np.uint64(32)
+    # input of the last f-function (up to the post-processing whitening which is part of the effective key)
+    z0 = ((c0 >> half) ^ c0).astype(np.uint32)
+    z1 = ((c1 >> half) ^ c1).astype(np.uint32)
+    target = ((c0 ^ c1) >> half).astype(np.uint32) ^ np.uint32(characteristic.left_difference)
+
+    inner_guesses, inner_counts = _inner_key_guesses(z0, z1, target, early, slack)
+    if inner_counts.max() == 0:
+        # no guess of k1 k2 is consistent with any pair, thus no full key can be either
+        return []
+    # candidates have to be consistent with at least one pair
+    best, candidates = 1, []
+    for inner in inner_guesses:
+        counts = _outer_key_counts(z0, z1, target, int(inner))
+        if counts.max() < best:
+            continue
+        if counts.max() > best:
+            best, candidates = counts.max(), []
+        candidates += [Candidate((int(k0) << 24) | (int(inner) << 8) | int(k3), int(best))
+                       for k0, k3 in np.argwhere(counts == best)]
+    return sorted(candidates)[:max_candidates]
@@ -0,0 +1,47 @@
+"""Helpers shared by the attacks on FEAL-NX.
+
+The subkeys which are XORed into the input of the first or last f-function during pre- or post-processing can not
+be separated from the 16-bit round subkey by looking at a single round. Together they form a 32-bit effective key
+k = k0 k1 k2 k3 for which
+
+    f(u ^ b, K) = f'(u, k)    with    k0 = b0,  k1 = b0 ^ b1 ^ K0,  k2 = b2 ^ b3 ^ K1,  k3 = b3
+
+where b is the XOR of the pre- or post-processing subkeys and K = K0 K1 is the round subkey.
+"""
+import numpy as np  # type: ignore
+
+# noinspection PyProtectedMember
+from ciphers.block.feal import key_schedule_int, _f_many
+
+
+def effective_key(b: int, subkey: int) -> int:
+    """Return the effective key of f' for the 32-bit whitening b and the 16-bit round subkey."""
+    b0, b1, b2, b3 = b >> 24, (b >> 16) & 0xFF, (b >> 8) & 0xFF, b & 0xFF
+    return (b0 << 24) | ((b0 ^ b1 ^ (subkey >> 8)) << 16) | ((b2 ^ b3 ^ (subkey & 0xFF)) << 8) | b3
+
+
+def first_round_key(key: int, n: int = 4) -> int:
+    """Return the effective key of the first f-function of FEAL-NX with the given 128-bit key.
+
+    The input of the first f-function is PL ^ PR ^ b where b is the XOR of both halves of the pre-processing key.
+    """
+    sk = key_schedule_int(key, n)
+    return effective_key(((sk[n] ^ sk[n + 2]) << 16) | (sk[n + 1] ^ sk[n + 3]), sk[0])
+
+
+def last_round_key(key: int, n: int = 4) -> int:
+    """Return the effective key of the last f-function of FEAL-NX with the given 128-bit key.
+
+    The input of the last f-function is CL ^ CR ^ b where b is the XOR of both halves of the post-processing key.
+    """
+    sk = key_schedule_int(key, n)
+    return effective_key(((sk[n + 4] ^ sk[n + 6]) << 16) | (sk[n + 5] ^ sk[n + 7]), sk[n - 1])
+
+
+def f_effective(u: np.ndarray, key: int) -> np.ndarray:
+    """Vectorized f'(u, k) of FEAL-NX with the 32-bit effective key.
+
+    Uses that f'(u, k) = f(u ^ (k0, k0 ^ k1, k2 ^ k3, k3), 0).
+    """
+    k0, k1, k2, k3 = key >> 24, (key >> 16) & 0xFF, (key >> 8) & 0xFF, key & 0xFF
+    return _f_many(u ^ np.uint32((k0 << 24) | ((k0 ^ k1) << 16) | ((k2 ^ k3) << 8) | k3), np.uint32(0))
@@ -0,0 +1 @@
+"""Module for linear cryptanalysis attacks."""
@@ -0,0 +1,165 @@
+"""Linear cryptanalysis of reduced-round FEAL-NX.
+
+Implements a known-plaintext attack in the style of Matsui on FEAL-NX with N=4 (and the trivial N=2) rounds.
+
+Notation:
+    A 32-bit word a consists of the bytes a0 a1 a2 a3 where a0 is the most significant byte.
+    Bits are numbered from 0 (least significant) to 31 (most significant).
+    S_m(a) denotes the parity of the bits of a selected by the mask m.
+
+The linear approximations of the f-function used here hold with probability one. They follow from the fact that the
+least significant bit of a + b + i is a[0] ^ b[0] ^ i which ends up at bit 2 of the S-Box output after the rotation:
+
+    S_{26,10}(f(a, b))     = S_{24,8,0}(a) ^ c
+    S_{18}(f(a, b))        = S_{24,16,8,0}(a) ^ c
+    S_{26,18,10}(f(a, b))  = S_{16}(a) ^ c
+
+The constants c only depend on the 16-bit subkey b.
+
+The pre-processing of FEAL-NX XORs unknown subkeys into the input of the first f-function. Together with the round
+subkey they form the 32-bit effective first round key k = k0 k1 k2 k3 (see cryptanalysis.feal):
+
+    f(R0, K0) = f'(PL ^ PR, k)    with    x = u0 ^ u1 ^ k1,  y = u2 ^ u3 ^ k2,
+                                          f1 = S1(x, y),  f2 = S0(y, f1),  f0 = S0(u0 ^ k0, f1),  f3 = S1(u3 ^ k3, f2)
+
+Chaining the approximations over rounds 2 to N leads to an equation between plaintext, ciphertext and
+S_m(f'(PL ^ PR, k)) which holds for every pair if the guessed k is right. The attack first guesses the 16 bits k1 k2
+which are the only key bits the third approximation depends on, then the remaining 16 bits k0 k3.
+"""
+from typing import NamedTuple, Tuple, List, Optional, Sequence
+
+import numpy as np  # type: ignore
+
+# noinspection PyProtectedMember
+from ciphers.block.feal import encrypt_many, _f_many, _np_tables
+from cryptanalysis.feal import f_effective
+from cryptanalysis.walsh import fwht, parity
+
+Approximation = NamedTuple('Approximation', [('input_mask', int), ('output_mask', int)])
+Candidate = NamedTuple('Candidate', [('key', int), ('bias', float)])
+
+APPROXIMATIONS: Sequence[Approximation] = (
+    Approximation(input_mask=0x01000101, output_mask=0x04000400),
+    Approximation(input_mask=0x01010101, output_mask=0x00040000),
+    Approximation(input_mask=0x00010000, output_mask=0x04040400),
+)
+
+
+def approximation_bias(approximation: Approximation, subkey: int = 0x0, count: int = 2 ** 16,
+                       seed: Optional[int] = None) -> float:
+    """Return the bias of the linear approximation of the f-function with the given 16-bit subkey.
+
+    The bias is measured over count random inputs; it is 0.5 for approximations which hold with probability one.
+    """
+    a = np.random.default_rng(seed).integers(0, 2 ** 32, size=count, dtype=np.uint32)
+    out = _f_many(a, np.uint32(subkey))
+    bits = parity(a & np.uint32(approximation.input_mask)) ^ parity(out & np.uint32(approximation.output_mask))
+    return abs(float(bits.mean()) - 0.5)
+
+
+def known_plaintexts(key: int, count: int, n: int = 4, seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Return count random plaintexts and their ciphertexts under FEAL-NX with the given key and round number."""
+    p = np.frombuffer(np.random.default_rng(seed).bytes(8 * count), dtype=np.uint64).copy()
+    return p, encrypt_many(key, p, n)
+
+
+def _equation_parity(approximation: Approximation, u: np.ndarray, pl: np.ndarray, ln: np.ndarray, rn: np.ndarray,
+                     n: int) -> np.ndarray:
+    """Return the known side of the attack equation for each pair.
+
+    N=2:    S_in(PL ^ LN) = S_in(f'(u, k)) ^ c
+    N=4:    S_in(PL ^ LN) ^ S_out(u ^ RN) = S_in(f'(u, k)) ^ c
+    """
+    t = parity((pl ^ ln) & np.uint32(approximation.input_mask))
+    if n == 4:
+        t ^= parity((u ^ rn) & np.uint32(approximation.output_mask))
+    return t
+
+
+def _inner_key_scores(u: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Return the correlation of the equation for all 2^16 guesses of the inner key bytes k1 k2.
+
+    The guessed bit S_16(f'(u, k)) = f1[0] only depends on the index v = (u0 ^ u1) << 8 | (u2 ^ u3) XOR k1 << 8 | k2.
+    Thus the pairs are counted per index and the correlation over all guesses is a XOR-convolution of the counter
+    array with the guessed bit which is computed with the Walsh-Hadamard transform.
+    """
+    _, s1, _ = _np_tables()
+    mask = np.uint32(0xFF)
+    v = ((((u >> np.uint32(24)) ^ (u >> np.uint32(16))) & mask) << np.uint32(8)) | ((u ^ (u >> np.uint32(8))) & mask)
+    counts = np.bincount(v[t == 0], minlength=2 ** 16) - np.bincount(v[t == 1], minlength=2 ** 16)
+    w = np.arange(2 ** 16)
+    g = 1 - 2 * (s1[(w >> 8) + (w & 0xFF)] & 1).astype(np.int64)
+    return fwht(fwht(counts) * fwht(g)) // 2 ** 16
+
+
+def _inner_bytes(u: np.ndarray, inner: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the inner output bytes f1 and f2 of f'(u, k) which only depend on the inner key bytes k1 k2."""
+    s0, s1, _ = _np_tables()
+    mask = np.uint32(0xFF)
+    x = ((u >> np.uint32(24)) ^ (u >> np.uint32(16)) ^ np.uint32(inner >> 8)) & mask
+    y = ((u >> np.uint32(8)) ^ u ^ np.uint32(inner & 0xFF)) & mask
+    f1 = s1[x + y]
+    return f1, s0[y + f1]
+
+
+def _outer_key_guesses(u: np.ndarray, t: np.ndarray, inner: int) -> Tuple[int, np.ndarray]:
+    """Return the maximal absolute correlation over all guesses of the outer key bytes k0 k3 and the best guesses.
+
+    The guessed bits are S_{24,8,0}(f'(u, k)) = f0[0] ^ f2[0] ^ f3[0] where f0[0] only depends on k0 and f3[0] only
+    on k3 (given k1 k2). Thus the correlation of all 2^16 guesses is a product of a (256 x pairs) and a (pairs x 256)
+    matrix.
+    """
+    s0, s1, _ = _np_tables()
+    f1, f2 = _inner_bytes(u, inner)
+    t = t ^ (f2 & np.uint32(1)).astype(np.uint8)
+    k = np.arange(256, dtype=np.uint32)[:, None]
+    h0 = s0[((u >> np.uint32(24)) ^ k) + f1] & np.uint32(1)
+    h3 = s1[((u & np.uint32(0xFF)) ^ k) + f2] & np.uint32(1)
+    a0 = (1 - 2 * h0.astype(np.float32)) * (1 - 2 * t.astype(np.float32))
+    a3 = 1 - 2 * h3.astype(np.float32)
+    scores = np.abs(a0 @ a3.T)
+    best = scores.max()
+    return int(best), np.argwhere(scores == best)
+
+
+def _correlation(u: np.ndarray, t: np.ndarray, key: int) -> int:
+    """Return the correlation of the attack equation over all pairs for the given effective first round key."""
+    guessed = parity(f_effective(u, key) & np.uint32(APPROXIMATIONS[0].input_mask))
+    return len(t) - 2 * int(np.count_nonzero(t ^ guessed))
+
+
+def attack(plaintexts: np.ndarray, ciphertexts: np.ndarray, n: int = 4, early: int = 4096) -> List[Candidate]:
+    """Recover the effective first round key of FEAL-NX from known plaintext/ciphertext pairs.
+
+    Returns the candidates for the effective first round key (see cryptanalysis.feal) with their bias,
+    best candidates first.
+    Because the f-function has equivalent keys, more than one candidate can reach the maximal bias of 0.5.
+    Raises error if the round number is not 2 or 4 since there are no approximations with probability one for more
+    rounds.
+    """
+    if n not in [2, 4]:
+        raise ValueError("linear attack is only implemented for 2 and 4 rounds.")
+    plaintexts, ciphertexts = np.asarray(plaintexts, dtype=np.uint64), np.asarray(ciphertexts, dtype=np.uint64)
+    if plaintexts.shape != ciphertexts.shape or len(plaintexts) == 0:
+        raise ValueError("plaintexts and ciphertexts must be non-empty arrays of same length")
+    half = np.uint64(32)
+    pl, pr = (plaintexts >> half).astype(np.uint32), plaintexts.astype(np.uint32)
+    cl, cr = (ciphertexts >> half).astype(np.uint32), ciphertexts.astype(np.uint32)
+    u, ln, rn = pl ^ pr, cl ^ cr, cl
+    total = 2 * len(u)
+
+    inner_scores = np.abs(_inner_key_scores(u, _equation_parity(APPROXIMATIONS[2], u, pl, ln, rn, n)))
+    t = _equation_parity(APPROXIMATIONS[0], u, pl, ln, rn, n)
+    # score the outer key guesses on the first pairs only and drop inner guesses which can not reach the best score
+    guesses = [(inner, *_outer_key_guesses(u[:early], t[:early], int(inner)))
+               for inner in np.flatnonzero(inner_scores == inner_scores.max())]
+    best = max(score for _, score, _ in guesses)
+    candidates = []
+    for inner, score, outer in guesses:
+        if score < best:
+            continue
+        for k0, k3 in outer:
+            key = (int(k0) << 24) | (int(inner) << 8) | int(k3)
+            correlation = min(int(inner_scores[inner]), abs(_correlation(u, t, key)))
+            candidates.append(Candidate(key, correlation / total))
+    return sorted(candidates, key=lambda c: -c.bias)
@@ -0,0 +1,163 @@
+"""Exports functions which compute the cryptanalytic tables of S-Boxes.
+
+An S-Box with n-bit input and m-bit output is given as sequence of its 2^n outputs.
+
+- DDT:  difference distribution table, DDT[a, b] = #{x | S(x) ^ S(x ^ a) = b}
+- LAT:  linear approximation table, LAT[a, b] = #{x | a·x = b·S(x)} - 2^(n-1)
+- BCT:  boomerang connectivity table, BCT[a, b] = #{x | S^-1(S(x) ^ b) ^ S^-1(S(x ^ a) ^ b) = a}
+
+The LAT is computed with the fast Walsh-Hadamard transform of the S-Box' graph in O(2^n * n) per output mask.
+Since the DDT is the (scaled) Walsh-Hadamard transform of the squared LAT, it is computed the same way instead of
+counting all 4^n input pairs. This takes milliseconds for 8-bit S-Boxes but about 2 s for 16-to-8-bit S-Boxes; the
+DDT of the 16-bit FEAL S-Boxes is computed from their structure with feal_ddt instead.
+"""
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np  # type: ignore
+
+# noinspection PyProtectedMember
+from ciphers.block.feal import _f_table, _s_table
+from cryptanalysis.walsh import fwht
+
+
+def _sbox_array(sbox: Sequence[int], m: Optional[int] = None) -> np.ndarray:
+    """Return the S-Box as int64 array. Raises error if its size is not a power of two or an output exceeds m bits."""
+    s = np.asarray(sbox, dtype=np.int64)
+    if s.ndim != 1 or len(s) == 0 or len(s) & (len(s) - 1) != 0:
+        raise ValueError("S-Box must have 2^n entries.")
+    if m is not None and (s.min() < 0 or s.max() >= 2 ** m):
+        raise ValueError("S-Box outputs must be {}-bit.".format(m))
+    return s
+
+
+def _output_bits(s: np.ndarray, m: Optional[int]) -> int:
+    """Return the output size of the S-Box in bits; defaults to the input size if outputs fit into it."""
+    if m is None:
+        m = max(int(s.max()).bit_length(), (len(s) - 1).bit_length())
+    return m
+
+
+def walsh_spectrum(sbox: Sequence[int], m: Optional[int] = None) -> np.ndarray:
+    """Return the Walsh spectrum W[a, b] = sum((-1) ** (a·x ^ b·S(x)) for x in range(2^n)) of the S-Box.
+
+    m is the output size in bits; defaults to the input size n (or more if outputs do not fit into n bits).
+    """
+    s = _sbox_array(sbox, m)
+    m = _output_bits(s, m)
+    # signs[y, b] = (-1) ** (b·y) which is the Walsh-Hadamard transform of the output y
+    signs = fwht(np.identity(2 ** m, dtype=np.int32))
+    # column b of signs[S] is the component function b·S(x) in ±1 notation
+    return fwht(signs[s], axis=0)
+
+
+def lat(sbox: Sequence[int], m: Optional[int] = None) -> np.ndarray:
+    """Return the linear approximation table of the S-Box as (2^n x 2^m) array. See walsh_spectrum for m."""
+    return walsh_spectrum(sbox, m) // 2
+
+
+def ddt(sbox: Sequence[int], m: Optional[int] = None) -> np.ndarray:
+    """Return the difference distribution table of the S-Box as (2^n x 2^m) array. See walsh_spectrum for m."""
+    w = walsh_spectrum(sbox, m).astype(np.int64)
+    return fwht(fwht(w * w, axis=1), axis=0) // w.size
+
+
+def differential_uniformity(sbox: Sequence[int], m: Optional[int] = None) -> int:
+    """Return the highest entry of the difference distribution table for a non-zero input difference."""
+    return int(ddt(sbox, m)[1:].max())
+
+
+def bct(sbox: Sequence[int]) -> np.ndarray:
+    """Return the boomerang connectivity table of the S-Box as (2^n x 2^n) array.
+
+    Raises error if the S-Box is not a permutation since the BCT is only defined for invertible S-Boxes.
+    """
+    s = _sbox_array(sbox)
+    size = len(s)
+    if not np.array_equal(np.sort(s), np.arange(size)):
+        raise ValueError("S-Box must be a permutation.")
+    inverse = np.empty(size, dtype=np.int64)
+    inverse[s] = np.arange(size)
+    x = np.arange(size)
+    a = x[:, None]
+    table = np.empty((size, size), dtype=np.int64)
+    for b in range(size):
+        # y[x] = S^-1(S(x) ^ b), thus BCT[a, b] counts y[x] ^ y[x ^ a] = a
+        y = inverse[s ^ b]
+        table[:, b] = np.count_nonzero(y[x] ^ y[x ^ a] == a, axis=1)
+    return table
+
+
+def feal_sbox(i: int, b: Optional[int] = None) -> np.ndarray:
+    """Return the FEAL S-Box S_i as lookup array.
+
+    If b is None, the S-Box is returned as 16-bit to 8-bit S-Box indexed by (a << 8) | b.
+    Else, the 8-bit S-Box a -> S_i(a, b) with the fixed second input b is returned which is how S-Boxes are used with
+    a known input byte in the f-function (for example f0 = S0(a0, f1)).
+    """
+    table = np.array(_s_table(i), dtype=np.int64)
+    a = np.arange(256)
+    if b is None:
+        return table[(a[:, None] + a[None, :]).ravel()]
+    return table[a + b]
+
+
+def feal_f_component(j: int) -> np.ndarray:
+    """Return the inner output byte f_j (j = 1 or 2) of the FEAL f-function as 16-bit to 8-bit S-Box.
+
+    The S-Box is indexed by (x << 8) | y with x = a0 ^ a1 ^ b0 and y = a2 ^ a3 ^ b1, thus f1 = S1(x, y) and
+    f2 = S0(y, S1(x, y)). The outer bytes f0 = S0(a0, f1) and f3 = S1(a3, f2) are S-Boxes with a known input byte,
+    see feal_sbox.
+    Raises error if j is not 1 or 2.
+    """
+    if j not in (1, 2):
+        raise ValueError("j must be 1 or 2.")
+    return (np.array(_f_table(), dtype=np.int64) >> (8 * (3 - j))) & 0xFF
+
+
+@lru_cache(maxsize=None)
+def _carry_matrices() -> np.ndarray:
+    """Return the transition counts of the carries of a + b and (a ^ α) + (b ^ β) for one bit position.
+
+    Entry [d, s, t] with d = (α << 2) | (β << 1) | γ counts the input bits a, b which lead from the carry state
+    s = (c << 1) | c' to t for the output difference bit γ = α ^ β ^ c ^ c'.
+    """
+    m = np.zeros((8, 4, 4), dtype=np.float32)
+    for d in range(8):
+        alpha, beta, gamma = d >> 2, (d >> 1) & 1, d & 1
+        for c in range(2):
+            for c_ in range(2):
+                if alpha ^ beta ^ c ^ c_ != gamma:
+                    continue
+                for a in range(2):
+                    for b in range(2):
+                        a_, b_ = a ^ alpha, b ^ beta
+                        carry = (a & b) | (a & c) | (b & c)
+                        carry_ = (a_ & b_) | (a_ & c_) | (b_ & c_)
+                        m[d, (c << 1) | c_, (carry << 1) | carry_] += 1
+    return m
+
+
+def feal_ddt(i: int) -> np.ndarray:
+    """Return the difference distribution table of the 16-bit to 8-bit FEAL S-Box S_i as (2^16 x 2^8) array.
+
+    Same as ddt(feal_sbox(i), m=8) but several times faster: since S_i(a, b) = rot2(a + b + i) and the rotation is
+    linear, DDT[(α << 8) | β, rot2(γ)] is the number of inputs with (a + b + i) ^ ((a ^ α) + (b ^ β) + i) = γ. The
+    carries of both additions form a 4-state automaton, thus the counts of all (α, β, γ) are products of the
+    transition matrices of their bits.
+    Raises error if i is not 0 or 1.
+    """
+    if i not in (0, 1):
+        raise ValueError("i must be 0 or 1.")
+    m = _carry_matrices()
+    # w[s, (d_k, ..., d_7)] counts the inputs of bits k to 7 from carry state s on, most significant digit d_k first
+    step = m.transpose(1, 0, 2).reshape(32, 4)
+    w = np.ones((4, 1), dtype=np.float32)
+    for _ in range(7):
+        w = (step @ w).reshape(4, -1)
+    # both additions start with the carry i
+    counts = m[:, 3 * i, :] @ w
+    # split the digits into the bits α_k, β_k, γ_k and order them as (α, β, rot2(γ)), most significant bit first
+    axes = [3 * k for k in reversed(range(8))] + [3 * k + 1 for k in reversed(range(8))] + \
+        [3 * ((k - 2) % 8) + 2 for k in reversed(range(8))]
+    return counts.reshape((2, 2, 2) * 8).transpose(axes).reshape(2 ** 16, 2 ** 8).astype(np.int64)
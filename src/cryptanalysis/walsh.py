@@ -0,0 +1,44 @@
+"""Exports the fast Walsh-Hadamard transform and vectorized parity computations used during cryptanalysis."""
+import numpy as np  # type: ignore
+
+
+def fwht(a: np.ndarray, axis: int = 0) -> np.ndarray:
+    """Return the (unnormalized) fast Walsh-Hadamard transform of the array along the given axis.
+
+    Computes
+        W[u] = sum((-1) ** parity(u & x) * a[x] for x in range(len(a)))
+    in O(2^n * n) instead of O(4^n). Applying the transform twice multiplies the input by its length.
+    The input is not modified. Signed integer and float input keep their type, other input is transformed with
+    int64 arithmetic. The caller must make sure that the transformed values fit into the type.
+    Raises error if the length of the axis is not a power of two.
+    """
+    a = np.asarray(a)
+    dtype = a.dtype if np.issubdtype(a.dtype, np.signedinteger) or np.issubdtype(a.dtype, np.floating) else np.int64
+    w = np.ascontiguousarray(np.moveaxis(a, axis, 0), dtype=dtype).copy()
+    size = w.shape[0]
+    if size == 0 or size & (size - 1) != 0:
+        raise ValueError("length must be a power of two")
+    # butterfly steps alternate between two buffers to avoid temporary arrays
+    out = np.empty_like(w)
+    h = 1
+    while h < size:
+        # view the arrays as blocks of pairs (x, x + h) which are combined in one butterfly step
+        v = w.reshape(size // (2 * h), 2, h, -1)
+        o = out.reshape(size // (2 * h), 2, h, -1)
+        np.add(v[:, 0], v[:, 1], out=o[:, 0])
+        np.subtract(v[:, 0], v[:, 1], out=o[:, 1])
+        w, out = out, w
+        h *= 2
+    return np.moveaxis(w, 0, axis)
+
+
+def parity(x: np.ndarray) -> np.ndarray:
+    """Return the parity of the set bits of each (up to 64-bit) integer in the array.
+
+    Example:
+        parity(np.array([0b1011, 0b11])) -> array([1, 0])
+    """
+    x = np.array(x, dtype=np.uint64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        x ^= x >> np.uint64(shift)
+    return (x & np.uint64(1)).astype(np.uint8)
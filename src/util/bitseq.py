@@ -1,5 +1,5 @@
 """Utility functions to create bitstrings."""
-from typing import Union, Tuple, Sequence
+from typing import Any, Iterable, List, Union, Tuple, Sequence
 
 from bitstring import Bits
 
@@ -41,6 +41,59 @@ def bitseq_split(size: int, b: Bits, n=None, formatter=lambda b: b) -> Union[Bit
         return split
 
 
+def bitseq_from_int(value: int, bit: int) -> Bits:
+    """Create a bit-bitstring out of the integer.
+
+    Fast path which builds the bitstring from the big-endian bytes of the integer instead of parsing a format string.
+    Raises error if the integer is negative or does not fit into bit bits.
+    """
+    if value < 0 or value >> bit:
+        raise ValueError("{} does not fit into {} bits.".format(value, bit))
+    # the bits which pad the integer to whole bytes are skipped by the offset
+    return Bits(bytes=value.to_bytes((bit + 7) // 8, 'big'), offset=-bit % 8)
+
+
+def _bitseq_from_ints(values: Sequence[int], bits: Sequence[int]) -> Bits:
+    """Create a bitstring out of the integers, each one with the corresponding number of bits.
+
+    Raises error if an integer is negative or does not fit into its number of bits.
+    """
+    if all(bit % 8 == 0 for bit in bits):
+        try:
+            return Bits(bytes=b''.join(value.to_bytes(bit // 8, 'big') for value, bit in zip(values, bits)))
+        except OverflowError:
+            raise ValueError("integers must be non-negative and fit into their number of bits.")
+    r = 0
+    for value, bit in zip(values, bits):
+        if value < 0 or value >> bit:
+            raise ValueError("{} does not fit into {} bits.".format(value, bit))
+        r = (r << bit) | value
+    return bitseq_from_int(r, sum(bits))
+
+
+def _flatten(args: Sequence[Any]) -> List[Any]:
+    """Return the arguments with the elements of tuple arguments in place of the tuples."""
+    flat: List[Any] = []
+    for arg in args:
+        if isinstance(arg, tuple):
+            flat.extend(arg)
+        else:
+            flat.append(arg)
+    return flat
+
+
+def bitseq_join(blocks: Iterable[Bits]) -> Bits:
+    """Concatenate the bitstrings in linear time of the total length.
+
+    Replacement for sum(blocks), which copies the accumulated bitstring on every addition.
+    Bitstrings of whole bytes are joined as bytes; otherwise they are appended bitwise.
+    """
+    blocks = list(blocks)
+    if all(len(b) % 8 == 0 for b in blocks):
+        return Bits(bytes=b''.join(b.bytes for b in blocks))
+    return Bits().join(blocks)
+
+
 def fhex(b: Bits) -> str:
     """Return full hex string representation of Bits. Workaround for truncation issue in Bits.__str__."""
     if len(b) % 4 != 0:
@@ -53,22 +106,8 @@ def bitseq_from_str(*args: Union[Tuple[str, ...], str], bit: int = None) -> Bits
 
     The bits of each string argument will be calculated.
     """
-    argstr = ""
-
-    def add_to_argstr(argstr_: str, arg_to_add: str) -> str:
-        bit_ = bit or count_int_str_bits(arg_to_add)
-        argstr_ += "uint:{}={},".format(bit_, int(arg_to_add, 0))
-        return argstr_
-
-    for arg in args:
-        if isinstance(arg, tuple):
-            for tuple_arg in arg:
-                argstr = add_to_argstr(argstr, tuple_arg)
-        else:
-            argstr = add_to_argstr(argstr, arg)
-
-    argstr = argstr[:-1]
-    return Bits(argstr)
+    strs = _flatten(args)
+    return _bitseq_from_ints([int(arg, 0) for arg in strs], [bit or count_int_str_bits(arg) for arg in strs])
 
 
 def littleendian(b: Bits) -> Bits:
@@ -78,28 +117,15 @@ def littleendian(b: Bits) -> Bits:
         littleendian(Bits("0x123456")) -> Bits("0x563412")
         littleendian(Bits("0x1234")) -> Bits("0x3412")
     """
-    le = b.uintle
-    return Bits("uint:{}={}".format(len(b), le))
+    return bitseq_from_int(b.uintle, len(b))
 
 
 def bitseq(*args: Union[Tuple[Union[int, Bits], ...], int, Bits], bit: int) -> Bits:
     """Create a bitstring out of n-bitstring from integer arguments."""
-    argstr = ""
-
-    def add_to_argstr(argstr_: str, arg_to_add: Union[int, Bits]) -> str:
-        if isinstance(arg_to_add, Bits):
-            arg_to_add = arg_to_add.uint
-        argstr_ += "uint:{}={},".format(bit, int(arg_to_add))
-        return argstr_
-
-    for arg in args:
-        if isinstance(arg, tuple):
-            for tuple_arg in arg:
-                argstr = add_to_argstr(argstr, tuple_arg)
-        else:
-            argstr = add_to_argstr(argstr, arg)
-    argstr = argstr[:-1]
-    return Bits(argstr)
+    values = [arg.uint if isinstance(arg, Bits) else int(arg) for arg in _flatten(args)]
+    if len(values) == 1:
+        return bitseq_from_int(values[0], bit)
+    return _bitseq_from_ints(values, [bit] * len(values))
 
 
 def bitseq8(*args: Union[Tuple[Union[int, Bits], ...], int, Bits]) -> Bits:
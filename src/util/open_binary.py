@@ -0,0 +1,14 @@
+"""Exports function to open files or the standard streams in binary mode."""
+import sys
+from contextlib import nullcontext
+from typing import BinaryIO, ContextManager
+
+
+def open_binary(path: str, mode: str) -> ContextManager[BinaryIO]:
+    """Open the file in binary mode ('rb' or 'wb').
+
+    '-' refers to stdin when reading and to stdout when writing; the standard streams are not closed on exit.
+    """
+    if path == '-':
+        return nullcontext(sys.stdin.buffer if mode == 'rb' else sys.stdout.buffer)
+    return open(path, mode)
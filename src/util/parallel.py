@@ -0,0 +1,104 @@
+"""Exports functions and a pool to generate counter-indexed keystream blocks on several processes."""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Tuple
+
+KeystreamFunction = Callable[..., bytes]
+
+
+def _keystream_worker(fn: KeystreamFunction, args: Tuple[Any, ...], first: int, count: int, name: str,
+                      offset: int) -> None:
+    """Write the keystream blocks first, ..., first + count - 1 into the shared memory at the offset."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        stream = fn(*args, first, count)
+        shm.buf[offset:offset + len(stream)] = stream
+    finally:
+        shm.close()
+
+
+class KeystreamPool:
+    """Worker processes and shared memory buffer which generate keystream blocks across many calls.
+
+    The processes are started on the first call and the buffer only grows, thus en-/decrypting a stream chunk by
+    chunk pays the start-up cost once. Use as context manager or call close.
+    """
+
+    def __init__(self, workers: int):
+        """Prepare the pool for the number of workers; with a single worker, the keystream is generated in-process.
+
+        Raises error if workers is smaller than 1.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    def __enter__(self) -> 'KeystreamPool':
+        """Return the pool."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the pool."""
+        self.close()
+
+    def _buffer(self, size: int) -> shared_memory.SharedMemory:
+        """Return a shared memory buffer of at least size bytes."""
+        if self._shm is None or self._shm.size < size:
+            self._release_buffer()
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        return self._shm
+
+    def _release_buffer(self) -> None:
+        """Close and remove the shared memory buffer."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def keystream(self, fn: KeystreamFunction, args: Tuple[Any, ...], first: int, count: int,
+                  block_size: int) -> bytes:
+        """Generate count keystream blocks starting at counter first on the worker processes.
+
+        fn(*args, first, count) must return the keystream of the counter range as bytes and must be picklable,
+        i.e. defined at module level. The counter range is split evenly among the workers and each worker writes
+        its keystream directly into the shared memory buffer so that no keystream is pickled back to this process.
+        """
+        if count == 0:
+            return b''
+        if self.workers == 1:
+            return fn(*args, first, count)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        size = count * block_size
+        shm = self._buffer(size)
+        chunk = -(-count // self.workers)
+        futures = [
+            self._executor.submit(_keystream_worker, fn, args, first + i, min(chunk, count - i), shm.name,
+                                  i * block_size)
+            for i in range(0, count, chunk)
+        ]
+        for future in futures:
+            # re-raise errors of the workers
+            future.result()
+        return bytes(shm.buf[:size])
+
+    def close(self) -> None:
+        """Shut down the worker processes and remove the shared memory buffer."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release_buffer()
+
+
+def parallel_keystream(fn: KeystreamFunction, args: Tuple[Any, ...], first: int, count: int, block_size: int,
+                       workers: int) -> bytes:
+    """Generate count keystream blocks starting at counter first on the given number of worker processes.
+
+    Starts and stops the worker processes for this single call; use a KeystreamPool to generate the keystream of
+    many calls. See KeystreamPool.keystream for the requirements on fn.
+    Raises error if workers is smaller than 1.
+    """
+    with KeystreamPool(workers) as pool:
+        return pool.keystream(fn, args, first, count, block_size)
@@ -0,0 +1,108 @@
+"""Exports a buffered cryptographically secure random number generator based on the ChaCha20 keystream.
+
+The generator is seeded once with a 256-bit key from os.urandom and serves random bytes from a buffer of ChaCha20
+keystream. Every refill of the buffer uses the first 32 bytes of the fresh keystream as the next key and discards
+them (fast key erasure), so earlier outputs can not be recovered from the state of the generator.
+
+The module functions use a shared generator which is reseeded from os.urandom in forked child processes so that
+worker processes never serve the same bytes.
+"""
+import os
+import threading
+from math import ceil
+from typing import Optional
+
+from bitstring import Bits
+
+# bytes of keystream buffered per refill; a multiple of the 64-byte ChaCha block size
+__RNG_BUFFER_SIZE__ = 2 ** 16
+__RNG_SEED_SIZE__ = 32
+
+
+class ChaChaRandom:
+    """ChaCha20 keystream generator with fast key erasure.
+
+    A seed makes the output reproducible, e.g. for random test data; without a seed the generator is seeded from
+    os.urandom.
+    """
+
+    def __init__(self, seed: Optional[bytes] = None, buffer_size: int = __RNG_BUFFER_SIZE__):
+        """Seed the generator.
+
+        Raises error if seed is not 256-bit or buffer size is not positive.
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer size must be positive.")
+        self._buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self.seed(seed)
+
+    def seed(self, seed: Optional[bytes] = None) -> None:
+        """Reseed the generator and discard the buffered keystream.
+
+        Raises error if seed is not 256-bit.
+        """
+        if seed is None:
+            seed = os.urandom(__RNG_SEED_SIZE__)
+        if len(seed) != __RNG_SEED_SIZE__:
+            raise ValueError("seed must be 256-bit.")
+        with self._lock:
+            self._key, self._buffer, self._position = bytes(seed), b'', 0
+
+    def _refill(self) -> None:
+        """Replace the key and the buffer with fresh keystream of the current key."""
+        # imported here because the ChaCha module itself draws its IVs from this module
+        from ciphers.stream.chacha import chacha_blocks
+        stream = chacha_blocks(Bits(bytes=self._key), Bits(64), 0, ceil((__RNG_SEED_SIZE__ + self._buffer_size) / 64))
+        self._key, self._buffer, self._position = stream[:__RNG_SEED_SIZE__], stream[__RNG_SEED_SIZE__:], 0
+
+    def randbytes(self, n: int) -> bytes:
+        """Return n random bytes.
+
+        Raises error if n is negative.
+        """
+        if n < 0:
+            raise ValueError("n must not be negative.")
+        chunks = []
+        with self._lock:
+            while n > 0:
+                if self._position == len(self._buffer):
+                    self._refill()
+                chunk = self._buffer[self._position:self._position + n]
+                # served bytes are never handed out again
+                self._position += len(chunk)
+                n -= len(chunk)
+                chunks.append(chunk)
+        return b''.join(chunks)
+
+    def randbits(self, k: int) -> int:
+        """Return a random non-negative integer with k random bits.
+
+        Raises error if k is negative.
+        """
+        if k < 0:
+            raise ValueError("k must not be negative.")
+        return int.from_bytes(self.randbytes(ceil(k / 8)), 'little') & ((1 << k) - 1)
+
+
+_rng = ChaChaRandom()
+
+
+def _reseed_after_fork() -> None:
+    """Reseed the shared generator so that a forked child does not serve the bytes buffered by its parent."""
+    # the lock might have been held by another thread of the parent while forking
+    _rng._lock = threading.Lock()
+    _rng.seed()
+
+
+os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
+def randbytes(n: int) -> bytes:
+    """Return n random bytes from the shared generator."""
+    return _rng.randbytes(n)
+
+
+def randbits(k: int) -> int:
+    """Return a random non-negative integer with k random bits from the shared generator."""
+    return _rng.randbits(k)
@@ -1,6 +1,8 @@
 """Exports functions which implement bit rotation."""
 from bitstring import Bits
 
+from util.bitseq import bitseq_from_int
+
 
 def rot_left_bits(bits: Bits, i: int) -> Bits:
     """Bit rotation / Circular shift to the left for bitstring.Bits.
@@ -8,7 +10,7 @@ def rot_left_bits(bits: Bits, i: int) -> Bits:
     Wrapper for rot_left.
     """
     rotated = rot_left(bits.uint, i, len(bits))
-    return Bits("uint:{}={}".format(len(bits), rotated))
+    return bitseq_from_int(rotated, len(bits))
 
 
 def rot_left(bits: int, i: int, max_bit: int) -> int:
@@ -23,6 +25,14 @@ def rot_left(bits: int, i: int, max_bit: int) -> int:
     return ((bits % 2 ** (max_bit - i)) << i) | (bits >> (max_bit - i))
 
 
+def rot_left32(x: int, i: int) -> int:
+    """Bit rotation / Circular shift to the left of a 32-bit word.
+
+    Fast variant of rot_left for the add-rotate-xor ciphers; x is not checked.
+    """
+    return ((x << i) & 0xFFFFFFFF) | (x >> (32 - i))
+
+
 def rot_right(bits: int, i: int, max_bit: int) -> int:
     """Bit rotation / Circular shift to the right.
 
@@ -5,7 +5,11 @@ Tests are structured like this:
 - ciphers:          Tests for modules in src.ciphers
     - feal:         Tests for FEAl-NX implementation,
     - salsa20:      Tests for Salsa20 implementation.
+    - chacha:       Tests for ChaCha implementation.
+    - xsalsa20:     Tests for XSalsa20 implementation.
+    - mac:          Tests for message authentication codes.
     - modi:         Tests for modes of operations.
+- cryptanalysis:    Tests for modules in src.cryptanalysis.
 - dca:              Tests which where written to assert statements in a master thesis. See tests for more information.
 - util:             Tests for util functions.
 
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from bitstring import Bits
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.stream.chacha import chacha
+from test.ciphers.chacha.patchers import iv
+from test.ciphers.sysv_patcher import sysv_patcher
+from util.bitseq import fhex
+
+# all zero key and IV; test vector TC1 for 20 rounds of
+# https://tools.ietf.org/html/draft-strombergson-chacha-test-vectors-00
+key = '0x0'
+keystream = Bits(hex='76b8e0ada0f13d90405d6ae55386bd28bdd219b8a08ded1aa836efcc8b770dc7'
+                     'da41597c5157488d7724e03fb8d84a376a43b8f41518a11cc387b669b2ee6586')
+
+default_encrypt_args = sysv_patcher('chacha', 'encrypt', key=key, text=fhex(Bits(512)))
+default_decrypt_args = sysv_patcher('chacha', 'decrypt', key=key, text=fhex(Bits(64) + keystream))
+
+
+class TestChaChaCommands(unittest.TestCase):
+    @iv(0x0)
+    @default_encrypt_args()
+    def test_integration_chacha_encrypt(self, _):
+        self.assertEqual(chacha(), fhex(Bits(64) + keystream))
+
+    @default_decrypt_args()
+    def test_integration_chacha_decrypt(self):
+        self.assertEqual(chacha(), fhex(Bits(512)))
+
+    @default_decrypt_args('--jobs', '2')
+    def test_integration_chacha_decrypt_jobs(self):
+        self.assertEqual(chacha(), fhex(Bits(512)))
+
+    def test_integration_chacha_utf8_ietf_rounds(self):
+        with mock.patch('sys.argv', ['chacha', 'encrypt', '-v', 'ietf', '-r', '8', '-x', 'utf8', key, 'chacha']):
+            c = chacha()
+        with mock.patch('sys.argv', ['chacha', 'decrypt', '-v', 'ietf', '-r', '8', '-x', 'utf8', key, c]):
+            self.assertEqual(chacha(), 'chacha')
+
+    def test_integration_chacha_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ['plaintext', 'ciphertext', 'decrypted']]
+            with open(paths[0], 'wb') as f:
+                f.write(bytes(range(256)) * 10)
+            for command, src, dst in [('encrypt', paths[0], paths[1]), ('decrypt', paths[1], paths[2])]:
+                with mock.patch('sys.argv', ['chacha', command, '-v', 'ietf', key, '--in', src, '--out', dst]):
+                    self.assertIsNone(chacha())
+            with open(paths[2], 'rb') as f:
+                self.assertEqual(f.read(), bytes(range(256)) * 10)
+
+    @default_encrypt_args('-v', 'foo')
+    def test_integration_chacha_invalid_version(self):
+        self.assertRaises(ValueError, chacha)
@@ -4,7 +4,7 @@ from unittest import mock
 
 def iv(value):
     """Patch for Initialization vector."""
-    return mock.patch('random.randrange', return_value=value)
+    return mock.patch('util.rng.randbits', return_value=value)
 
 
 def initial_counter(value):
@@ -0,0 +1,65 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+from io import BytesIO
+
+from bitstring import Bits
+
+from ciphers.stream.chacha20_poly1305 import poly1305_key_gen, chacha20_poly1305_encrypt, \
+    chacha20_poly1305_decrypt, stream_encrypt, stream_decrypt
+
+
+class TestChaCha20Poly1305(unittest.TestCase):
+    def setUp(self):
+        """2.8.2 Example and Test Vector for AEAD_CHACHA20_POLY1305 @ https://tools.ietf.org/html/rfc7539."""
+        self.k = Bits(bytes=bytes(range(0x80, 0xa0)))
+        self.nonce = Bits(hex='070000004041424344454647')
+        self.aad = Bits(hex='50515253c0c1c2c3c4c5c6c7')
+        self.plaintext = Bits(bytes=b"Ladies and Gentlemen of the class of '99: If I could offer you only one tip "
+                                    b"for the future, sunscreen would be it.")
+        self.ciphertext = Bits(hex=(
+            'd31a8d34648e60db7b86afbc53ef7ec2a4aded51296e08fea9e2b5a736ee62d6'
+            '3dbea45e8ca9671282fafb69da92728b1a71de0a9e060b2905d6a5b67ecd3b36'
+            '92ddbd7f2d778b8c9803aee328091b58fab324e4fad675945585808b4831d7bc'
+            '3ff4def08e4b7a9de576d26586cec64b6116'
+        ))
+        self.tag = Bits(hex='1ae10b594f09e26a7e902ecbd0600691')
+
+    def test_chacha20_poly1305_key_gen(self):
+        """2.6.2 Poly1305 Key Generation Test Vector @ https://tools.ietf.org/html/rfc7539."""
+        otk = poly1305_key_gen(self.k, Bits(hex='000000000001020304050607'))
+        self.assertEqual(otk, bytes.fromhex('8ad5a08b905f81cc815040274ab29471a833b637e3fd0da508dbb8e2fdd1a646'))
+
+    def test_chacha20_poly1305_encrypt(self):
+        self.assertEqual(chacha20_poly1305_encrypt(self.k, self.nonce, self.plaintext, self.aad),
+                         (self.ciphertext, self.tag))
+
+    def test_chacha20_poly1305_decrypt(self):
+        for lanes in [1, 4]:
+            p = chacha20_poly1305_decrypt(self.k, self.nonce, self.ciphertext, self.tag, self.aad, lanes)
+            self.assertEqual(p, self.plaintext)
+
+    def test_chacha20_poly1305_decrypt_raises_value_error_if_tag_not_valid(self):
+        forged = self.ciphertext ^ Bits(uint=1, length=len(self.ciphertext))
+        self.assertRaises(ValueError, chacha20_poly1305_decrypt, self.k, self.nonce, forged, self.tag, self.aad)
+        self.assertRaises(ValueError, chacha20_poly1305_decrypt, self.k, self.nonce, self.ciphertext, self.tag)
+
+    def test_chacha20_poly1305_stream(self):
+        c = BytesIO()
+        stream_encrypt(self.k, self.nonce, BytesIO(self.plaintext.bytes), c, self.aad.bytes, chunk_size=50)
+        self.assertEqual(c.getvalue(), (self.ciphertext + self.tag).bytes)
+        for chunk_size in [7, 16, 64, 1000]:
+            p = BytesIO()
+            stream_decrypt(self.k, self.nonce, BytesIO(c.getvalue()), p, self.aad.bytes, 4, chunk_size)
+            self.assertEqual(p.getvalue(), self.plaintext.bytes)
+
+    def test_chacha20_poly1305_stream_decrypt_raises_value_error_if_tag_not_valid(self):
+        forged = (self.ciphertext + (self.tag ^ Bits(uint=1, length=128))).bytes
+        self.assertRaises(ValueError, stream_decrypt, self.k, self.nonce, BytesIO(forged), BytesIO(), self.aad.bytes)
+        self.assertRaises(ValueError, stream_decrypt, self.k, self.nonce, BytesIO(bytes(8)), BytesIO())
+
+    def test_chacha20_poly1305_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, chacha20_poly1305_encrypt, self.k[:128], self.nonce, self.plaintext)
+        self.assertRaises(ValueError, chacha20_poly1305_encrypt, self.k, self.nonce[:64], self.plaintext)
+        self.assertRaises(ValueError, chacha20_poly1305_encrypt, self.k, self.nonce, Bits(3))
+        self.assertRaises(ValueError, chacha20_poly1305_decrypt, self.k, self.nonce, self.ciphertext, Bits(64))
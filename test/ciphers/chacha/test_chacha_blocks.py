@@ -0,0 +1,54 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+import numpy as np
+from bitstring import Bits
+
+from ciphers.stream.chacha import chacha_blocks, chacha_hash_many, chacha_hash_words, expansion
+from util.bitseq import bitseq8
+
+
+class TestChaChaBlocks(unittest.TestCase):
+    def test_chacha_blocks_ietf(self):
+        """2.3.2 Test Vector for the ChaCha20 Block Function @ https://tools.ietf.org/html/rfc7539."""
+        stream = chacha_blocks(bitseq8(*range(32)), Bits(hex='000000090000004a00000000'), 1, 1, version='ietf')
+        self.assertEqual(stream, bytes.fromhex(
+            '10f1e7e4d13b5915500fdd1fa32071c4c7d1f4c733c068030422aa9ac3d46c4e'
+            'd2826446079faa0914c2d705d98b02a2b5129cd1de164eb9cbd083e8a2503c4e'
+        ))
+
+    def test_chacha_blocks_djb(self):
+        """3. Test vectors for ChaCha @ https://tools.ietf.org/html/draft-strombergson-chacha-test-vectors-00.
+        TC1: All zero key and IV. Rounds: 8 and 20.
+        """
+        self.assertEqual(chacha_blocks(Bits(256), Bits(64), 0, 2), bytes.fromhex(
+            '76b8e0ada0f13d90405d6ae55386bd28bdd219b8a08ded1aa836efcc8b770dc7'
+            'da41597c5157488d7724e03fb8d84a376a43b8f41518a11cc387b669b2ee6586'
+            '9f07e7be5551387a98ba977c732d080dcb0f29a048e3656912c6533e32ee7aed'
+            '29b721769ce64e43d57133b074d839d531ed1f28510afb45ace10a1f4b794d6f'
+        ))
+        self.assertEqual(chacha_blocks(Bits(256), Bits(64), 0, 1, rounds=8), bytes.fromhex(
+            '3e00ef2f895f40d67f5bb8e81f09a5a12c840ec3ce9a7f3b181be188ef711a1e'
+            '984ce172b9216f419f445367456d5619314a42a3da86b001387bfdb80e0cfe42'
+        ))
+
+    def test_chacha_blocks_match_expansion_across_counter_words(self):
+        k, iv = bitseq8(*range(32)), bitseq8(*range(8))
+        start = 2 ** 32 - 2
+        stream = chacha_blocks(k, iv, start, 4, rounds=12)
+        for i in range(4):
+            n = Bits(uint=start + i, length=64) + iv
+            self.assertEqual(stream[64 * i:64 * (i + 1)], expansion('djb')(k, n, 12).bytes)
+
+    def test_chacha_hash_many_matches_chacha_hash_words(self):
+        x = np.random.RandomState(7).randint(0, 2 ** 32, size=(16, 20), dtype=np.uint64).astype(np.uint32)
+        z = chacha_hash_many(x)
+        for i in range(20):
+            self.assertEqual(z[:, i].tolist(), chacha_hash_words(x[:, i].tolist()))
+
+    def test_chacha_blocks_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, chacha_blocks, Bits(256), Bits(96), 2 ** 32 - 1, 2, version='ietf')
+        self.assertRaises(ValueError, chacha_blocks, Bits(256), Bits(64), -1, 1)
+        self.assertRaises(ValueError, chacha_blocks, Bits(256), Bits(96), 0, 1)
+        self.assertRaises(ValueError, chacha_hash_many, np.zeros((4, 4), dtype=np.uint32))
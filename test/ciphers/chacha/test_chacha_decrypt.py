@@ -0,0 +1,33 @@
+# noinspection PyUnresolvedReferences
+import test.context
+from bitstring import Bits
+
+from ciphers.stream.chacha import decrypt, encrypt
+from test.helper import BitsTestCase
+from util.bitseq import bitseq8, bitseq
+
+
+class TestChaChaDecrypt(BitsTestCase):
+    def test_chacha_decrypt_djb_reduced_rounds(self):
+        """3. Test vectors for ChaCha @ https://tools.ietf.org/html/draft-strombergson-chacha-test-vectors-00.
+        TC1: All zero key and IV. Rounds: 8 and 12.
+        """
+        key_block_8 = Bits(hex='3e00ef2f895f40d67f5bb8e81f09a5a12c840ec3ce9a7f3b181be188ef711a1e'
+                               '984ce172b9216f419f445367456d5619314a42a3da86b001387bfdb80e0cfe42')
+        key_block_12 = Bits(hex='9bf49a6a0755f953811fce125f2683d50429c3bb49e074147e0089a52eae155f'
+                                '0564f879d27ae3c02ce82834acfa8c793a629f2ca0de6919610be82f411326be')
+        self.assertEqual(decrypt(Bits(256), Bits(64) + key_block_8, rounds=8), Bits(512))
+        self.assertEqual(decrypt(Bits(256), Bits(64) + key_block_12, rounds=12), Bits(512))
+
+    def test_chacha_decrypt_inverts_encrypt(self):
+        k = bitseq8(*range(32))
+        m = bitseq8(*range(150))
+        for version in ['djb', 'ietf']:
+            for rounds in [8, 12, 20]:
+                self.assertEqual(decrypt(k, encrypt(k, m, version, rounds), version, rounds), m)
+
+    def test_chacha_decrypt_raises_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, decrypt, bitseq(0x0, bit=128), Bits(128))
+        self.assertRaises(ValueError, decrypt, Bits(256), Bits(64))
+        self.assertRaises(ValueError, decrypt, Bits(256), Bits(96), version='ietf')
+        self.assertRaises(ValueError, decrypt, Bits(256), Bits(128), version='foo')
@@ -0,0 +1,37 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from bitstring import Bits
+
+from ciphers.stream.chacha import state_template, expansion, xcrypt
+from util.bitseq import bitseq8
+
+
+class TestChaChaStateTemplate(unittest.TestCase):
+    def test_chacha_state_template_ietf(self):
+        """2.3.2 Test Vector for the ChaCha20 Block Function @ https://tools.ietf.org/html/rfc7539."""
+        x = state_template('ietf', bitseq8(*range(32)), Bits(hex='000000090000004a00000000'))
+        self.assertEqual(x, [
+            0x61707865, 0x3320646e, 0x79622d32, 0x6b206574, 0x03020100, 0x07060504, 0x0b0a0908, 0x0f0e0d0c,
+            0x13121110, 0x17161514, 0x1b1a1918, 0x1f1e1d1c, 0x00000000, 0x09000000, 0x4a000000, 0x00000000,
+        ])
+
+    def test_chacha_state_template_djb(self):
+        x = state_template('djb', bitseq8(*range(32)), Bits(hex='0001020304050607'))
+        self.assertEqual(x[12:], [0x00000000, 0x00000000, 0x03020100, 0x07060504])
+
+    def test_chacha_state_template_is_not_shared(self):
+        k, iv = bitseq8(*range(32)), Bits(64)
+        state_template('djb', k, iv)[12] = 1
+        self.assertEqual(state_template('djb', k, iv)[12], 0)
+
+    def test_chacha_expansion_and_xcrypt_are_built_once_per_version(self):
+        self.assertIs(expansion('djb'), expansion('djb'))
+        self.assertIs(xcrypt('ietf'), xcrypt('ietf'))
+        self.assertIsNot(expansion('djb'), expansion('ietf'))
+
+    def test_chacha_state_template_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, state_template, 'djb', Bits(128), Bits(64))
+        self.assertRaises(ValueError, state_template, 'ietf', Bits(256), Bits(64))
+        self.assertRaises(ValueError, state_template, 'foo', Bits(256), Bits(64))
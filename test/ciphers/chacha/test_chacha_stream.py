@@ -0,0 +1,90 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from bitstring import Bits
+
+from ciphers.stream.chacha import ChaChaStream, chacha_blocks, xcrypt
+from util.bitseq import bitseq8
+
+
+class TestChaChaStream(unittest.TestCase):
+    def setUp(self):
+        self.k = bitseq8(*range(1, 33))
+        self.iv = bitseq8(*range(101, 109))
+        self.nonce = bitseq8(*range(101, 113))
+
+    def test_chacha_stream_blocks_match_chacha_blocks(self):
+        stream = ChaChaStream(self.k, self.iv)
+        for counter in [0, 1, 2, 2 ** 32, 2 ** 64 - 1]:
+            self.assertEqual(stream.block(counter), chacha_blocks(self.k, self.iv, counter, 1))
+
+    def test_chacha_stream_ietf_block_function(self):
+        """2.3.2 Test Vector for the ChaCha20 Block Function @ https://tools.ietf.org/html/rfc7539."""
+        stream = ChaChaStream(bitseq8(*range(32)), Bits(hex='000000090000004a00000000'), 'ietf', counter=1)
+        self.assertEqual(next(stream), bytes.fromhex(
+            '10f1e7e4d13b5915500fdd1fa32071c4c7d1f4c733c068030422aa9ac3d46c4e'
+            'd2826446079faa0914c2d705d98b02a2b5129cd1de164eb9cbd083e8a2503c4e'
+        ))
+
+    def test_chacha_stream_iterates_lazily_over_blocks(self):
+        stream = ChaChaStream(self.k, self.iv, counter=5)
+        self.assertEqual([next(stream) for _ in range(3)], [chacha_blocks(self.k, self.iv, 5 + i, 1) for i in range(3)])
+        self.assertEqual(stream.tell(), 192)
+
+    def test_chacha_stream_seek_matches_sequential_read(self):
+        keystream = ChaChaStream(self.k, self.iv).read(300)
+        stream = ChaChaStream(self.k, self.iv)
+        for offset, size in [(0, 300), (1, 63), (63, 2), (100, 150), (128, 64)]:
+            stream.seek(offset)
+            self.assertEqual(stream.read(size), keystream[offset:offset + size])
+            self.assertEqual(stream.tell(), offset + size)
+
+    def test_chacha_stream_xcrypt_byte_range(self):
+        message = bytes(range(256)) * 2
+        ciphertext = ChaChaStream(self.k, self.nonce, 'ietf').xcrypt(message)
+        stream = ChaChaStream(self.k, self.nonce, 'ietf')
+        stream.seek(130)
+        self.assertEqual(stream.xcrypt(ciphertext[130:300]), message[130:300])
+
+    def test_chacha_stream_seek_far_offset(self):
+        stream = ChaChaStream(self.k, self.iv)
+        stream.seek(64 * 2 ** 40 + 5)
+        self.assertEqual(stream.read(10), chacha_blocks(self.k, self.iv, 2 ** 40, 1)[5:15])
+
+    def test_chacha_stream_ietf_counter_exhaustion(self):
+        stream = ChaChaStream(self.k, self.nonce, 'ietf', counter=2 ** 32 - 2)
+        self.assertEqual(stream.length, 128)
+        stream.seek(100)
+        self.assertEqual(stream.read(28), chacha_blocks(self.k, self.nonce, 2 ** 32 - 1, 1, version='ietf')[36:])
+        self.assertRaises(ValueError, stream.read, 1)
+        self.assertRaises(StopIteration, next, stream)
+        self.assertRaises(ValueError, stream.seek, 129)
+        self.assertRaises(ValueError, ChaChaStream(self.k, self.nonce, 'ietf').block, 2 ** 32)
+
+    def test_chacha_stream_rounds(self):
+        self.assertEqual(ChaChaStream(self.k, self.iv, rounds=8).block(0), chacha_blocks(self.k, self.iv, 0, 1, 8))
+
+    def test_chacha_xcrypt_reduced_rounds(self):
+        text = bitseq8(*range(100))
+        for rounds in [2, 4, 10]:
+            stream = chacha_blocks(self.k, self.iv, 0, 2, rounds)[:100]
+            self.assertEqual(xcrypt('djb')(self.k, text, iv=self.iv, rounds=rounds).bytes,
+                             bytes(a ^ b for a, b in zip(text.bytes, stream)))
+
+    def test_chacha_stream_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, ChaChaStream, self.k[:200], self.iv)
+        self.assertRaises(ValueError, ChaChaStream, self.k, self.nonce)
+        self.assertRaises(ValueError, ChaChaStream, self.k, self.iv, 'ietf')
+        self.assertRaises(ValueError, ChaChaStream, self.k, self.iv, 'unknown')
+        self.assertRaises(ValueError, ChaChaStream, self.k, self.iv, rounds=7)
+        self.assertRaises(ValueError, ChaChaStream, self.k, self.iv, rounds=0)
+        self.assertRaises(ValueError, ChaChaStream, self.k, self.nonce, 'ietf', counter=2 ** 32)
+        self.assertRaises(ValueError, ChaChaStream(self.k, self.iv).seek, -1)
+        stream = ChaChaStream(self.k, self.iv)
+        self.assertRaises(ValueError, stream.read, -5)
+        self.assertEqual(stream.tell(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+from io import BytesIO
+
+from bitstring import Bits
+
+from ciphers.stream.chacha import stream_encrypt, stream_decrypt, encrypt
+from test.ciphers.chacha.patchers import iv
+from util.bitseq import bitseq8
+
+
+class TestChaChaStreamEncrypt(unittest.TestCase):
+    def setUp(self):
+        self.k = bitseq8(*range(32))
+        self.message = bytes(range(256)) * 3 + b'tail'
+
+    @iv(0x4a00000000)
+    def test_chacha_stream_encrypt_matches_encrypt(self, *_):
+        for version in ['djb', 'ietf']:
+            dst = BytesIO()
+            stream_encrypt(self.k, BytesIO(self.message), dst, version, 12, chunk_size=100)
+            self.assertEqual(dst.getvalue(), encrypt(self.k, Bits(bytes=self.message), version, 12).bytes)
+
+    def test_chacha_stream_decrypt_inverts_stream_encrypt(self):
+        for version, workers in [('djb', 1), ('ietf', 2)]:
+            c, p = BytesIO(), BytesIO()
+            stream_encrypt(self.k, BytesIO(self.message), c, version, workers=workers, chunk_size=192)
+            c.seek(0)
+            stream_decrypt(self.k, c, p, version, workers=workers, chunk_size=70)
+            self.assertEqual(p.getvalue(), self.message)
+
+    def test_chacha_stream_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, stream_encrypt, self.k[:128], BytesIO(), BytesIO())
+        self.assertRaises(ValueError, stream_decrypt, self.k, BytesIO(bytes(8)), BytesIO(), 'ietf')
@@ -0,0 +1,41 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+from array import array
+
+from ciphers.stream.chacha import quarterround_words, chacha_hash_words
+
+
+class TestChaChaWords(unittest.TestCase):
+    def test_chacha_quarterround_words(self):
+        """2.1.1 Test Vector for the ChaCha Quarter Round @ https://tools.ietf.org/html/rfc7539."""
+        x = [0x11111111, 0x01020304, 0x9b8d6f43, 0x01234567]
+        quarterround_words(x, 0, 1, 2, 3)
+        self.assertEqual(x, [0xea2a92f4, 0xcb1cf8ce, 0x4581472e, 0x5881c4bb])
+
+    def test_chacha_quarterround_words_on_state(self):
+        """2.2.1 Test Vector for the Quarter Round on the ChaCha State @ https://tools.ietf.org/html/rfc7539."""
+        x = array('I', [
+            0x879531e0, 0xc5ecf37d, 0x516461b1, 0xc9a62f8a, 0x44c20ef3, 0x3390af7f, 0xd9fc690b, 0x2a5f714c,
+            0x53372767, 0xb00a5631, 0x974c541a, 0x359e9963, 0x5c971061, 0x3d631689, 0x2098d9d6, 0x91dbd320,
+        ])
+        quarterround_words(x, 2, 7, 8, 13)
+        self.assertEqual(list(x), [
+            0x879531e0, 0xc5ecf37d, 0xbdb886dc, 0xc9a62f8a, 0x44c20ef3, 0x3390af7f, 0xd9fc690b, 0xcfacafd2,
+            0xe46bea80, 0xb00a5631, 0x974c541a, 0x359e9963, 0x5c971061, 0xccc07c79, 0x2098d9d6, 0x91dbd320,
+        ])
+
+    def test_chacha_hash_words(self):
+        """2.3.2 Test Vector for the ChaCha20 Block Function @ https://tools.ietf.org/html/rfc7539."""
+        x = [
+            0x61707865, 0x3320646e, 0x79622d32, 0x6b206574, 0x03020100, 0x07060504, 0x0b0a0908, 0x0f0e0d0c,
+            0x13121110, 0x17161514, 0x1b1a1918, 0x1f1e1d1c, 0x00000001, 0x09000000, 0x4a000000, 0x00000000,
+        ]
+        self.assertEqual(chacha_hash_words(x), [
+            0xe4e7f110, 0x15593bd1, 0x1fdd0f50, 0xc47120a3, 0xc7f4d1c7, 0x0368c033, 0x9aaa2204, 0x4e6cd4c3,
+            0x466482d2, 0x09aa9f07, 0x05d7c214, 0xa2028bd9, 0xd19c12b5, 0xb94e16de, 0xe883d0cb, 0x4e3c50a2,
+        ])
+        self.assertEqual(x[12], 0x00000001)
+
+    def test_chacha_hash_words_raises_value_error_if_input_not_16_words(self):
+        self.assertRaises(ValueError, chacha_hash_words, [0] * 17)
@@ -0,0 +1,25 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from ciphers.stream.chacha import ChaChaStream, xcrypt
+from test.ciphers.chacha.patchers import initial_counter
+from util.bitseq import bitseq8, bitseq
+from util.parallel import KeystreamPool
+
+
+class TestChaChaWorkers(unittest.TestCase):
+    @initial_counter(1)
+    def test_chacha_xcrypt_workers(self, *_):
+        k = bitseq8(*range(32))
+        text = bitseq8(*range(200))
+        for version, iv_length in [('djb', 64), ('ietf', 96)]:
+            iv = bitseq(0x4a00000000, bit=iv_length)
+            self.assertEqual(xcrypt(version)(k, text, iv=iv, workers=2), xcrypt(version)(k, text, iv=iv))
+
+    def test_chacha_stream_read_with_pool(self):
+        k, nonce = bitseq8(*range(32)), bitseq8(*range(12))
+        expected = ChaChaStream(k, nonce, 'ietf').read(1000)
+        stream = ChaChaStream(k, nonce, 'ietf')
+        with KeystreamPool(2) as pool:
+            self.assertEqual(b''.join(stream.read(size, pool=pool) for size in [300, 1, 699]), expected)
@@ -0,0 +1,34 @@
+import random
+import unittest
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.block.feal import FealCipher, encrypt_int
+
+
+class TestFEALCipher(unittest.TestCase):
+
+    def test_feal_cipher_matches_specification_in_paper(self):
+        # input key taken from p.8, section 6.2 and
+        #   ciphertext taken from p.16, section 6.4.3 of
+        #   https://info.isl.ntt.co.jp/crypt/archive/dl/feal/call-3e.pdf
+        cipher = FealCipher(0x0123456789ABCDEF0123456789ABCDEF)
+        self.assertEqual(cipher.encrypt_block(0x0), 0x9C9B54973DF685F8)
+        self.assertEqual(cipher.decrypt_block(0x9C9B54973DF685F8), 0x0)
+
+    def test_feal_cipher_blocks_match_encrypt_int(self):
+        rng = random.Random(0)
+        k = rng.getrandbits(128)
+        blocks = [rng.getrandbits(64) for _ in range(16)]
+        cipher = FealCipher(k, n=8)
+        c = cipher.encrypt_blocks(blocks)
+        self.assertEqual(c, [encrypt_int(k, b, 8) for b in blocks])
+        self.assertEqual(cipher.decrypt_blocks(c), blocks)
+
+    def test_feal_cipher_raises_value_error_on_invalid_input(self):
+        with self.assertRaises(ValueError):
+            FealCipher(0x0, n=3)
+        with self.assertRaises(ValueError):
+            FealCipher(2 ** 128)
+        with self.assertRaises(ValueError):
+            FealCipher(0x0).encrypt_block(2 ** 64)
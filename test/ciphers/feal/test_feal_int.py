@@ -0,0 +1,59 @@
+import random
+import unittest
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.block.feal import encrypt, decrypt, encrypt_int, decrypt_int, encrypt_fast, decrypt_fast, f, f_int, \
+    fk, fk_int, key_schedule, key_schedule_int
+from util.bitseq import bitseq128, bitseq64, bitseq32, bitseq16
+
+
+class TestFEALInt(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(0)
+
+    def test_feal_encrypt_int_matches_specification_in_paper(self):
+        # input key taken from p.8, section 6.2 and
+        #   ciphertext taken from p.16, section 6.4.3 of
+        #   https://info.isl.ntt.co.jp/crypt/archive/dl/feal/call-3e.pdf
+        c = encrypt_int(0x0123456789ABCDEF0123456789ABCDEF, 0x0)
+        self.assertEqual(c, 0x9C9B54973DF685F8)
+
+    def test_feal_decrypt_int_matches_specification_in_paper(self):
+        p = decrypt_int(0x0123456789ABCDEF0123456789ABCDEF, 0x9C9B54973DF685F8)
+        self.assertEqual(p, 0x0)
+
+    def test_feal_f_int_and_fk_int_match_bitstring_implementation(self):
+        for _ in range(32):
+            a, b, c = self.rng.getrandbits(32), self.rng.getrandbits(32), self.rng.getrandbits(16)
+            self.assertEqual(f_int(a, c), f(bitseq32(a), bitseq16(c)).uint)
+            self.assertEqual(fk_int(a, b), fk(bitseq32(a), bitseq32(b)).uint)
+
+    def test_feal_key_schedule_int_matches_bitstring_implementation(self):
+        for n in [4, 8, 32]:
+            k = self.rng.getrandbits(128)
+            self.assertEqual(list(key_schedule_int(k, n)), [sk.uint for sk in key_schedule(bitseq128(k), n)])
+
+    def test_feal_encrypt_and_decrypt_int_match_bitstring_implementation(self):
+        for n in [2, 4, 8, 32]:
+            k, p = self.rng.getrandbits(128), self.rng.getrandbits(64)
+            c = encrypt(bitseq128(k), bitseq64(p), n=n)
+            self.assertEqual(encrypt_int(k, p, n), c.uint)
+            self.assertEqual(decrypt_int(k, c.uint, n), decrypt(bitseq128(k), c, n=n).uint)
+            self.assertEqual(decrypt_int(k, c.uint, n), p)
+
+    def test_feal_encrypt_and_decrypt_fast_match_bitstring_implementation(self):
+        k, p = bitseq128(self.rng.getrandbits(128)), bitseq64(self.rng.getrandbits(64))
+        self.assertEqual(encrypt_fast(k, p, n=8), encrypt(k, p, n=8))
+        self.assertEqual(decrypt_fast(k, p, n=8), decrypt(k, p, n=8))
+
+    def test_feal_int_raises_value_error_if_text_not_64_bit_or_key_not_128_bit(self):
+        with self.assertRaises(ValueError):
+            encrypt_int(0x0, 2 ** 64)
+        with self.assertRaises(ValueError):
+            decrypt_int(0x0, 2 ** 64)
+        with self.assertRaises(ValueError):
+            encrypt_int(2 ** 128, 0x0)
+        with self.assertRaises(ValueError):
+            encrypt_fast(bitseq128(0x0), bitseq32(0x0))
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+import numpy as np
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.block.feal import key_schedule_many, key_schedule_int, encrypt_with_subkeys, decrypt_with_subkeys, \
+    encrypt_int, decrypt_int
+
+
+class TestFEALKeyScheduleMany(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.keys = [rng.getrandbits(128) for _ in range(32)] + [0x0, 2 ** 128 - 1]
+        self.blocks = [rng.getrandbits(64) for _ in self.keys]
+
+    def test_feal_key_schedule_many_matches_key_schedule_int(self):
+        for n in [4, 8, 32]:
+            sk = key_schedule_many(self.keys, n)
+            self.assertEqual(sk.shape, (len(self.keys), n + 8))
+            self.assertEqual(sk.dtype, np.uint16)
+            self.assertEqual(sk.tolist(), [list(key_schedule_int(k, n)) for k in self.keys])
+
+    def test_feal_key_schedule_many_accepts_array_of_key_halves(self):
+        halves = np.array([[k >> 64, k & (2 ** 64 - 1)] for k in self.keys], dtype=np.uint64)
+        self.assertTrue(np.array_equal(key_schedule_many(halves, 8), key_schedule_many(self.keys, 8)))
+
+    def test_feal_encrypt_and_decrypt_with_subkeys_use_one_key_per_block(self):
+        sk = key_schedule_many(self.keys, 8)
+        c = encrypt_with_subkeys(sk, self.blocks, 8)
+        self.assertEqual(c.tolist(), [encrypt_int(k, b, 8) for k, b in zip(self.keys, self.blocks)])
+        self.assertEqual(decrypt_with_subkeys(sk, c, 8).tolist(), self.blocks)
+
+    def test_feal_key_schedule_many_raises_value_error_on_invalid_input(self):
+        with self.assertRaises(ValueError):
+            key_schedule_many([2 ** 128])
+        with self.assertRaises(ValueError):
+            key_schedule_many(np.zeros((2, 3), dtype=np.uint64))
+        with self.assertRaises(ValueError):
+            encrypt_with_subkeys(key_schedule_many(self.keys, 8), self.blocks[:-1], 8)
+
+    def test_feal_key_schedules_raise_value_error_if_round_number_is_odd(self):
+        with self.assertRaises(ValueError):
+            key_schedule_many(self.keys, 3)
+        with self.assertRaises(ValueError):
+            key_schedule_int(self.keys[0], 3)
+        with self.assertRaises(ValueError):
+            encrypt_int(self.keys[0], self.blocks[0], 3)
+        with self.assertRaises(ValueError):
+            decrypt_int(self.keys[0], self.blocks[0], 3)
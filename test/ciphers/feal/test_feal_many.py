@@ -0,0 +1,36 @@
+import random
+import unittest
+
+import numpy as np
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.block.feal import encrypt_many, decrypt_many, encrypt_int
+
+
+class TestFEALMany(unittest.TestCase):
+
+    def test_feal_encrypt_many_matches_specification_in_paper(self):
+        # input key taken from p.8, section 6.2 and
+        #   ciphertext taken from p.16, section 6.4.3 of
+        #   https://info.isl.ntt.co.jp/crypt/archive/dl/feal/call-3e.pdf
+        c = encrypt_many(0x0123456789ABCDEF0123456789ABCDEF, np.array([0x0, 0x0], dtype=np.uint64))
+        self.assertEqual(c.tolist(), [0x9C9B54973DF685F8, 0x9C9B54973DF685F8])
+        p = decrypt_many(0x0123456789ABCDEF0123456789ABCDEF, c)
+        self.assertEqual(p.tolist(), [0x0, 0x0])
+
+    def test_feal_encrypt_and_decrypt_many_match_encrypt_int(self):
+        rng = random.Random(0)
+        for n in [2, 4, 8, 32]:
+            k = rng.getrandbits(128)
+            blocks = [rng.getrandbits(64) for _ in range(64)] + [0x0, 2 ** 64 - 1]
+            c = encrypt_many(k, blocks, n)
+            self.assertEqual(c.dtype, np.uint64)
+            self.assertEqual(c.tolist(), [encrypt_int(k, b, n) for b in blocks])
+            self.assertEqual(decrypt_many(k, c, n).tolist(), blocks)
+
+    def test_feal_encrypt_many_raises_value_error_on_invalid_input(self):
+        with self.assertRaises(ValueError):
+            encrypt_many(2 ** 128, [0x0])
+        with self.assertRaises(ValueError):
+            encrypt_many(0x0, np.zeros((2, 2), dtype=np.uint64))
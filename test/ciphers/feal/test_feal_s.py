@@ -2,7 +2,8 @@ import unittest
 
 # noinspection PyUnresolvedReferences
 import test.context
-from ciphers.block.feal import s1
+# noinspection PyProtectedMember
+from ciphers.block.feal import s1, _s_table
 from util.bitseq import bitseq8
 
 
@@ -13,3 +14,12 @@ class TestFEALS(unittest.TestCase):
         #   https://info.isl.ntt.co.jp/crypt/archive/dl/feal/call-3e.pdf
         s = s1(bitseq8(0b00010011), bitseq8(0b11110010))
         self.assertEqual(s, "0b00011000")
+
+    def test_feal_s_tables_match_definition_of_s_box(self):
+        # S_i(a, b) = Rot2((a + b + i) mod 256), see p.8, section 5.3 of
+        #   https://info.isl.ntt.co.jp/crypt/archive/dl/feal/call-3e.pdf
+        for i in [0, 1]:
+            for a in range(256):
+                for b in range(0, 256, 15):
+                    x = (a + b + i) % 256
+                    self.assertEqual(_s_table(i)[a + b], ((x << 2) | (x >> 6)) % 256)
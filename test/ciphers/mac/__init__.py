@@ -0,0 +1 @@
+"""Tests for message authentication code implementations."""
@@ -0,0 +1,35 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from ciphers.mac.poly1305 import Poly1305, poly1305
+
+
+class TestPoly1305(unittest.TestCase):
+    def test_poly1305(self):
+        """2.5.2 Poly1305 Example and Test Vector @ https://tools.ietf.org/html/rfc7539."""
+        key = bytes.fromhex('85d6be7857556d337f4452fe42d506a80103808afb0db2fd4abff6af4149f51b')
+        tag = bytes.fromhex('a8061dc1305136c6c22b8baf0c0127a9')
+        for lanes in [1, 2, 4]:
+            self.assertEqual(poly1305(key, b'Cryptographic Forum Research Group', lanes), tag)
+
+    def test_poly1305_appendix(self):
+        """A.3 Poly1305 Message Authentication Code, test vectors #1, #6, #7 @ https://tools.ietf.org/html/rfc7539."""
+        self.assertEqual(poly1305(bytes(32), bytes(64)), bytes(16))
+        self.assertEqual(poly1305(bytes([2]) + bytes(31), b'\xff' * 16), bytes([3]) + bytes(15))
+        message = b'\xff' * 16 + b'\xf0' + b'\xff' * 15 + b'\x11' + bytes(15)
+        for lanes in [1, 2, 3]:
+            self.assertEqual(poly1305(bytes([1]) + bytes(31), message, lanes), bytes([5]) + bytes(15))
+
+    def test_poly1305_update_in_chunks(self):
+        key = bytes(range(100, 132))
+        message = bytes(range(256)) * 3
+        for lanes in [1, 4]:
+            mac = Poly1305(key, lanes)
+            for i in range(0, len(message), 37):
+                mac.update(message[i:i + 37])
+            self.assertEqual(mac.digest(), poly1305(key, message))
+
+    def test_poly1305_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, Poly1305, bytes(16))
+        self.assertRaises(ValueError, Poly1305, bytes(32), 0)
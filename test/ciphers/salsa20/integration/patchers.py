@@ -39,7 +39,7 @@ default_ciphertext: str = fhex(
     )
 )
 
-iv_patch = mock.patch('random.randrange', return_value=0x0)
+iv_patch = mock.patch('util.rng.randbits', return_value=0x0)
 
 
 def default_encrypt_args(*add_args, **add_kwargs):
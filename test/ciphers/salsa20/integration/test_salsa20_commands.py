@@ -3,7 +3,7 @@ import unittest
 # noinspection PyUnresolvedReferences
 import test.context
 from ciphers.stream.salsa20 import salsa20
-from test.ciphers.salsa20.integration.patchers import default_decrypt_args, default_encrypt_args
+from test.ciphers.salsa20.integration.patchers import default_decrypt_args, default_encrypt_args, default_ciphertext
 from util.bitseq import bitseq, bitseq64, fhex
 
 
@@ -39,3 +39,11 @@ class TestSalsa20Commands(unittest.TestCase):
     def test_integration_salsa20_decrypt(self):
         p = bitseq(0x0, bit=4096)
         self.assertEqual(salsa20(), fhex(p))
+
+    @default_encrypt_args('--jobs', '2')
+    def test_integration_salsa20_encrypt_jobs(self, _):
+        self.assertEqual(salsa20(), default_ciphertext)
+
+    @default_decrypt_args('--jobs', '2')
+    def test_integration_salsa20_decrypt_jobs(self):
+        self.assertEqual(salsa20(), fhex(bitseq(0x0, bit=4096)))
@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from bitstring import Bits
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.stream.salsa20 import salsa20
+from test.ciphers.salsa20.integration.patchers import default_ciphertext, iv_patch, key
+
+
+class TestSalsa20OptionStream(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.plaintext = os.path.join(self.directory.name, 'plaintext')
+        self.ciphertext = os.path.join(self.directory.name, 'ciphertext')
+
+    @iv_patch
+    def test_integration_salsa20_encrypt_file(self, _):
+        with open(self.plaintext, 'wb') as f:
+            f.write(bytes(512))
+        with mock.patch('sys.argv', ['salsa20', 'encrypt', key, '--in', self.plaintext, '--out', self.ciphertext]):
+            self.assertIsNone(salsa20())
+        with open(self.ciphertext, 'rb') as f:
+            self.assertEqual(f.read(), Bits(hex=default_ciphertext).bytes)
+
+    def test_integration_salsa20_decrypt_file(self):
+        with open(self.ciphertext, 'wb') as f:
+            f.write(Bits(hex=default_ciphertext).bytes)
+        argv = ['salsa20', 'decrypt', '--jobs', '2', key, '--in', self.ciphertext, '--out', self.plaintext]
+        with mock.patch('sys.argv', argv):
+            self.assertIsNone(salsa20())
+        with open(self.plaintext, 'rb') as f:
+            self.assertEqual(f.read(), bytes(512))
@@ -0,0 +1,42 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+import numpy as np
+
+from ciphers.stream.salsa20 import Salsa20Stream, salsa20_hash_many, salsa20_hash_words
+from util.bitseq import bitseq8
+
+
+class TestSalsa20Many(unittest.TestCase):
+    def test_salsa20_hash_many_matches_salsa20_hash_words(self):
+        rng = np.random.RandomState(20)
+        x = rng.randint(0, 2 ** 32, size=(16, 50), dtype=np.uint64).astype(np.uint32)
+        for rounds in [8, 12, 20]:
+            z = salsa20_hash_many(x, rounds)
+            self.assertEqual(z.dtype, np.uint32)
+            self.assertEqual(z.shape, (16, 50))
+            for i in range(50):
+                self.assertEqual(z[:, i].tolist(), salsa20_hash_words(x[:, i].tolist(), rounds))
+
+    def test_salsa20_stream_blocks_match_block(self):
+        stream = Salsa20Stream(bitseq8(*range(32)), bitseq8(*range(8)))
+        counter = 2 ** 32 - 3
+        blocks = stream.blocks(counter, 6)
+        for i in range(6):
+            self.assertEqual(blocks[:, i].astype('<u4').tobytes(), stream.block(counter + i))
+
+    def test_salsa20_stream_read_many_blocks_matches_iteration(self):
+        stream = Salsa20Stream(bitseq8(*range(32)), bitseq8(*range(8)))
+        expected = b''.join(next(stream) for _ in range(20))
+        stream.seek(70)
+        self.assertEqual(stream.read(1100), expected[70:1170])
+        self.assertEqual(stream.tell(), 1170)
+
+    def test_salsa20_hash_many_raises_value_error_if_input_not_16_rows(self):
+        self.assertRaises(ValueError, salsa20_hash_many, np.zeros((15, 4), dtype=np.uint32))
+        self.assertRaises(ValueError, salsa20_hash_many, np.zeros(16, dtype=np.uint32))
+
+    def test_salsa20_stream_blocks_raises_value_error_if_counter_overflows(self):
+        stream = Salsa20Stream(bitseq8(*range(32)), bitseq8(*range(8)))
+        self.assertRaises(ValueError, stream.blocks, 2 ** 64 - 1, 2)
@@ -0,0 +1,53 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bitstring import Bits
+
+from ciphers.stream.salsa20 import Salsa20Stream, expansion, xcrypt, encrypt, decrypt
+from util.bitseq import bitseq8
+
+
+class TestSalsa20Rounds(unittest.TestCase):
+    def setUp(self):
+        self.k = bitseq8(*range(1, 33))
+        self.iv = bitseq8(*range(8))
+
+    def test_salsa20_expansion_rounds_match_stream(self):
+        for rounds in [8, 12, 20]:
+            n = self.iv + Bits(uintle=7, length=64)
+            self.assertEqual(expansion(self.k, n, rounds).bytes, Salsa20Stream(self.k, self.iv, rounds).block(7))
+
+    def test_salsa20_xcrypt_reduced_rounds(self):
+        text = bitseq8(*range(100))
+        for rounds in [2, 4, 10]:
+            stream = b''.join(expansion(self.k, self.iv + Bits(uintle=i, length=64), rounds).bytes for i in range(2))
+            self.assertEqual(xcrypt(self.k, text, iv=self.iv, rounds=rounds).bytes,
+                             bytes(a ^ b for a, b in zip(text.bytes, stream)))
+
+    def test_salsa20_xcrypt_default_rounds_is_20(self):
+        text = bitseq8(*range(100))
+        self.assertEqual(xcrypt(self.k, text, iv=self.iv), xcrypt(self.k, text, iv=self.iv, rounds=20))
+        self.assertNotEqual(xcrypt(self.k, text, iv=self.iv), xcrypt(self.k, text, iv=self.iv, rounds=8))
+
+    def test_salsa20_encrypt_decrypt_rounds(self):
+        text = bitseq8(*range(100))
+        for rounds in [8, 12, 20]:
+            self.assertEqual(decrypt(self.k, encrypt(self.k, text, rounds), rounds), text)
+
+    def test_salsa20_mixed_rounds_in_threads(self):
+        text = bitseq8(*range(200))
+        jobs = [8, 12, 20] * 4
+        expected = [xcrypt(self.k, text, iv=self.iv, rounds=rounds) for rounds in jobs]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            actual = list(pool.map(lambda rounds: xcrypt(self.k, text, iv=self.iv, rounds=rounds), jobs))
+        self.assertEqual(actual, expected)
+
+    def test_salsa20_xcrypt_workers(self):
+        text = bitseq8(*range(256)) * 5 + Bits('0b101')
+        for rounds in [8, 20]:
+            self.assertEqual(
+                xcrypt(self.k, text, iv=self.iv, rounds=rounds, workers=3),
+                xcrypt(self.k, text, iv=self.iv, rounds=rounds),
+            )
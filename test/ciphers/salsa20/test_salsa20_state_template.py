@@ -0,0 +1,37 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from bitstring import Bits
+
+from ciphers.stream.salsa20 import state_template
+from util.bitseq import bitseq8
+
+
+class TestSalsa20StateTemplate(unittest.TestCase):
+    def test_salsa20_state_template_256_bit_key(self):
+        k = bitseq8(*range(1, 33))
+        iv = bitseq8(*range(101, 109))
+        x = state_template(k, iv)
+        sigma = bitseq8(101, 120, 112, 97, 110, 100, 32, 51, 50, 45, 98, 121, 116, 101, 32, 107)
+        counter = Bits(64)
+        expected = sigma[:32] + k[:128] + sigma[32:64] + iv + counter + sigma[64:96] + k[128:] + sigma[96:]
+        self.assertEqual(x, list(expected.unpack('16*uintle:32')))
+
+    def test_salsa20_state_template_128_bit_key(self):
+        k = bitseq8(*range(1, 17))
+        iv = bitseq8(*range(101, 109))
+        x = state_template(k, iv)
+        tau = bitseq8(101, 120, 112, 97, 110, 100, 32, 49, 54, 45, 98, 121, 116, 101, 32, 107)
+        expected = tau[:32] + k + tau[32:64] + iv + Bits(64) + tau[64:96] + k + tau[96:]
+        self.assertEqual(x, list(expected.unpack('16*uintle:32')))
+
+    def test_salsa20_state_template_is_not_shared(self):
+        k, iv = bitseq8(*range(32)), bitseq8(*range(8))
+        x = state_template(k, iv)
+        x[8] = 1
+        self.assertEqual(state_template(k, iv)[8], 0)
+
+    def test_salsa20_state_template_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, state_template, bitseq8(*range(24)), bitseq8(*range(8)))
+        self.assertRaises(ValueError, state_template, bitseq8(*range(32)), bitseq8(*range(4)))
@@ -0,0 +1,78 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from bitstring import Bits
+
+from ciphers.stream.salsa20 import Salsa20Stream, expansion
+from util.bitseq import bitseq8
+from util.parallel import KeystreamPool
+
+
+class TestSalsa20Stream(unittest.TestCase):
+    def setUp(self):
+        self.k = bitseq8(*range(1, 33))
+        self.iv = bitseq8(*range(101, 109))
+
+    def expected_block(self, k: Bits, counter: int) -> bytes:
+        return expansion(k, self.iv + Bits(uintle=counter, length=64)).bytes
+
+    def test_salsa20_stream_blocks_match_expansion(self):
+        stream = Salsa20Stream(self.k, self.iv)
+        for counter in [0, 1, 2, 2 ** 32, 2 ** 64 - 1]:
+            self.assertEqual(stream.block(counter), self.expected_block(self.k, counter))
+
+    def test_salsa20_stream_128_bit_key_matches_expansion(self):
+        k = bitseq8(*range(1, 17))
+        self.assertEqual(Salsa20Stream(k, self.iv).block(3), self.expected_block(k, 3))
+
+    def test_salsa20_stream_iterates_lazily_over_blocks(self):
+        stream = Salsa20Stream(self.k, self.iv)
+        self.assertEqual([next(stream) for _ in range(3)], [self.expected_block(self.k, i) for i in range(3)])
+        self.assertEqual(stream.tell(), 192)
+
+    def test_salsa20_stream_seek_matches_sequential_read(self):
+        keystream = Salsa20Stream(self.k, self.iv).read(300)
+        stream = Salsa20Stream(self.k, self.iv)
+        for offset, size in [(0, 300), (1, 63), (63, 2), (100, 150), (128, 64)]:
+            stream.seek(offset)
+            self.assertEqual(stream.read(size), keystream[offset:offset + size])
+            self.assertEqual(stream.tell(), offset + size)
+
+    def test_salsa20_stream_xcrypt_byte_range(self):
+        message = bytes(range(256)) * 2
+        ciphertext = Salsa20Stream(self.k, self.iv).xcrypt(message)
+        stream = Salsa20Stream(self.k, self.iv)
+        stream.seek(130)
+        self.assertEqual(stream.xcrypt(ciphertext[130:300]), message[130:300])
+
+    def test_salsa20_stream_seek_far_offset(self):
+        stream = Salsa20Stream(self.k, self.iv)
+        stream.seek(64 * 2 ** 40 + 5)
+        self.assertEqual(stream.read(10), self.expected_block(self.k, 2 ** 40)[5:15])
+
+    def test_salsa20_stream_read_with_pool(self):
+        expected = Salsa20Stream(self.k, self.iv).read(1000)
+        stream = Salsa20Stream(self.k, self.iv)
+        with KeystreamPool(2) as pool:
+            self.assertEqual(b''.join(stream.read(size, pool=pool) for size in [300, 1, 699]), expected)
+
+    def test_salsa20_stream_rounds(self):
+        self.assertNotEqual(Salsa20Stream(self.k, self.iv, 8).block(0), Salsa20Stream(self.k, self.iv).block(0))
+
+    def test_salsa20_stream_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, Salsa20Stream, self.k[:200], self.iv)
+        self.assertRaises(ValueError, Salsa20Stream, self.k, self.iv[:32])
+        self.assertRaises(ValueError, Salsa20Stream, self.k, self.iv, 7)
+        self.assertRaises(ValueError, Salsa20Stream, self.k, self.iv, 0)
+        self.assertRaises(ValueError, Salsa20Stream(self.k, self.iv).seek, -1)
+        stream = Salsa20Stream(self.k, self.iv)
+        self.assertRaises(ValueError, stream.read, -5)
+        self.assertEqual(stream.tell(), 0)
+
+    def test_salsa20_stream_raises_value_error_if_keystream_exhausted(self):
+        stream = Salsa20Stream(self.k, self.iv)
+        stream.seek(64 * 2 ** 64 - 4)
+        self.assertEqual(len(stream.read(4)), 4)
+        self.assertRaises(ValueError, stream.read, 1)
+        self.assertRaises(StopIteration, next, stream)
@@ -0,0 +1,48 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+from io import BytesIO
+
+from bitstring import Bits
+
+from ciphers.stream.salsa20 import stream_encrypt, stream_decrypt, encrypt, decrypt
+from test.ciphers.salsa20.integration.patchers import iv_patch
+from util.bitseq import bitseq8
+
+
+class TestSalsa20StreamEncrypt(unittest.TestCase):
+    def setUp(self):
+        self.k = bitseq8(*range(32))
+        self.message = bytes(range(256)) * 20 + b'tail'
+
+    @iv_patch
+    def test_salsa20_stream_encrypt_matches_encrypt(self, _):
+        dst = BytesIO()
+        stream_encrypt(self.k, BytesIO(self.message), dst, chunk_size=192)
+        self.assertEqual(dst.getvalue(), encrypt(self.k, Bits(bytes=self.message)).bytes)
+
+    def test_salsa20_stream_decrypt_matches_decrypt(self):
+        c = encrypt(self.k, Bits(bytes=self.message), 12)
+        dst = BytesIO()
+        stream_decrypt(self.k, BytesIO(c.bytes), dst, 12, chunk_size=100)
+        self.assertEqual(dst.getvalue(), decrypt(self.k, c, 12).bytes)
+        self.assertEqual(dst.getvalue(), self.message)
+
+    def test_salsa20_stream_encrypt_decrypt_workers(self):
+        c, p = BytesIO(), BytesIO()
+        stream_encrypt(self.k, BytesIO(self.message), c, workers=2, chunk_size=1000)
+        c.seek(0)
+        stream_decrypt(self.k, c, p, workers=2, chunk_size=640)
+        self.assertEqual(p.getvalue(), self.message)
+
+    def test_salsa20_stream_encrypt_empty_input(self):
+        c, p = BytesIO(), BytesIO()
+        stream_encrypt(self.k, BytesIO(), c)
+        self.assertEqual(len(c.getvalue()), 8)
+        c.seek(0)
+        stream_decrypt(self.k, c, p)
+        self.assertEqual(p.getvalue(), b'')
+
+    def test_salsa20_stream_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, stream_encrypt, self.k[:128], BytesIO(), BytesIO())
+        self.assertRaises(ValueError, stream_decrypt, self.k, BytesIO(b'1234'), BytesIO())
@@ -0,0 +1,52 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+from array import array
+
+from ciphers.stream.salsa20 import quarterround_words, rowround_words, columnround_words, doubleround_words, \
+    salsa20_hash_words, salsa20_hash
+from util.bitseq import bitseq8
+
+
+class TestSalsa20Words(unittest.TestCase):
+    def test_salsa20_quarterround_words(self):
+        x = [0x00000001, 0x00000000, 0x00000000, 0x00000000]
+        quarterround_words(x, 0, 1, 2, 3)
+        self.assertEqual(x, [0x08008145, 0x00000080, 0x00010200, 0x20500000])
+
+    def test_salsa20_rowround_words(self):
+        x = [0x00000001, 0, 0, 0, 0x00000001, 0, 0, 0, 0x00000001, 0, 0, 0, 0x00000001, 0, 0, 0]
+        rowround_words(x)
+        self.assertEqual(x, [
+            0x08008145, 0x00000080, 0x00010200, 0x20500000, 0x20100001, 0x00048044, 0x00000080, 0x00010000,
+            0x00000001, 0x00002000, 0x80040000, 0x00000000, 0x00000001, 0x00000200, 0x00402000, 0x88000100,
+        ])
+
+    def test_salsa20_columnround_words(self):
+        x = [0x00000001, 0, 0, 0, 0x00000001, 0, 0, 0, 0x00000001, 0, 0, 0, 0x00000001, 0, 0, 0]
+        columnround_words(x)
+        self.assertEqual(x, [
+            0x10090288, 0x00000000, 0x00000000, 0x00000000, 0x00000101, 0x00000000, 0x00000000, 0x00000000,
+            0x00020401, 0x00000000, 0x00000000, 0x00000000, 0x40a04001, 0x00000000, 0x00000000, 0x00000000,
+        ])
+
+    def test_salsa20_doubleround_words_accepts_array(self):
+        x = array('I', [0x00000001] + [0] * 15)
+        doubleround_words(x)
+        self.assertEqual(list(x), [
+            0x8186a22d, 0x0040a284, 0x82479210, 0x06929051, 0x08000090, 0x02402200, 0x00004000, 0x00800000,
+            0x00010200, 0x20400000, 0x08008104, 0x00000000, 0x20500000, 0xa0000040, 0x0008180a, 0x612a8020,
+        ])
+
+    def test_salsa20_hash_words_matches_salsa20_hash(self):
+        x = bitseq8(*range(64))
+        z = salsa20_hash(x)
+        self.assertEqual(salsa20_hash_words(x.unpack('16*uintle:32')), z.unpack('16*uintle:32'))
+
+    def test_salsa20_hash_words_does_not_modify_input(self):
+        x = list(range(16))
+        salsa20_hash_words(x)
+        self.assertEqual(x, list(range(16)))
+
+    def test_salsa20_hash_words_raises_value_error_if_input_not_16_words(self):
+        self.assertRaises(ValueError, salsa20_hash_words, [0] * 15)
@@ -0,0 +1 @@
+"""Tests for XSalsa20 implementation."""
@@ -0,0 +1,20 @@
+# noinspection PyUnresolvedReferences
+import test.context
+from bitstring import Bits
+
+from ciphers.stream.xsalsa20 import hsalsa20
+from test.helper import BitsTestCase
+
+
+class TestXSalsa20HSalsa20(BitsTestCase):
+    def test_xsalsa20_hsalsa20(self):
+        """Test vectors core1 and core2 of NaCl."""
+        shared = Bits(hex='4a5d9d5ba4ce2de1728e3bf480350f25e07e21c947d19e3376f09b3c1e161742')
+        firstkey = hsalsa20(shared, Bits(128))
+        self.assertEqual(firstkey, Bits(hex='1b27556473e985d462cd51197a9a46c76009549eac6474f206c4ee0844f68389'))
+        secondkey = hsalsa20(firstkey, Bits(hex='69696ee955b62b73cd62bda875fc73d6'))
+        self.assertEqual(secondkey, Bits(hex='dc908dda0b9344a953629b733820778880f3ceb421bb61b91cbd4c3e66256ce4'))
+
+    def test_xsalsa20_hsalsa20_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, hsalsa20, Bits(128), Bits(128))
+        self.assertRaises(ValueError, hsalsa20, Bits(256), Bits(64))
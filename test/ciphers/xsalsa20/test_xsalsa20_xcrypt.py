@@ -0,0 +1,43 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from bitstring import Bits
+
+from ciphers.stream.xsalsa20 import XSalsa20Stream, xcrypt, encrypt, decrypt
+
+
+class TestXSalsa20Xcrypt(unittest.TestCase):
+    def setUp(self):
+        self.k = Bits(bytes=b'this is 32-byte key for xsalsa20')
+        self.nonce = Bits(bytes=b'24-byte nonce for xsalsa')
+
+    def test_xsalsa20_xcrypt(self):
+        c = xcrypt(self.k, Bits(bytes=b'Hello world!'), iv=self.nonce)
+        self.assertEqual(c, Bits(hex='002d4513843fc240c401e541'))
+
+    def test_xsalsa20_stream(self):
+        stream = XSalsa20Stream(self.k, self.nonce)
+        self.assertEqual(stream.read(64), bytes.fromhex(
+            '4848297feb1fb52fb66d81609bd547fabcbe7026edc8b5e5e449d088bfa69c08'
+            '8f5d8da1d791267c2c195a7f8cae9c4b4050d08ce6d3a151ec265f3a58e47648'
+        ))
+        stream.seek(10)
+        self.assertEqual(stream.read(10), bytes.fromhex('81609bd547fabcbe7026'))
+
+    def test_xsalsa20_xcrypt_workers(self):
+        text = Bits(bytes=bytes(range(256)) * 3)
+        self.assertEqual(xcrypt(self.k, text, iv=self.nonce, workers=2), xcrypt(self.k, text, iv=self.nonce))
+
+    def test_xsalsa20_encrypt_decrypt(self):
+        text = Bits(bytes=b'stateless workers')
+        c = encrypt(self.k, text)
+        self.assertEqual(len(c), 192 + len(text))
+        self.assertEqual(decrypt(self.k, c), text)
+        self.assertNotEqual(encrypt(self.k, text)[:192], c[:192])
+
+    def test_xsalsa20_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, XSalsa20Stream, self.k, self.nonce[:64])
+        self.assertRaises(ValueError, xcrypt, self.k, Bits(8), iv=self.nonce[:128])
+        self.assertRaises(TypeError, xcrypt, self.k, Bits(8))
+        self.assertRaises(ValueError, decrypt, self.k, Bits(192))
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.block.feal import encrypt_many
+from cryptanalysis.differential.feal import FEAL_4_CHARACTERISTIC, Characteristic, attack, chosen_plaintexts, \
+    right_pairs
+from cryptanalysis.feal import last_round_key, f_effective
+
+
+class TestDifferentialFEAL(unittest.TestCase):
+
+    def test_differential_feal_f_differential_holds_with_probability_one(self):
+        u = np.random.default_rng(0).integers(0, 2 ** 32, size=2 ** 12, dtype=np.uint32)
+        for key in [0x0, 0x12345678, 0xFFFFFFFF]:
+            d = f_effective(u, key) ^ f_effective(u ^ np.uint32(0x80800000), key)
+            self.assertTrue(np.all(d == 0x02000000))
+
+    def test_differential_feal_attack_recovers_last_round_key_of_feal_4(self):
+        for key in [0x0123456789ABCDEF0123456789ABCDEF, 0xDEADBEEF]:
+            c0, c1 = chosen_plaintexts(key, 32, seed=0)
+            candidates = attack(c0, c1)
+            self.assertIn(last_round_key(key), [c.key for c in candidates])
+            self.assertTrue(all(c.count == 32 for c in candidates))
+            self.assertLessEqual(len(candidates), 4)
+
+    def test_differential_feal_attack_does_not_find_key_of_different_cipher(self):
+        c0, c1 = chosen_plaintexts(0x0123456789ABCDEF0123456789ABCDEF, 32, n=8, seed=0)
+        self.assertTrue(all(c.count < 32 for c in attack(c0, c1)))
+        self.assertLessEqual(len(attack(c0, c1)), 64)
+
+    def test_differential_feal_attack_truncates_candidates(self):
+        c0, c1 = chosen_plaintexts(0xDEADBEEF, 1, seed=0)
+        self.assertEqual(len(attack(c0, c1)), 64)
+        self.assertEqual(len(attack(c0, c1, max_candidates=5)), 5)
+
+    def test_differential_feal_attack_with_slack_tolerates_wrong_pairs(self):
+        key = 0x0123456789ABCDEF0123456789ABCDEF
+        c0, c1 = chosen_plaintexts(key, 40, seed=0)
+        # turn the first batch into wrong pairs which favour a wrong guess of the inner key bytes: flipping the same
+        # bits in both halves of c1 keeps the input of the last f-function but changes its output difference
+        wrong = ((last_round_key(key) >> 8) & 0xFFFF) ^ 0x1234
+        z0, z1 = [f_effective(((c >> np.uint64(32)) ^ c).astype(np.uint32)[:8], wrong << 8) for c in (c0, c1)]
+        d = ((c0 ^ c1) >> np.uint64(32)).astype(np.uint32)[:8] ^ np.uint32(0x02000000)
+        flip = ((z0 ^ z1 ^ d) & np.uint32(0x00FFFF00)).astype(np.uint64)
+        c1[:8] ^= (flip << np.uint64(32)) | flip
+        self.assertNotIn(last_round_key(key), [c.key for c in attack(c0, c1, early=8)])
+        candidates = attack(c0, c1, early=8, slack=8)
+        self.assertIn(last_round_key(key), [c.key for c in candidates])
+        self.assertTrue(all(c.count == 32 for c in candidates))
+
+    def test_differential_feal_right_pairs_filters_pairs_by_right_difference(self):
+        p = np.arange(4, dtype=np.uint64)
+        c0, c1 = encrypt_many(0x0, p, 4), encrypt_many(0x0, p ^ np.uint64(0x8080000080800000), 4)
+        d = (c0 ^ c1)[0]
+        right_difference = int(((d >> np.uint64(32)) ^ d) & np.uint64(0xFFFFFFFF))
+        characteristic = Characteristic(0x8080000080800000, 0x02000000, right_difference)
+        self.assertTrue(right_pairs(c0, c1, characteristic)[0])
+        self.assertTrue(np.all(right_pairs(c0, c1, FEAL_4_CHARACTERISTIC)))
+
+    def test_differential_feal_attack_raises_error_on_invalid_input(self):
+        c0, c1 = chosen_plaintexts(0x0, 4, seed=0)
+        with self.assertRaises(ValueError):
+            attack(c0, c1[:-1])
+        with self.assertRaises(ValueError):
+            attack(c0, c1, Characteristic(0x8080000080800000, 0x02000000, 0x1))
+        with self.assertRaises(ValueError):
+            attack(c0, c1, slack=-1)
+        with self.assertRaises(ValueError):
+            attack(c0, c1, max_candidates=0)
@@ -0,0 +1,38 @@
+import unittest
+
+# noinspection PyUnresolvedReferences
+import test.context
+from cryptanalysis.feal import first_round_key
+from cryptanalysis.linear.feal import APPROXIMATIONS, approximation_bias, attack, known_plaintexts
+
+
+class TestLinearFEAL(unittest.TestCase):
+
+    def test_linear_feal_approximations_of_f_hold_with_probability_one(self):
+        for approximation in APPROXIMATIONS:
+            for subkey in [0x0000, 0x1234, 0xFFFF]:
+                self.assertEqual(approximation_bias(approximation, subkey, count=2 ** 12, seed=0), 0.5)
+
+    def test_linear_feal_attack_recovers_first_round_key_of_feal_4(self):
+        key = 0x0123456789ABCDEF0123456789ABCDEF
+        p, c = known_plaintexts(key, 2 ** 12, n=4, seed=0)
+        candidates = attack(p, c, n=4)
+        self.assertIn(first_round_key(key, n=4), [c.key for c in candidates])
+        self.assertTrue(all(c.bias == 0.5 for c in candidates))
+        self.assertLessEqual(len(candidates), 16)
+
+    def test_linear_feal_attack_recovers_first_round_key_of_feal_2(self):
+        key = 0xFEDCBA9876543210FEDCBA9876543210
+        p, c = known_plaintexts(key, 2 ** 12, n=2, seed=0)
+        self.assertIn(first_round_key(key, n=2), [c.key for c in attack(p, c, n=2)])
+
+    def test_linear_feal_attack_does_not_find_key_of_different_cipher(self):
+        p, c = known_plaintexts(0x0123456789ABCDEF0123456789ABCDEF, 2 ** 12, n=8, seed=0)
+        self.assertTrue(all(c.bias < 0.5 for c in attack(p, c, n=4)))
+
+    def test_linear_feal_attack_raises_error_on_invalid_input(self):
+        p, c = known_plaintexts(0x0, 16, n=8, seed=0)
+        with self.assertRaises(ValueError):
+            attack(p, c, n=8)
+        with self.assertRaises(ValueError):
+            attack(p, c[:-1], n=4)
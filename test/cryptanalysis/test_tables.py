@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+# noinspection PyUnresolvedReferences
+import test.context
+from ciphers.block.feal import f_int
+from cryptanalysis.tables import ddt, lat, bct, differential_uniformity, feal_ddt, feal_f_component, feal_sbox, \
+    walsh_spectrum
+
+# substitution box of the toy cipher 1 from the master thesis of C. Bender about differential cryptanalysis.
+# See test/dca/test_dca_master_thesis_claims.py
+BENDER_SBOX = [0x6, 0x4, 0xC, 0x5, 0x0, 0x7, 0x2, 0xE, 0x1, 0xF, 0x3, 0xD, 0x8, 0xA, 0x9, 0xB]
+
+
+def _dot(a, b):
+    return bin(a & b).count('1') % 2
+
+
+class TestTables(unittest.TestCase):
+
+    def test_ddt_matches_counting_of_all_pairs(self):
+        expected = np.zeros((16, 16), dtype=int)
+        for a in range(16):
+            for x in range(16):
+                expected[a, BENDER_SBOX[x] ^ BENDER_SBOX[x ^ a]] += 1
+        self.assertEqual(ddt(BENDER_SBOX).tolist(), expected.tolist())
+        self.assertEqual(differential_uniformity(BENDER_SBOX), expected[1:].max())
+
+    def test_lat_matches_counting_of_all_inputs(self):
+        expected = [[sum(_dot(a, x) == _dot(b, BENDER_SBOX[x]) for x in range(16)) - 8 for b in range(16)]
+                    for a in range(16)]
+        self.assertEqual(lat(BENDER_SBOX).tolist(), expected)
+        self.assertTrue(np.array_equal(walsh_spectrum(BENDER_SBOX), 2 * lat(BENDER_SBOX)))
+
+    def test_bct_matches_definition(self):
+        s = BENDER_SBOX
+        inverse = [s.index(y) for y in range(16)]
+        expected = [[sum(inverse[s[x] ^ b] ^ inverse[s[x ^ a] ^ b] == a for x in range(16)) for b in range(16)]
+                    for a in range(16)]
+        self.assertEqual(bct(s).tolist(), expected)
+
+    def test_bct_raises_error_if_sbox_is_not_a_permutation(self):
+        with self.assertRaises(ValueError):
+            bct([0, 0, 1, 2])
+
+    def test_tables_raise_error_if_sbox_size_is_not_power_of_two(self):
+        with self.assertRaises(ValueError):
+            ddt([0, 1, 2])
+
+    def test_feal_ddt_matches_ddt(self):
+        self.assertTrue(np.array_equal(feal_ddt(1), ddt(feal_sbox(1), m=8)))
+
+    def test_feal_sbox_differential_of_msb_in_both_inputs_holds_with_probability_one(self):
+        # S_i(a ^ 0x80, b ^ 0x80) = S_i(a, b) since the most significant bits cancel in the addition
+        table = feal_ddt(0)
+        self.assertEqual(table.shape, (2 ** 16, 2 ** 8))
+        self.assertEqual(table[0x8080, 0x00], 2 ** 16)
+        # flipping the most significant bit of one input flips bit 1 of the output
+        self.assertEqual(table[0x8000, 0x02], 2 ** 16)
+        self.assertEqual(table[1:].max(), 2 ** 16)
+
+    def test_feal_sbox_with_fixed_input_is_a_permutation(self):
+        s = feal_sbox(1, b=0x42)
+        self.assertEqual(sorted(s.tolist()), list(range(256)))
+        self.assertEqual(ddt(s)[0x80, 0x02], 256)
+
+    def test_feal_f_component_matches_f_function(self):
+        rng = np.random.default_rng(0)
+        for a, b in zip(rng.integers(0, 2 ** 32, size=64).tolist(), rng.integers(0, 2 ** 16, size=64).tolist()):
+            x = (a >> 24) ^ (a >> 16) ^ (b >> 8)
+            y = (a >> 8) ^ a ^ b
+            index = ((x & 0xFF) << 8) | (y & 0xFF)
+            f = f_int(a, b)
+            self.assertEqual(feal_f_component(1)[index], (f >> 16) & 0xFF)
+            self.assertEqual(feal_f_component(2)[index], (f >> 8) & 0xFF)
+
+    def test_feal_tables_raise_error_on_invalid_index(self):
+        with self.assertRaises(ValueError):
+            feal_ddt(2)
+        with self.assertRaises(ValueError):
+            feal_f_component(0)
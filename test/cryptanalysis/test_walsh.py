@@ -0,0 +1,28 @@
+import unittest
+
+import numpy as np
+
+# noinspection PyUnresolvedReferences
+import test.context
+from cryptanalysis.walsh import fwht, parity
+
+
+class TestWalsh(unittest.TestCase):
+
+    def test_fwht_matches_definition(self):
+        a = np.random.default_rng(0).integers(-8, 8, size=32)
+        expected = [sum((-1) ** bin(u & x).count('1') * int(a[x]) for x in range(32)) for u in range(32)]
+        self.assertEqual(fwht(a).tolist(), expected)
+
+    def test_fwht_applied_twice_multiplies_input_by_length(self):
+        a = np.random.default_rng(0).integers(-8, 8, size=(16, 3))
+        self.assertTrue(np.array_equal(fwht(fwht(a)), 16 * a))
+        self.assertTrue(np.array_equal(fwht(a, axis=0)[:, 1], fwht(a[:, 1])))
+
+    def test_fwht_raises_error_if_length_not_power_of_two(self):
+        with self.assertRaises(ValueError):
+            fwht(np.zeros(12))
+
+    def test_parity(self):
+        x = np.array([0b0, 0b1, 0b1011, 0b11, 2 ** 64 - 1, 2 ** 63], dtype=np.uint64)
+        self.assertEqual(parity(x).tolist(), [0, 1, 1, 0, 0, 1])
@@ -0,0 +1,53 @@
+"""Benchmark of the Bits construction of util.bitseq and util.rot against format string parsing and sum().
+
+Run from the repository root with: python -m test.util.benchmark_bitseq
+"""
+import random
+import timeit
+
+from bitstring import Bits
+
+# noinspection PyUnresolvedReferences
+import test.context
+from util.bitseq import bitseq, bitseq_join, littleendian
+from util.rot import rot_left_bits
+
+
+def format_bitseq(*args: int, bit: int) -> Bits:
+    """Construct the bitstring the way util.bitseq did before, by parsing a format string."""
+    return Bits(",".join("uint:{}={}".format(bit, arg) for arg in args))
+
+
+def format_littleendian(b: Bits) -> Bits:
+    """Construct the little-endian bitstring by parsing a format string."""
+    return Bits("uint:{}={}".format(len(b), b.uintle))
+
+
+def bench(name: str, fn, reference, data, number: int = 5) -> None:
+    """Print the time per call of fn and the reference (format string parsing or sum) on the data and the speedup."""
+    fast = min(timeit.repeat(lambda: [fn(*d) for d in data], number=1, repeat=number)) / len(data)
+    slow = min(timeit.repeat(lambda: [reference(*d) for d in data], number=1, repeat=number)) / len(data)
+    print("{:<28} {:>10.2f} us {:>10.2f} us {:>8.1f}x".format(name, fast * 1e6, slow * 1e6, slow / fast))
+
+
+def main() -> None:
+    """Run the benchmarks on random words."""
+    rng = random.Random(0)
+    words = [[rng.randrange(2 ** 32) for _ in range(16)] for _ in range(2000)]
+    bytes_ = [[rng.randrange(2 ** 8) for _ in range(8)] for _ in range(2000)]
+    blocks = [(Bits(uint=rng.randrange(2 ** 64), length=64),) for _ in range(2000)]
+    print("{:<28} {:>13} {:>13} {:>9}".format("", "fast path", "reference", "speedup"))
+    bench("bitseq(1 x 32 bit)", lambda *w: bitseq(w[0], bit=32), lambda *w: format_bitseq(w[0], bit=32), words)
+    bench("bitseq(16 x 32 bit)", lambda *w: bitseq(*w, bit=32), lambda *w: format_bitseq(*w, bit=32), words)
+    bench("bitseq(8 x 8 bit)", lambda *b: bitseq(*b, bit=8), lambda *b: format_bitseq(*b, bit=8), bytes_)
+    bench("littleendian(64 bit)", littleendian, format_littleendian, blocks)
+    bench("rot_left_bits(64 bit, 13)", lambda b: rot_left_bits(b, 13),
+          lambda b: Bits("uint:64={}".format(((b.uint << 13) | (b.uint >> 51)) % 2 ** 64)), blocks)
+
+    for count, repeat in [(4, 2000), (1000, 1), (10000, 1)]:
+        blocks = [Bits(uint=rng.randrange(2 ** 64), length=64) for _ in range(count)]
+        bench("bitseq_join({} x 64 bit)".format(count), bitseq_join, sum, [(blocks,)] * repeat)
+
+
+if __name__ == '__main__':
+    main()
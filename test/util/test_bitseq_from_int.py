@@ -0,0 +1,39 @@
+import random
+
+from bitstring import Bits
+
+# noinspection PyUnresolvedReferences
+import test.context
+from test.helper import BitsTestCase
+from util.bitseq import bitseq, bitseq_from_int, bitseq_from_str
+
+
+class TestBitSeqFromInt(BitsTestCase):
+
+    def test_bitseq_from_int(self):
+        self.assertBit(bitseq_from_int(0x1234, 16), 0x1234, 16)
+        self.assertBit(bitseq_from_int(0x5, 3), 0x5, 3)
+        self.assertBit(bitseq_from_int(0x0, 12), 0x0, 12)
+        self.assertEqual(bitseq_from_int(0, 0), Bits())
+
+    def test_bitseq_from_int_matches_format_string_construction(self):
+        rng = random.Random(0)
+        for bit in [1, 3, 7, 8, 12, 32, 33, 64, 100, 512]:
+            value = rng.randrange(2 ** bit)
+            self.assertEqual(bitseq_from_int(value, bit), Bits("uint:{}={}".format(bit, value)))
+
+    def test_bitseq_matches_format_string_construction(self):
+        rng = random.Random(1)
+        for bit in [3, 8, 13, 32]:
+            values = [rng.randrange(2 ** bit) for _ in range(9)]
+            expected = Bits(",".join("uint:{}={}".format(bit, value) for value in values))
+            self.assertEqual(bitseq(*values, bit=bit), expected)
+            self.assertEqual(bitseq_from_str(*map(hex, values), bit=bit), expected)
+
+    def test_bitseq_from_int_raises_value_error_if_integer_does_not_fit(self):
+        with self.assertRaises(ValueError):
+            bitseq_from_int(0x10, 4)
+        with self.assertRaises(ValueError):
+            bitseq_from_int(-1, 8)
+        with self.assertRaises(ValueError):
+            bitseq(0x1, -1, bit=8)
@@ -0,0 +1,26 @@
+from bitstring import Bits
+
+# noinspection PyUnresolvedReferences
+import test.context
+from test.helper import BitsTestCase
+from util.bitseq import bitseq, bitseq_join
+
+
+class TestBitSeqJoin(BitsTestCase):
+
+    def test_bitseq_join_whole_bytes(self):
+        b = bitseq_join([bitseq(0x12, bit=8), bitseq(0x3456, bit=16), bitseq(0x789a, bit=16)[4:12]])
+        self.assertBit(b, 0x12345689, 32)
+
+    def test_bitseq_join_arbitrary_lengths(self):
+        b = bitseq_join([Bits('0b1'), Bits('0x3'), Bits('0b101'), bitseq(0x12, bit=8)])
+        self.assertBit(b, 0b1001110100010010, 16)
+
+    def test_bitseq_join_matches_sum(self):
+        blocks = [bitseq(i, bit=64) for i in range(100)] + [Bits('0b11')] + [bitseq(i, bit=7) for i in range(10)]
+        self.assertEqual(bitseq_join(blocks), sum(blocks))
+        self.assertEqual(bitseq_join(iter(blocks[:100])), sum(blocks[:100]))
+
+    def test_bitseq_join_empty(self):
+        self.assertEqual(bitseq_join([]), Bits())
+        self.assertEqual(bitseq_join([Bits(), Bits()]), Bits())
@@ -0,0 +1,53 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import unittest
+
+from util.parallel import KeystreamPool, parallel_keystream
+
+
+def counter_blocks(prefix: bytes, first: int, count: int) -> bytes:
+    return b''.join(prefix + i.to_bytes(4, 'little') for i in range(first, first + count))
+
+
+def failing_blocks(first: int, count: int) -> bytes:
+    raise ValueError("counter exhausted.")
+
+
+class TestParallel(unittest.TestCase):
+    def test_parallel_keystream_matches_sequential(self):
+        for workers, count in [(1, 5), (2, 5), (3, 7), (4, 2)]:
+            self.assertEqual(
+                parallel_keystream(counter_blocks, (b'ab',), 10, count, 6, workers),
+                counter_blocks(b'ab', 10, count),
+            )
+
+    def test_parallel_keystream_empty(self):
+        self.assertEqual(parallel_keystream(counter_blocks, (b'ab',), 0, 0, 6, 2), b'')
+
+    def test_parallel_keystream_reraises_worker_errors(self):
+        self.assertRaises(ValueError, parallel_keystream, failing_blocks, (), 0, 4, 6, 2)
+
+    def test_parallel_keystream_raises_value_error_if_no_workers(self):
+        self.assertRaises(ValueError, parallel_keystream, counter_blocks, (b'ab',), 0, 4, 6, 0)
+
+    def test_keystream_pool_reuses_processes_across_calls(self):
+        with KeystreamPool(2) as pool:
+            self.assertEqual(pool.keystream(counter_blocks, (b'ab',), 0, 3, 6), counter_blocks(b'ab', 0, 3))
+            executor = pool._executor
+            # a larger range grows the buffer but keeps the processes
+            self.assertEqual(pool.keystream(counter_blocks, (b'cd',), 3, 9, 6), counter_blocks(b'cd', 3, 9))
+            self.assertEqual(pool.keystream(counter_blocks, (b'ef',), 5, 2, 6), counter_blocks(b'ef', 5, 2))
+            self.assertIs(pool._executor, executor)
+        self.assertIsNone(pool._executor)
+
+    def test_keystream_pool_with_single_worker_runs_in_process(self):
+        with KeystreamPool(1) as pool:
+            self.assertEqual(pool.keystream(counter_blocks, (b'ab',), 0, 3, 6), counter_blocks(b'ab', 0, 3))
+            self.assertIsNone(pool._executor)
+
+    def test_keystream_pool_reraises_worker_errors(self):
+        with KeystreamPool(2) as pool:
+            self.assertRaises(ValueError, pool.keystream, failing_blocks, (), 0, 4, 6)
+
+    def test_keystream_pool_raises_value_error_if_no_workers(self):
+        self.assertRaises(ValueError, KeystreamPool, 0)
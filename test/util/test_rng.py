@@ -0,0 +1,72 @@
+# noinspection PyUnresolvedReferences
+import test.context
+import os
+import unittest
+
+from bitstring import Bits
+
+from ciphers.stream.chacha import chacha_blocks
+from util import rng
+from util.rng import ChaChaRandom
+
+
+class TestRng(unittest.TestCase):
+    def setUp(self):
+        self.seed = bytes(range(32))
+
+    def test_rng_serves_chacha20_keystream_after_first_key(self):
+        stream = chacha_blocks(Bits(bytes=self.seed), Bits(64), 0, 2)
+        self.assertEqual(ChaChaRandom(self.seed, buffer_size=96).randbytes(96), stream[32:])
+
+    def test_rng_erases_key_on_refill(self):
+        generator = ChaChaRandom(self.seed, buffer_size=32)
+        generator.randbytes(32)
+        key = chacha_blocks(Bits(bytes=self.seed), Bits(64), 0, 1)[:32]
+        self.assertEqual(generator.randbytes(32), chacha_blocks(Bits(bytes=key), Bits(64), 0, 1)[32:])
+
+    def test_rng_is_reproducible_across_buffer_boundaries(self):
+        expected = ChaChaRandom(self.seed, buffer_size=64).randbytes(1000)
+        generator = ChaChaRandom(self.seed, buffer_size=64)
+        self.assertEqual(b''.join(generator.randbytes(n) for n in [0, 1, 63, 64, 100, 772]), expected)
+
+    def test_rng_seed_restarts_generator(self):
+        generator = ChaChaRandom(self.seed)
+        first = generator.randbytes(48)
+        generator.seed(self.seed)
+        self.assertEqual(generator.randbytes(48), first)
+
+    def test_rng_randbits(self):
+        generator = ChaChaRandom(self.seed)
+        self.assertEqual(generator.randbits(0), 0)
+        for k in [1, 7, 8, 64, 96, 257]:
+            self.assertLess(generator.randbits(k), 2 ** k)
+        self.assertEqual(ChaChaRandom(self.seed).randbits(64),
+                         int.from_bytes(ChaChaRandom(self.seed).randbytes(8), 'little'))
+
+    def test_rng_unseeded_generators_differ(self):
+        self.assertNotEqual(ChaChaRandom().randbytes(32), ChaChaRandom().randbytes(32))
+        self.assertNotEqual(rng.randbits(96), rng.randbits(96))
+        self.assertEqual(len(rng.randbytes(100)), 100)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "fork is not available")
+    def test_rng_forked_child_is_reseeded(self):
+        rng.randbytes(1)
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write, rng.randbytes(32))
+            os._exit(0)
+        os.waitpid(pid, 0)
+        self.assertNotEqual(os.read(read, 32), rng.randbytes(32))
+        os.close(read)
+        os.close(write)
+
+    def test_rng_raises_value_error_on_invalid_arguments(self):
+        self.assertRaises(ValueError, ChaChaRandom, self.seed[:16])
+        self.assertRaises(ValueError, ChaChaRandom, self.seed, 0)
+        self.assertRaises(ValueError, ChaChaRandom(self.seed).randbytes, -1)
+        self.assertRaises(ValueError, ChaChaRandom(self.seed).randbits, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
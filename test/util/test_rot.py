@@ -2,7 +2,7 @@ import unittest
 
 # noinspection PyUnresolvedReferences
 import test.context
-from util.rot import rot_left, rot_right
+from util.rot import rot_left, rot_right, rot_left32
 
 
 class TestRot(unittest.TestCase):
@@ -19,6 +19,11 @@ class TestRot(unittest.TestCase):
         with self.assertRaises(ValueError):
             rot_left(0b1111, 2, 2)
 
+    def test_rot_left32_matches_rot_left(self):
+        for x in [0x0, 0x1, 0x80000000, 0xdeadbeef, 0xffffffff]:
+            for i in [1, 7, 16, 31]:
+                self.assertEqual(rot_left32(x, i), rot_left(x, i, 32))
+
     def test_rot_right_adds_right_shifted_bits_to_left_side(self):
         # max_bit equal to highest bit with regular wrap-around
         self.assertEqual(rot_right(0b1110, 2, 4), 0b1011)